@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+
+Benchmark suite of the radius functions of wellradpy. Run it from the project
+directory with ``python -m benchmarks`` (see ``python -m benchmarks -h``).
+"""
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import argparse
+import json
+import sys
+from . import suite
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmark the radius functions of wellradpy.')
+    subparsers = parser.add_subparsers(dest='command')
+    parser_run = subparsers.add_parser('run', help='run the benchmarks')
+    parser_run.add_argument('-o', '--output', default='benchmarks.json',
+                            help='JSON output file (default: %(default)s)')
+    parser_run.add_argument('--sizes', type=int, nargs='+',
+                            default=suite.SIZES,
+                            help='array sizes, 0 for scalars '
+                                 '(default: %(default)s)')
+    parser_run.add_argument('--functions', nargs='+',
+                            help='functions to benchmark, e.g. '
+                                 'drawdown.rinfl_absdraw or "import '
+                                 'wellradpy.drawdown" (default: all)')
+    parser_run.add_argument('--repeat', type=int, default=3,
+                            help='timing repetitions (default: %(default)s)')
+    parser_run.add_argument('--min-time', type=float, default=0.2,
+                            help='minimum duration of a repetition in '
+                                 'seconds (default: %(default)s)')
+    parser_compare = subparsers.add_parser(
+        'compare', help='compare two runs and flag regressions')
+    parser_compare.add_argument('old', help='JSON file of the reference run')
+    parser_compare.add_argument('new', help='JSON file of the new run')
+    parser_compare.add_argument('--threshold', type=float, default=0.2,
+                                help='relative slowdown flagged as a '
+                                     'regression (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'compare':
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        comparison = suite.compare(old, new, args.threshold)
+        for function, size, old_time, new_time, ratio, regression in \
+                comparison:
+            if new_time is None:
+                print('%-40s %8d  %10.3e s  %-21s  REGRESSION' % (
+                    function, size, old_time, 'failed or missing'))
+                continue
+            print('%-40s %8d  %10.3e s  %10.3e s  %6.2fx%s' % (
+                function, size, old_time, new_time, ratio,
+                '  REGRESSION' if regression else ''))
+        regressions = sum(1 for c in comparison if c[-1])
+        print('%d regression(s) (slowdowns beyond %g%%, failed or missing '
+              'benchmarks)' % (regressions, 100*args.threshold))
+        return 1 if regressions else 0
+
+    if args.command is None:
+        args = parser.parse_args(['run'])
+    results = suite.run(args.sizes, args.functions, args.repeat,
+                        args.min_time, log=print)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=1)
+    print('Results written to %s' % args.output)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
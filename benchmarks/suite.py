@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import datetime
+import inspect
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+import numpy as np # version 1.16.2
+import scipy # version 1.2.1
+from wellradpy import cache, drawdown, leaky, recovery
+
+# Array sizes benchmarked in addition to scalar inputs (size 0)
+SIZES = [0, 1000, 100000, 1000000]
+
+# Modules whose import time is benchmarked (in a fresh interpreter)
+IMPORTS = ['wellradpy', 'wellradpy.drawdown', 'wellradpy.recovery']
+
+# Ranges of the parameters, sampled log-uniformly (tp is derived from t so
+# that recovery times are after the end of pumping)
+_RANGES = {
+    't': (1e2, 1e6),
+    'T': (1e-4, 1e-2),
+    'S': (1e-5, 1e-1),
+    'Q': (1e-2, 1e-1),
+    'rw': (0.05, 0.3),
+    'delta': (0.4, 0.4),
+    'B': (1e1, 1e4),
+}
+
+# Pumping schedule of the functions of schedules (10 cycles, ending before the
+# smallest time)
+_SCHEDULE = recovery.cyclic_schedule(1e-2, 5., 2., 10)
+
+# Functions of schedules, whose times and rates are those of _SCHEDULE
+_SCHEDULE_FUNCTIONS = ['recovery.rinv_schedule', 'recovery.tmax_schedule',
+                       'recovery.rinvmax_schedule', 'recovery.tend_schedule']
+
+# Functions that are not radius functions, or that return generators (whose
+# call does not compute anything)
+_EXCLUDED = ['recovery.cyclic_schedule', 'recovery.rinv_stream']
+
+def functions():
+    """
+    List the public functions of the drawdown, recovery and leaky modules.
+
+    Returns
+    -------
+    List of (name, function) tuples, e.g. ('drawdown.rinfl_absdraw', func).
+
+    """
+    res = []
+    for module in (drawdown, recovery, leaky):
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            full_name = '%s.%s' % (module.__name__.split('.')[-1], name)
+            if not name.startswith('_') and \
+               func.__module__ == module.__name__ and \
+               full_name not in _EXCLUDED:
+                res.append((full_name, func))
+    return res
+
+def parameters(func, size, seed=0):
+    """
+    Generate random parameters for a function.
+
+    Parameters
+    ----------
+    func: callable
+        Radius function.
+    size: int
+        Number of elements of the parameter arrays (0 for scalars).
+    seed: int, optional
+        Seed of the random number generator.
+
+    Returns
+    -------
+    List of positional parameters (the thresholds keep their defaults).
+
+    """
+    rng = np.random.default_rng(seed)
+    n = max(size, 1)
+    values = {}
+    for param, (low, high) in _RANGES.items():
+        values[param] = np.exp(rng.uniform(np.log(low), np.log(high), n))
+    values['tp'] = values['t'] / rng.uniform(1.05, 20., n)
+    schedule = '%s.%s' % (func.__module__.split('.')[-1], func.__name__) \
+               in _SCHEDULE_FUNCTIONS
+    res = []
+    for param in inspect.signature(func).parameters.values():
+        if param.default is not param.empty:
+            break
+        if schedule and param.name in ('times', 'rates'):
+            res.append(_SCHEDULE[param.name == 'rates'])
+            continue
+        res.append(values[param.name] if size > 0 else
+                   float(values[param.name][0]))
+    return res
+
+def measure(func, args, repeat=3, min_time=0.2):
+    """
+    Measure the run time and peak memory of a function call.
+
+    Parameters
+    ----------
+    func: callable
+        Function.
+    args: list
+        Positional parameters.
+    repeat: int, optional
+        Number of timing repetitions (the best one is kept).
+    min_time: float, optional
+        Minimum duration of each repetition, in seconds.
+
+    Returns
+    -------
+    Time per call in seconds, and peak memory allocated during a call in
+    bytes.
+
+    """
+    timer = timeit.Timer(lambda: func(*args))
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1000000:
+            break
+        number = max(number*2, int(number * 1.2*min_time/max(elapsed, 1e-9)))
+    best = min([elapsed] + timer.repeat(repeat - 1, number)) / number
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+_IMPORT_SCRIPT = '''
+import sys, time, tracemalloc
+if sys.argv[2] == '1':
+    tracemalloc.start()
+start = time.perf_counter()
+import %s
+elapsed = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+print(elapsed, peak, int('scipy' in sys.modules))
+'''
+
+def import_time(module, repeat=5):
+    """
+    Measure the import time of a module in a fresh interpreter.
+
+    Parameters
+    ----------
+    module: str
+        Name of the module, e.g. 'wellradpy.drawdown'.
+    repeat: int, optional
+        Number of timing repetitions (the best one is kept).
+
+    Returns
+    -------
+    Import time in seconds, peak memory allocated during the import in
+    bytes, and whether SciPy was imported.
+
+    """
+    def measure_once(trace):
+        output = subprocess.check_output(
+            [sys.executable, '-c', _IMPORT_SCRIPT % module, module,
+             '1' if trace else '0'], universal_newlines=True)
+        elapsed, peak, scipy_imported = output.split()
+        return float(elapsed), int(peak), bool(int(scipy_imported))
+    best = min(measure_once(False)[0] for i in range(repeat))
+    _, peak, scipy_imported = measure_once(True)
+    return best, peak, scipy_imported
+
+def run(sizes=None, names=None, repeat=3, min_time=0.2, log=None):
+    """
+    Run the benchmarks.
+
+    Parameters
+    ----------
+    sizes: list of int, optional
+        Array sizes (0 for scalars; SIZES by default).
+    names: list of str, optional
+        Names of the functions to benchmark, e.g. 'drawdown.rinfl_absdraw'
+        (all the public functions by default).
+    repeat: int, optional
+        Number of timing repetitions.
+    min_time: float, optional
+        Minimum duration of each repetition, in seconds.
+    log: callable, optional
+        Function called with a line of text after each benchmark.
+
+    Returns
+    -------
+    Dictionary with the metadata of the run and the list of results, ready
+    to be written as JSON.
+
+    Notes
+    -----
+    The caches of the memoized functions are disabled during the run (and
+    restored to their sizes afterwards), so that repeated scalar calls
+    measure the actual computation. The tables built on first use are built
+    before timing.
+
+    The import times of the modules of IMPORTS are benchmarked as well,
+    under the names 'import <module>' with size 0 (they are selected with
+    names like the functions).
+
+    """
+    if sizes is None:
+        sizes = SIZES
+    results = []
+    for module in IMPORTS:
+        name = 'import %s' % module
+        if names is not None and name not in names:
+            continue
+        result = {'function': name, 'size': 0, 'time': None,
+                  'time_per_element': None, 'peak_memory': None,
+                  'scipy_imported': None, 'error': None}
+        try:
+            time, peak, scipy_imported = import_time(module, repeat)
+            result['time'] = result['time_per_element'] = time
+            result['peak_memory'] = peak
+            result['scipy_imported'] = scipy_imported
+        except Exception as e:
+            result['error'] = '%s: %s' % (type(e).__name__, e)
+        results.append(result)
+        if log is not None:
+            log(_format(result))
+    # Sizes of the caches, restored after the run
+    maxsizes = dict((name, info.maxsize)
+                    for name, info in cache.cache_info().items())
+    cache.set_cache_size(0)
+    try:
+        for name, func in functions():
+            if names is not None and name not in names:
+                continue
+            for size in sizes:
+                result = {'function': name, 'size': size, 'time': None,
+                          'time_per_element': None, 'peak_memory': None,
+                          'error': None}
+                try:
+                    args = parameters(func, size)
+                    with np.errstate(all='ignore'):
+                        func(*args)
+                        time, peak = measure(func, args, repeat, min_time)
+                    result['time'] = time
+                    result['time_per_element'] = time / max(size, 1)
+                    result['peak_memory'] = peak
+                except Exception as e:
+                    result['error'] = '%s: %s' % (type(e).__name__, e)
+                results.append(result)
+                if log is not None:
+                    log(_format(result))
+    finally:
+        for name, maxsize in maxsizes.items():
+            cache.set_cache_size(maxsize, name)
+    metadata = {
+        'date': datetime.datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+    }
+    return {'metadata': metadata, 'results': results}
+
+def _format(result):
+    if result['error'] is not None:
+        return '%-40s %8d  %s' % (result['function'], result['size'],
+                                  result['error'])
+    return '%-40s %8d  %10.3e s  %10.3e s/elem  %10d B%s' % (
+        result['function'], result['size'], result['time'],
+        result['time_per_element'], result['peak_memory'],
+        '  (imports scipy)' if result.get('scipy_imported') else '')
+
+def compare(old, new, threshold=0.2):
+    """
+    Compare two benchmark runs.
+
+    Parameters
+    ----------
+    old, new: dict
+        Results of run (e.g. loaded from JSON).
+    threshold: float, optional
+        Relative increase of the run time beyond which a benchmark is flagged
+        as a regression.
+
+    Returns
+    -------
+    List of (function, size, old time, new time, ratio, regression) tuples,
+    for the benchmarks of the old run without errors. Those that fail or are
+    missing in the new run are regressions, with None as new time and ratio.
+
+    """
+    old_times = dict(((r['function'], r['size']), r['time'])
+                     for r in old['results'] if r['error'] is None)
+    new_times = dict(((r['function'], r['size']), r['time'])
+                     for r in new['results'] if r['error'] is None)
+    res = []
+    for r in old['results']:
+        key = (r['function'], r['size'])
+        if key not in old_times:
+            continue
+        if key not in new_times:
+            res.append(key + (old_times[key], None, None, True))
+            continue
+        ratio = new_times[key] / old_times[key]
+        res.append(key + (old_times[key], new_times[key], ratio,
+                          ratio > 1 + threshold))
+    return res
@@ -36,9 +36,7 @@ tend = re.tend(T, Q, tp, sc)
 # pumping)
 Nt = 1000
 t = np.linspace(1.0001*tp, tp+0.99999*(tend-tp), Nt)
-rinv = np.full(t.shape, np.nan)
-for i, ti in enumerate(t):
-    rinv[i] = re.rinv(ti, T, S, Q, tp, sc)
+rinv = re.rinv(t, T, S, Q, tp, sc)
 
 # Plot
 fig, ax = plt.subplots(1,1)
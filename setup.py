@@ -20,14 +20,17 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/etiennebresciani/wellradpy",
     keywords="groundwater wells hydraulics",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=["benchmarks"]),
     classifiers=[
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
+    python_requires=">=3.8",
     install_requires=[
         "numpy",
         "scipy>=1.2.0"],
+    entry_points={
+        "console_scripts": ["wellradpy = wellradpy.cli:main"],
+    },
 )
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy import cache
+from wellradpy import utils
+
+name = 'wellradpy.drawdown._Finv'
+cache.cache_clear(name)
+
+# Repeated calls with the same threshold only solve once
+res = [dr.rinfl_relvol(t, 10., 1.e-4, 0.01) for t in [1., 2., 3.]]
+info = cache.cache_info(name)
+
+# The cached coefficient gives the same result as a fresh solve
+cache.set_cache_size(0, name)
+ref = [dr.rinfl_relvol(t, 10., 1.e-4, 0.01) for t in [1., 2., 3.]]
+cache.set_cache_size(128, name)
+
+# Array keyword arguments are passed through, and scalar ones (including
+# zero-dimensional arrays) are looked up in the cache
+x = np.array([0.1, 1.])
+by_keyword = utils.E1inv(x=x)
+scalar_keyword = [utils.E1inv(x=np.array(x_i)) for x_i in x]
+
+if info.hits==2 and info.misses==1 and np.array_equal(res, ref) and \
+   np.array_equal(by_keyword, utils.E1inv(x)) and \
+   np.array_equal(scalar_keyword, by_keyword):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import os
+import tempfile
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy import chunked
+
+T = np.logspace(-4, -2, 30)[:,None,None]
+S = np.logspace(-5, -2, 20)[:,None]
+t = np.logspace(2, 6, 50)
+rw = 0.1
+
+directory = tempfile.mkdtemp()
+np.save(os.path.join(directory, 'T.npy'), T)
+np.save(os.path.join(directory, 't.npy'), t)
+
+# Array with chunk metadata (like a dask array), recording the reads
+class ChunkedArray(object):
+    def __init__(self, array, chunks):
+        self.array = array
+        self.shape = array.shape
+        self.chunks = chunks
+        self.reads = []
+    def __getitem__(self, index):
+        self.reads.append(index)
+        return self.array[index]
+    def __array__(self, dtype=None):
+        return np.asarray(self.array, dtype=dtype)
+S_chunked = ChunkedArray(S, ((7, 7, 6), (1,)))
+
+# Memory-mapped inputs and output, with a memory limit that requires many
+# blocks
+done = []
+out = chunked.evaluate('rinv_reldrawave',
+                       {'t': np.load(os.path.join(directory, 't.npy'),
+                                     mmap_mode='r'),
+                        'T': np.load(os.path.join(directory, 'T.npy'),
+                                     mmap_mode='r'),
+                        'S': S_chunked, 'rw': rw},
+                       out=os.path.join(directory, 'rinv.npy'), memory=2**20,
+                       progress=lambda n, total: done.append(n))
+del out
+res = np.load(os.path.join(directory, 'rinv.npy'))
+expected = dr.rinv_reldrawave(t, T, S, rw)
+
+# The blocks never span two chunks of S
+spans = set((index[0].start < 7 < index[0].stop) or
+            (index[0].start < 14 < index[0].stop)
+            for index in S_chunked.reads)
+
+# The blocks are generated one at a time, so that the first one of a huge
+# array is available at once
+first = next(chunked.blocks((2*10**9, 3), 4096))
+
+if np.array_equal(res, expected) and len(done) > 1 and \
+   done[-1] == res.size and spans == set([False]) and \
+   first == (slice(0, 1365), slice(0, 3)):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
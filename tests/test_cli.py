@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import io
+import os
+import sys
+import tempfile
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy import cli
+
+t = np.logspace(2, 5, 25)
+T, S, Q = 1.e-3, 1.e-4, 0.01
+
+directory = tempfile.mkdtemp()
+input_file = os.path.join(directory, 'wells.csv')
+output_file = os.path.join(directory, 'radii.npy')
+with open(input_file, 'w') as f:
+    f.write('well,t,T,S,Q\n')
+    for i, ti in enumerate(t):
+        if i == 3:
+            f.write('w3,unknown,%g,%g,%g\n' % (T, S, Q))
+        else:
+            f.write('w%d,%.17g,%g,%g,%g\n' % (i, ti, T, S, Q))
+
+# Small chunks, with a row that cannot be parsed: the run goes on and the
+# row is reported (exit status 2) with NaN results
+status = cli.main([input_file, '-c', 'rinfl_absdraw', 'rinfl_jones',
+                   '-o', output_file, '--chunk-size', '10',
+                   '--max-messages', '0'])
+res = np.load(output_file)
+expected = dr.rinfl_absdraw(t, T, S, Q)
+valid = np.arange(t.size) != 3
+
+# Two criteria failing on the same row count as one failed row, and the CSV
+# output file is closed
+sc_file = os.path.join(directory, 'sc.csv')
+csv_file = os.path.join(directory, 'radii.csv')
+with open(sc_file, 'w') as f:
+    f.write('t,T,S,Q,sc\n100,%g,%g,%g,0.05\n100,%g,%g,%g,-1\n'
+            % (T, S, Q, T, S, Q))
+stderr = sys.stderr
+sys.stderr = io.StringIO()
+try:
+    sc_status = cli.main([sc_file, '-c', 'rinfl_absdraw', 'rinv_absdrawdiff',
+                          '-o', csv_file])
+    summary = sys.stderr.getvalue().splitlines()[-1]
+finally:
+    sys.stderr = stderr
+with open(csv_file) as f:
+    csv_rows = f.read().splitlines()
+
+# Chunks whose vectorized evaluation fails are bisected down to the rows
+# that raise, and rows giving NaN for finite parameters are failures too
+sizes = []
+def fragile(t):
+    sizes.append(np.size(t))
+    if np.any(np.asarray(t) < 0):
+        raise RuntimeError('negative time')
+    return np.sqrt(t)
+chunk, errors = cli.evaluate_chunk({'r': fragile},
+                                   {'t': np.array([1., -1., 4., 9.])})
+def undefined(t):
+    return np.where(t > 2., np.sqrt(t), np.nan)
+nan_chunk, nan_errors = cli.evaluate_chunk(
+    {'r': undefined}, {'t': np.array([1., np.nan, 4.])})
+
+if status == 2 and res.shape == t.shape and \
+   np.allclose(res['rinfl_absdraw'][valid], expected[valid]) and \
+   np.isnan(res['rinfl_jones'][3]) and \
+   sc_status == 2 and len(csv_rows) == 3 and \
+   summary.endswith('2 row(s) processed, 1 failed row(s)') and \
+   np.array_equal(chunk['r'], [1., np.nan, 2., 3.], equal_nan=True) and \
+   [error[:2] for error in errors] == [(1, 'r')] and \
+   sizes == [4, 2, 1, 1, 2] and \
+   [error[:2] for error in nan_errors] == [(0, 'r')]:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy.criteria import CRITERIA, evaluate
+
+t = np.logspace(0, 5, 20)
+T = 10.
+S = 1.e-4
+params = {'Q': 30., 'rw': 0.15, 'delta': 0.4}
+thresholds = {'rinfl_absdraw': {'sc': 0.1}, 'rinv_reldrawave': {'alpha': 0.05}}
+
+# The batch evaluation gives the same radii as the drawdown functions
+res = evaluate(t, T, S, thresholds=thresholds, **params)
+passed = True
+for name, criterion in CRITERIA.items():
+    ref = getattr(dr, name)(t, T, S,
+                            *[params[param] for param in criterion.params],
+                            **thresholds.get(name, {}))
+    passed = passed and np.array_equal(res[name], ref, equal_nan=True)
+columns = [res[name] for name in CRITERIA if name.startswith('rinv_')]
+passed = passed and np.array_equal(res['rinv_max'], np.nanmax(columns, axis=0))
+
+# Array thresholds are supported (they are not shared between criteria)
+sc = np.linspace(0.05, 0.5, t.size)
+alpha = np.linspace(0.01, 0.1, t.size)
+res = evaluate(t, T, S, Q=params['Q'], rw=params['rw'],
+               criteria=['rinfl_absdraw', 'rinfl_reldraw'],
+               thresholds={'rinfl_absdraw': {'sc': sc},
+                           'rinfl_reldraw': {'alpha': alpha}})
+passed = passed and \
+    np.allclose(res['rinfl_absdraw'],
+                dr.rinfl_absdraw(t, T, S, params['Q'], sc),
+                rtol=1e-10, equal_nan=True) and \
+    np.array_equal(res['rinfl_reldraw'],
+                   dr.rinfl_reldraw(t, T, S, params['rw'], alpha))
+
+if passed:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import numpy as np # version 1.16.2
+import wellradpy
+from wellradpy import diskcache
+
+directory = tempfile.mkdtemp()
+diskcache.set_directory(directory)
+
+# The tables generated by warmup are stored in the cache
+wellradpy.warmup(['fast'])
+stored = glob.glob(os.path.join(directory, wellradpy.__version__, '*.npy'))
+
+# Another process loads them, memory-mapped, and gets the same radii
+script = '''
+import numpy as np
+from wellradpy import drawdown as dr
+from wellradpy.precision import precision
+with precision('fast'):
+    r = dr.rinv_reldrawave(np.logspace(2, 6, 5), 1e-3, 1e-4, 0.1)
+print(type(dr._K_table(0.25)[1]).__name__, repr(r.tolist()))
+'''
+env = dict(os.environ, WELLRADPY_CACHE_DIR=directory,
+           PYTHONPATH=os.pathsep.join([os.path.dirname(os.path.dirname(
+               wellradpy.__file__))] + sys.path))
+def run():
+    return subprocess.check_output([sys.executable, '-c', script],
+                                   env=env).decode().split(' ', 1)
+kind, radii = run()
+
+# A table whose key does not match (e.g. generated by another version of the
+# package) is regenerated
+meta = glob.glob(os.path.join(directory, wellradpy.__version__,
+                              'wellradpy.drawdown._K_table-*.json'))[0]
+with open(meta, 'w') as f:
+    f.write('{"description": "other", "count": 2, "single": false}')
+kind_regenerated, radii_regenerated = run()
+with open(meta) as f:
+    restored = 'other' not in f.read()
+
+# Clearing the cache deletes the tables, but not the other files of the
+# directory
+others = [os.path.join(directory, 'notes.txt'),
+          os.path.join(directory, wellradpy.__version__, 'data.npy')]
+for other in others:
+    open(other, 'w').close()
+diskcache.clear()
+cleared = not glob.glob(os.path.join(directory, '*', 'wellradpy.*')) and \
+          all(os.path.exists(other) for other in others)
+
+if len(stored) >= 8 and kind == 'memmap' and \
+   radii_regenerated == radii and kind_regenerated == 'memmap' and \
+   restored and cleared:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
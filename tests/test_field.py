@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy import field as fd
+from wellradpy.utils import E1
+
+t, T, S, Q = 1.e5, 1.e-3, 1.e-4, 0.01
+
+# Superposition of two wells, with small blocks
+x = np.array([10., 100., 1000.])
+y = np.array([-30., 0.])
+s = fd.drawdown_field(x, y, t, T, S, [0., 50.], [0., 0.], [Q, Q/2],
+                      max_elements=4)
+r1 = np.hypot(x, y[:,None])
+r2 = np.hypot(x - 50., y[:,None])
+expected = (Q*E1(r1**2*S/(4*T*t)) + Q/2*E1(r2**2*S/(4*T*t))) / (4*np.pi*T)
+
+# For a single well, the radius of the area where the drawdown exceeds sc
+# is the radius of influence of drawdown.rinfl_absdraw
+R = dr.rinfl_absdraw(t, T, S, Q)
+x = np.linspace(-1.5*R, 1.5*R, 301)
+y = np.linspace(-1.4*R, 1.6*R, 311)
+R_field = fd.rinfl_absdraw(x, y, t, T, S, 0.3, 0.1, Q)
+
+if np.allclose(s, expected, rtol=1e-10) and abs(R_field/R - 1) < 1e-4:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import inspect
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy import recovery as re
+from wellradpy import gradients
+from wellradpy.precision import precision
+
+params = {'t': np.logspace(4, 6, 5), 'T': 1.e-3, 'S': 1.e-4, 'Q': 0.01,
+          'rw': 0.1, 'delta': 0.4, 'tp': 5.e3}
+functions = [dr.rinfl_absdraw, dr.rinfl_reldraw, dr.rinfl_relvol,
+             dr.rinfl_jones, dr.rinv_absdrawderivdiff, dr.rinv_reldrawdiff,
+             dr.rinv_reldrawave, dr.rinv_reldrawderivave,
+             dr.rinv_propbarrierregime_log, re.rinv, re.tmax, re.rinvmax,
+             re.tend]
+
+# Derivatives against central finite differences, relative to value/param
+errors = []
+with precision('reference'):
+    for func in functions:
+        kwargs = dict((name, params.get(name, param.default)) for name, param
+                      in inspect.signature(func).parameters.items())
+        value, derivatives = gradients.gradient(func, **kwargs)
+        for name, x in kwargs.items():
+            h = 1e-5*x
+            plus = dict(kwargs, **{name: x+h})
+            minus = dict(kwargs, **{name: x-h})
+            fd = (func(**plus) - func(**minus)) / (2*h)
+            # (after the end of a recovery test, the radius and its
+            # derivatives are 0)
+            positive = np.broadcast_to(value, np.shape(fd)) > 0
+            with np.errstate(invalid='ignore'):
+                error = np.abs(derivatives[name] - fd) * x / np.abs(value)
+            errors.append(np.max(error[positive]))
+
+# Jacobian and tuples of characteristics
+value, J, names = gradients.jacobian(dr.rinfl_absdraw, params['t'], 1e-3,
+                                     1e-4, 0.01)
+values, derivatives = gradients.gradient(re.characteristics, 1e-3, 1e-4,
+                                         0.01, 5e3)
+_, d_rinvmax = gradients.gradient(re.rinvmax, 1e-3, 1e-4, 0.01, 5e3)
+
+if max(errors) < 1e-5 and J.shape == (5, 5) and \
+   names == ['t', 'T', 'S', 'Q', 'sc'] and \
+   derivatives[1] == d_rinvmax:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import subprocess
+import sys
+
+# The closed-form criteria do not import SciPy, and the submodules are
+# available as attributes of the package
+script = '''
+import sys
+import wellradpy
+dr = wellradpy.drawdown
+dr.rinfl_jones(1e3, 1e-3, 1e-4)
+dr.rinv_closedres(1e3, 1e-3, 1e-4)
+dr.rinv_propbarrierregime_lin(1e3, 1e-3, 1e-4)
+print(int('scipy' in sys.modules))
+wellradpy.recovery.tmax(1e-3, 1e-2, 1800.)
+print(int('scipy' in sys.modules))
+'''
+output = subprocess.check_output([sys.executable, '-c', script],
+                                 universal_newlines=True).split()
+if output == ['0', '1']:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+import scipy.special as spe # version 1.2.1
+from scipy.integrate import quad # version 1.2.1
+from wellradpy import drawdown as dr
+from wellradpy import leaky as le
+from wellradpy.utils import E1, hantush
+
+T = 1.e-3
+S = 1.e-4
+Q = 0.01
+rw = 0.1
+B = 300.
+sc = 0.05
+
+# Leaky well function against its definition, in the series and table
+# regions and on both sides of the symmetry u = beta**2/(4*u)
+u = np.array([1e-6, 1e-3, 0.05, 0.5, 2., 5., 20., 0.01, 1.])
+beta = np.array([1e-3, 0.05, 0.5, 1., 3., 8., 30., 2., 6.])
+expected = np.array([quad(lambda y: np.exp(-y - b**2/(4*y))/y, x, np.inf,
+                          epsabs=0, epsrel=1e-13, limit=200)[0]
+                     for x, b in zip(u, beta)])
+W = hantush(u, beta)
+limits = [hantush(0., 2.)/(2*spe.k0(2.)) - 1,
+          hantush(0.5, 0.)/E1(0.5) - 1]
+
+# Radii satisfying their equations
+t = np.logspace(2, 7, 20)
+r_absdraw = le.rinfl_absdraw(t, T, S, Q, B, sc)
+s_absdraw = Q/(4*np.pi*T) * hantush(r_absdraw**2*S/(4*T*t), r_absdraw/B)
+r_reldraw = le.rinfl_reldraw(t, T, S, rw, B)
+ratio = hantush(r_reldraw**2*S/(4*T*t), r_reldraw/B) / \
+        hantush(rw**2*S/(4*T*t), rw/B)
+r_absdrawdiff = le.rinv_absdrawdiff(t, T, S, Q, B, sc)
+s_absdrawdiff = Q/(4*np.pi*T) * hantush(r_absdrawdiff**2*S/(T*t),
+                                        2*r_absdrawdiff/B)
+
+# Without leakage (large B), the radius is the one of a confined aquifer
+confined = le.rinfl_absdraw(t, T, S, Q, 1e9, sc) / \
+           dr.rinfl_absdraw(t, T, S, Q, sc) - 1
+
+if np.allclose(W, expected, rtol=1e-8, atol=0) and \
+   np.all(np.abs(limits) < 1e-12) and \
+   np.allclose(s_absdraw, sc, rtol=1e-8) and \
+   np.allclose(ratio, 0.01, rtol=1e-8) and \
+   np.allclose(s_absdrawdiff, sc, rtol=1e-8) and \
+   np.all(np.abs(confined) < 1e-6):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import pickle
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy.plans import RadiusPlan, time_to_radius
+
+t = np.logspace(1, 6, 50)
+T = 1.e-3
+S = 1.e-4
+Q = 1.e-2
+rw = 0.1
+
+# Plans (sent through pickle) give the same radii as the drawdown functions
+rtol = 1e-6
+diff = []
+for criterion, args, thresholds in [('rinfl_absdraw', (Q,), {'sc': 0.05}),
+                                    ('rinfl_relvol', (), {'alpha': 0.01}),
+                                    ('rinv_reldrawave', (rw,), {}),
+                                    ('rinv_reldrawderivave', (rw,), {})]:
+    plan = pickle.loads(pickle.dumps(RadiusPlan(criterion, **thresholds)))
+    ref = getattr(dr, criterion)(t, T, S, *args, **thresholds)
+    diff.append(plan(t, T, S, *args)/ref - 1)
+    # The time needed to reach the radii is the time they were calculated at
+    diff.append(time_to_radius(criterion, ref, T, S, *args, **thresholds)/t
+                - 1)
+
+# Parameters other than Q and rw are given to the plan, and required
+plan = RadiusPlan('rinv_absdrawderivdiff', delta=0.4)
+diff.append(plan(t, T, S, Q)/dr.rinv_absdrawderivdiff(t, T, S, Q, 0.4) - 1)
+try:
+    RadiusPlan('rinv_absdrawderivdiff')
+    required = False
+except ValueError as e:
+    required = 'delta' in str(e)
+
+if required and not np.any(np.abs(diff) > rtol):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
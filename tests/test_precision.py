@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy.precision import precision, get_precision, with_error
+
+t = np.logspace(0, 5, 100)
+
+# The estimated errors cover the differences with the reference mode
+passed = True
+for func, args in [(dr.rinfl_absdraw, (t, 10., 1.e-4, 0.01)),
+                   (dr.rinv_reldrawave, (t, 10., 1.e-4, 0.15)),
+                   (dr.rinfl_relvol, (t, 10., 1.e-4))]:
+    with precision('reference'):
+        reference = func(*args)
+    for mode in ('fast', 'default'):
+        with precision(mode):
+            value, error = with_error(func, *args)
+        passed &= np.all(np.abs(value - reference) <= error)
+
+# The setting only applies within the with block
+with precision('fast') as fast:
+    inner = get_precision()
+if passed and inner == fast and fast.rtol == 1e-5 and \
+   get_precision().rtol == 1e-10:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
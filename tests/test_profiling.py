@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import threading
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy import profiling
+
+t = np.logspace(0, 5, 100)
+
+with profiling.profile() as prof:
+    dr.rinfl_relvol(t, 10., 1.e-4, 0.0123)
+    dr.rinfl_reldraw(t, 10., 1.e-4, 0.15)
+summary = prof.summary()
+
+# Calls are attributed to the criteria, with the solver iterations, and
+# nothing is recorded once profiling is disabled
+relvol = summary['drawdown.rinfl_relvol']
+reldraw = summary['drawdown.rinfl_reldraw']
+dr.rinfl_jones(t, 10., 1.e-4)
+
+# Profile blocks overlapping in different threads record their own calls
+barrier = threading.Barrier(2)
+profilers = {}
+def run(name):
+    with profiling.profile() as prof_thread:
+        barrier.wait()
+        getattr(dr, name)(t, 10., 1.e-4)
+        barrier.wait()
+    profilers[name] = list(prof_thread.summary())
+threads = [threading.Thread(target=run, args=(name,))
+           for name in ('rinfl_jones', 'rinv_consthead')]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+if profilers == {'rinfl_jones': ['drawdown.rinfl_jones'],
+                 'rinv_consthead': ['drawdown.rinv_consthead']} and \
+   profiling._active.get() is None and \
+   relvol['solvers.bracket_root'].iterations > 0 and \
+   reldraw['solvers.halley'].elements == t.size and \
+   reldraw['drawdown.rinfl_reldraw'].calls == 1 and \
+   sum(c.failures for c in prof.totals().values()) == 0 and \
+   'drawdown.rinfl_jones' not in prof.summary():
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
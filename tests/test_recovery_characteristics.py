@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import recovery as re
+
+T = np.logspace(-4, -1, 30)
+S = 1.e-4
+Q = 0.01
+tp = 1800.
+sc = 0.05
+
+# Arrays give the same results as scalars, the combined call gives the same
+# results as the separate ones, and rinv at tmax is rinvmax
+tmax, rinvmax, tend = re.characteristics(T, S, Q, tp, sc)
+tmax_loop = np.array([re.tmax(T_i, Q, tp, sc) for T_i in T])
+rinvmax_loop = np.array([re.rinvmax(T_i, S, Q, tp, sc) for T_i in T])
+tend_loop = np.array([re.tend(T_i, Q, tp, sc) for T_i in T])
+rinv_at_tmax = re.rinv(tmax, T, S, Q, tp, sc)
+
+# Nonpositive apparent resolutions give NaN for all the characteristics
+nonpositive = re.characteristics(T[0], S, Q, tp, np.array([-0.05, 0.]))
+
+if np.array_equal(tmax, tmax_loop) and \
+   np.array_equal(rinvmax, rinvmax_loop) and \
+   np.array_equal(tend, tend_loop) and \
+   np.allclose(rinv_at_tmax, rinvmax, rtol=1e-6) and \
+   np.all((tp < tmax) & (tmax < tend)) and \
+   np.all(np.isnan(nonpositive)) and np.isnan(re.tend(T[0], Q, tp, -0.05)):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -13,14 +13,16 @@ from recovery_ex import * # Execute the script and retrieve all the variables
 # Load references results
 reference_res = np.load('recovery_ex_results.npz')
 
-# Calculate the difference
+# Calculate the relative difference (tolerance accounts for the fact that
+# the reference results were obtained with solvers of tolerance 1e-5)
+rtol = 1e-4
 diff = np.empty(0)
-diff = np.append(diff, rinvmax - reference_res['rinvmax'])
-diff = np.append(diff, tmax - reference_res['tmax'])
-diff = np.append(diff, tend - reference_res['tend'])
-diff = np.append(diff, rinv[0] - reference_res['rinvfirst'])
+diff = np.append(diff, (rinvmax - reference_res['rinvmax'])/reference_res['rinvmax'])
+diff = np.append(diff, (tmax - reference_res['tmax'])/reference_res['tmax'])
+diff = np.append(diff, (tend - reference_res['tend'])/reference_res['tend'])
+diff = np.append(diff, (rinv[0] - reference_res['rinvfirst'])/reference_res['rinvfirst'])
 
-error_indices = np.nonzero(diff)[0]
+error_indices = np.nonzero(np.abs(diff) > rtol)[0]
 if error_indices.size==0:
     print('Test passed successfully')
 else:
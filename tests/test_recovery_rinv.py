@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import recovery as re
+
+T = 1.e-3
+S = 1.e-4
+Q = 0.01
+tp = 1800.
+t = 2*tp
+
+# Nonpositive apparent resolutions give NaN, without affecting the other
+# elements
+sc = np.array([-1., 0., 0.05])
+rinv = re.rinv(t, T, S, Q, tp, sc)
+
+if np.all(np.isnan(rinv[:2])) and rinv[2] == re.rinv(t, T, S, Q, tp, 0.05) \
+   and np.isnan(re.rinv(100., T, S, Q, 50., -1.)):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
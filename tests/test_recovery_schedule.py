@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import recovery as re
+from wellradpy.utils import E1
+
+T = 1.e-3
+S = 1.e-4
+Q = 0.01
+tp = 1800.
+sc = 0.05
+
+# A single pumping step gives the same results as the constant-rate functions
+t = tp * np.linspace(1.01, 3., 20)
+rinv_single = re.rinv_schedule(t, T, S, [0., tp], [Q], sc)
+single = np.append(rinv_single/re.rinv(t, T, S, Q, tp, sc) - 1,
+                   [re.tmax_schedule(T, [0., tp], [Q], sc) /
+                    re.tmax(T, Q, tp, sc) - 1,
+                    re.rinvmax_schedule(T, S, [0., tp], [Q], sc) /
+                    re.rinvmax(T, S, Q, tp, sc) - 1,
+                    re.tend_schedule(T, [0., tp], [Q], sc) /
+                    re.tend(T, Q, tp, sc) - 1])
+
+# For a cyclic test, the drawdown superposed from all the rate changes is
+# equal to sc at the radius of investigation, which is maximum at tmax
+times, rates = re.cyclic_schedule(Q, tp, tp/2, 5)
+t = np.linspace(tp/10, 2*times[-1], 50)
+rinv = re.rinv_schedule(t, T, S, times, rates, sc)
+dQ = np.diff(np.concatenate(([0.], rates, [0.])))
+tau = t[:,None] - times
+with np.errstate(divide='ignore', invalid='ignore'):
+    u = np.where(tau > 0, rinv[:,None]**2*S/(T*tau), np.inf)
+drawdown = np.dot(E1(u), dQ) / (4*np.pi*T)
+tmax = re.tmax_schedule(T, times, rates, sc)
+rinvmax = re.rinvmax_schedule(T, S, times, rates, sc)
+rinv_around = re.rinv_schedule(tmax*np.array([0.99, 1.01]), T, S, times,
+                               rates, sc)
+tend = re.tend_schedule(T, times, rates, sc)
+
+if np.all(np.abs(single) < 1e-6) and \
+   np.allclose(drawdown[rinv > 0], sc, rtol=1e-8) and \
+   np.all(rinv_around < rinvmax) and \
+   times[-1] < tmax < tend and \
+   re.rinv_schedule(tend*1.001, T, S, times, rates, sc) == 0:
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
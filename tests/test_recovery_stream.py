@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import recovery as re
+
+T = 1.e-3
+S = 1.e-4
+Q = 0.01
+tp = 1800.
+tend = re.tend(T, Q, tp)
+
+# Irregular times arriving one by one, until after the end of the test
+t = np.sort(np.random.default_rng(0).uniform(1.001*tp, 1.1*tend, 500))
+rinv_stream = np.array(list(re.rinv_stream(iter(t), T, S, Q, tp)))
+rinv = re.rinv(t, T, S, Q, tp)
+
+if np.allclose(rinv_stream, rinv, rtol=1e-9, atol=0.) and \
+   np.all(rinv_stream[t > tend] == 0):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy.solvers import bracket_root, newton
+
+# Roots of x**2 = c in [1e-3, 10], the last bracket not containing a root
+c = np.array([0.01, 1., 50., 4.])
+
+def f(x, c):
+    return x**2 - c
+
+def f_df(x, c):
+    return x**2 - c, 2*x
+
+expected = np.array([0.1, 1., np.nan, 2.])
+res_itp = bracket_root(f, 1e-3, [10., 10., 5., 10.], args=(c,), rtol=1e-12)
+res_newton = newton(f_df, 1., 1e-3, [10., 10., 5., 10.], args=(c,),
+                    rtol=1e-12)
+
+if np.allclose(res_itp, expected, rtol=1e-10, equal_nan=True) and \
+   np.allclose(res_newton, expected, rtol=1e-10, equal_nan=True):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
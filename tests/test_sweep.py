@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy.sweep import sweep
+
+if __name__ == '__main__':
+
+    T = np.logspace(-4, -2, 10)
+    t = np.logspace(1, 6, 30)
+    alpha = np.array([0.01, 0.05])
+    grid = {'T': T, 't': t, 'alpha': alpha}
+    fixed = {'S': 1.e-4, 'rw': 0.1}
+
+    # The parallel sweep gives the same radii as a direct evaluation, and
+    # reports the progress of all the grid points
+    progress = []
+    res = sweep('rinv_reldrawave', grid, fixed, workers=2, chunk_size=100,
+                progress=lambda done, total: progress.append((done, total)))
+    ref = dr.rinv_reldrawave(t[None,:,None], T[:,None,None], 1.e-4, 0.1,
+                             alpha[None,None,:])
+
+    if np.array_equal(res, ref) and progress[-1] == (600, 600):
+        print('Test passed successfully')
+    else:
+        print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from wellradpy import drawdown as dr
+from wellradpy.uncertainty import propagate, lognormal
+
+n = 20000
+t = 3600.
+Q = 0.01
+stats = propagate(['rinfl_absdraw'], n, t=t, T=lognormal(1e-3, 0.5),
+                  S=lognormal(1e-4, 0.5), Q=Q, seed=0, chunk_size=3000)
+
+# Same samples drawn at once, in the same order as chunk by chunk
+rng = np.random.default_rng(0)
+T = np.empty(n)
+S = np.empty(n)
+for start in range(0, n, 3000):
+    size = min(3000, n - start)
+    T[start:start+size] = 1e-3 * np.power(10., 0.5*rng.standard_normal(size))
+    S[start:start+size] = 1e-4 * np.power(10., 0.5*rng.standard_normal(size))
+r = dr.rinfl_absdraw(t, T, S, Q)
+
+q = [0.05, 0.5, 0.95]
+stat = stats['rinfl_absdraw']
+if stat.count == n and np.isclose(stat.mean, r.mean(), rtol=1e-12) and \
+   np.isclose(stat.std, r.std(ddof=1), rtol=1e-10) and \
+   np.allclose(stat.quantile(q), np.quantile(r, q), rtol=3e-3):
+    print('Test passed successfully')
+else:
+    print('!!!!!!!!!!!!! TEST FAILED !!!!!!!!!!!!!')
@@ -5,4 +5,56 @@ Created on Wed Jul 17 17:19:52 2019
 @author: ebrescia
 """
 
-name = "wellradpy"
\ No newline at end of file
+import importlib
+
+name = "wellradpy"
+__version__ = "2.0"
+
+# Submodules are imported on first access (e.g. wellradpy.drawdown), so that
+# importing the package costs nothing until they are used
+_SUBMODULES = ('cache', 'chunked', 'cli', 'criteria', 'diskcache',
+               'drawdown', 'field', 'gradients', 'leaky', 'plans', 'precision',
+               'profiling', 'recovery', 'solvers', 'sweep', 'uncertainty',
+               'utils')
+
+def warmup(modes=None):
+    """
+    Generate the interpolation tables, so that the first calls of the
+    functions do not pay for it.
+
+    Parameters
+    ----------
+    modes: list, optional
+        Precision modes ('fast', 'default', 'reference' or Precision
+        tuples) for which the tables are generated (the precision in effect
+        by default).
+
+    Notes
+    -----
+    The costly tables are stored in the on-disk cache (see the diskcache
+    module), from which the other processes load them, so that warming up
+    once (e.g. when installing or deploying) benefits all the subsequent
+    processes.
+
+    """
+    from . import drawdown, recovery, utils
+    from .precision import precision
+    for mode in (modes or [None]):
+        with precision(mode) as current:
+            density = current.table_density
+            drawdown._K_interpolants(density)
+            drawdown._K_errors_table(density)
+            drawdown._Kprime_inv_interpolant(density)
+            drawdown._Kprime_inv_error_table(density)
+            recovery._tmax_star_interpolant(density)
+            recovery._tmax_star_error_table(density)
+            utils._hantush_interpolant(density)
+            utils._hantush_error_table(density)
+
+def __getattr__(attr):
+    if attr in _SUBMODULES:
+        return importlib.import_module('.' + attr, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, attr))
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES))
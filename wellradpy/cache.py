@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import collections
+import functools
+import threading
+import numpy as np # version 1.16.2
+from .precision import get_precision
+
+CacheInfo = collections.namedtuple('CacheInfo',
+                                   ['hits', 'misses', 'maxsize', 'currsize'])
+
+class LRUCache(object):
+    """
+    Bounded and thread-safe least-recently-used cache.
+
+    Parameters
+    ----------
+    maxsize: int or None, optional
+        Maximum number of entries (None for no limit, 0 to disable caching).
+        When the cache is full, the least recently used entry is evicted.
+
+    """
+
+    def __init__(self, maxsize=128):
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, default=None):
+        """
+        Get the value associated with a key, and mark it as recently used.
+
+        Parameters
+        ----------
+        key: hashable
+            Key.
+        default: optional
+            Value returned if the key is not in the cache.
+
+        Returns
+        -------
+        Cached value, or default.
+
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entries if needed.
+
+        Parameters
+        ----------
+        key: hashable
+            Key.
+        value:
+            Value.
+
+        """
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        if self._maxsize is not None:
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        """
+        Change the maximum number of entries.
+
+        Parameters
+        ----------
+        maxsize: int or None
+            Maximum number of entries (None for no limit, 0 to disable
+            caching).
+
+        """
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """
+        Remove all the entries and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """
+        Report the cache statistics.
+
+        Returns
+        -------
+        CacheInfo(hits, misses, maxsize, currsize)
+
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize,
+                             len(self._data))
+
+# Caches of the memoized functions, by function name
+_caches = collections.OrderedDict()
+
+# Marker for cache misses (None may be a cached value)
+_missing = object()
+
+def memoize(func):
+    """
+    Memoize a function of scalar arguments with a LRU cache.
+
+    Parameters
+    ----------
+    func: callable
+        Function to memoize.
+
+    Returns
+    -------
+    Memoized function.
+
+    Notes
+    -----
+    Calls where all arguments are scalars are looked up in the cache. Calls
+    with array arguments (positional or keyword) are passed through
+    unchanged, since they would rarely repeat and hashing them would cost
+    more than it saves. The precision in effect is part of the key, since
+    the results depend on it (see the precision module). The cache is
+    registered under the qualified name of the function (e.g.
+    'wellradpy.drawdown._Finv'), and also attached to the memoized function
+    as its `cache` attribute.
+
+    """
+    cache = LRUCache()
+    name = '%s.%s' % (func.__module__, func.__name__)
+    _caches[name] = cache
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if any(np.ndim(arg) != 0 for arg in args) or \
+           any(np.ndim(value) != 0 for value in kwargs.values()):
+            return func(*args, **kwargs)
+        # Zero-dimensional arrays are not hashable, unlike their items
+        key = tuple(float(arg) for arg in args) + \
+              tuple(sorted((name, np.asarray(value)[()])
+                           for name, value in kwargs.items())) + \
+              (get_precision(),)
+        value = cache.get(key, _missing)
+        if value is _missing:
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+        return value
+
+    wrapper.cache = cache
+    return wrapper
+
+def _select(name):
+    if name is None:
+        return list(_caches.values())
+    return [_caches[name]]
+
+def cache_info(name=None):
+    """
+    Report the statistics of the caches of memoized functions.
+
+    Parameters
+    ----------
+    name: str, optional
+        Qualified name of a memoized function (all functions by default).
+
+    Returns
+    -------
+    CacheInfo(hits, misses, maxsize, currsize) if name is given, otherwise
+    a dictionary of CacheInfo by function name.
+
+    """
+    if name is not None:
+        return _caches[name].info()
+    return collections.OrderedDict((key, cache.info())
+                                   for key, cache in _caches.items())
+
+def cache_clear(name=None):
+    """
+    Clear the caches of memoized functions.
+
+    Parameters
+    ----------
+    name: str, optional
+        Qualified name of a memoized function (all functions by default).
+
+    """
+    for cache in _select(name):
+        cache.clear()
+
+def set_cache_size(maxsize, name=None):
+    """
+    Set the maximum number of entries of the caches of memoized functions.
+
+    Parameters
+    ----------
+    maxsize: int or None
+        Maximum number of entries (None for no limit, 0 to disable caching).
+    name: str, optional
+        Qualified name of a memoized function (all functions by default).
+
+    """
+    for cache in _select(name):
+        cache.resize(maxsize)
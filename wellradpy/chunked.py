@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import inspect
+import itertools
+import tracemalloc
+import numpy as np # version 1.16.2
+from .sweep import _function
+
+# Number of elements of the block used to measure the memory needed per
+# element, and memory per element assumed when it cannot be measured (i.e.
+# when tracemalloc is already in use)
+_PROBE_ELEMENTS = 4096
+_DEFAULT_BYTES_PER_ELEMENT = 2048
+
+def _sliceable(value):
+    # Arrays that are read block by block (arrays, memory-mapped arrays, dask
+    # or zarr arrays, h5py datasets...)
+    return hasattr(value, 'shape') and hasattr(value, '__getitem__') and \
+           len(value.shape) > 0
+
+def _chunk_edges(value):
+    """
+    Edges of the chunks of an array along each of its axes, from its chunk
+    metadata (e.g. dask arrays, whose chunks are tuples of chunk sizes, or
+    zarr arrays and h5py datasets, whose chunks are the shape of a chunk).
+    """
+    shape = value.shape
+    chunks = getattr(value, 'chunks', None)
+    if not chunks or len(chunks) != len(shape):
+        return [[0, n] for n in shape]
+    edges = []
+    for n, chunk in zip(shape, chunks):
+        if np.ndim(chunk) == 0:
+            edges.append(list(range(0, n, max(int(chunk), 1))) + [n])
+        else:
+            edges.append([0] + list(np.cumsum(chunk, dtype=int)))
+    return edges
+
+def _split(cell, max_elements):
+    """
+    Split a block of the output (tuple of slices) into blocks of at most
+    max_elements elements (generated one at a time), keeping the trailing
+    axes whole as far as possible so that the blocks are contiguous in
+    memory.
+    """
+    lengths = [s.stop - s.start for s in cell]
+    size = 1
+    axis = len(cell)
+    while axis > 0 and size*lengths[axis-1] <= max_elements:
+        axis -= 1
+        size *= lengths[axis]
+    if axis == 0:
+        yield cell
+        return
+    # Axis split in parts of step elements, and leading axes split in single
+    # elements
+    step = max(max_elements // size, 1)
+    s = cell[axis-1]
+    tail = tuple(cell[axis:])
+    for index in np.ndindex(*lengths[:axis-1]):
+        head = tuple(slice(c.start + i, c.start + i + 1)
+                     for c, i in zip(cell, index))
+        for i in range(s.start, s.stop, step):
+            yield head + (slice(i, min(i+step, s.stop)),) + tail
+
+def blocks(shape, max_elements, edges=None):
+    """
+    Split an array into blocks.
+
+    Parameters
+    ----------
+    shape: tuple
+        Shape of the array.
+    max_elements: int
+        Maximum number of elements per block.
+    edges: list, optional
+        Indices at which blocks must be split along each axis (e.g. the
+        edges of the chunks of a dask array), starting with 0 and ending
+        with the length of the axis.
+
+    Yields
+    ------
+    Blocks, as tuples of slices (generated one at a time, so that the
+    blocks of large arrays are never all held in memory).
+
+    """
+    if edges is None:
+        edges = [[0, n] for n in shape]
+    cells = itertools.product(*[[slice(a, b) for a, b in zip(e[:-1], e[1:])]
+                                for e in edges])
+    for cell in cells:
+        for block in _split(cell, max_elements):
+            yield block
+
+def _read(value, block, ndim):
+    """
+    Read the part of a parameter needed for a block of the output (the
+    parameter being broadcast against the output).
+    """
+    if not _sliceable(value):
+        return value
+    shape = value.shape
+    index = tuple(slice(None) if n == 1 else s
+                  for n, s in zip(shape, block[ndim-len(shape):]))
+    return np.asarray(value[index], dtype=float)
+
+def _bytes_per_element(func, params, fixed, block, ndim):
+    """
+    Measure the peak memory allocated per element by a function on a block.
+    """
+    kwargs = dict(fixed)
+    for name, value in params.items():
+        kwargs[name] = _read(value, block, ndim)
+    if tracemalloc.is_tracing():
+        return _DEFAULT_BYTES_PER_ELEMENT
+    tracemalloc.start()
+    try:
+        func(**kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    size = int(np.prod([s.stop - s.start for s in block]))
+    return peak / max(size, 1)
+
+def evaluate(criterion, params, fixed=None, out=None, memory=2**28,
+             progress=None):
+    """
+    Calculate a radius for arrays of parameters larger than memory, block by
+    block.
+
+    Parameters
+    ----------
+    criterion: str
+        Name of a function of the drawdown module (e.g. 'rinv_reldrawave'),
+        or of the recovery or leaky module prefixed with its name (e.g.
+        'recovery.rinv' or 'leaky.rinfl_absdraw').
+    params: dict
+        Values of the parameters or thresholds, by name, broadcast against
+        each other: floats, arrays, memory-mapped arrays (e.g.
+        np.load(file, mmap_mode='r')) or any array-like object supporting
+        slicing and conversion with np.asarray, such as dask arrays.
+    fixed: dict, optional
+        Values of the parameters passed as is to the function (e.g. the
+        times and rates of a pumping schedule).
+    out: str or ndarray, optional
+        Output: path of a .npy file, created as a memory-mapped array, or
+        array (e.g. memory-mapped) of the broadcast shape of the parameters.
+        By default, an array is created in memory.
+    memory: int, optional
+        Maximum memory, in bytes, used to evaluate a block.
+    progress: callable, optional
+        Function called as progress(done, total) each time a block is
+        completed, with the numbers of elements done and in total.
+
+    Returns
+    -------
+    Radius, as an array (memory-mapped if out is a path) of the broadcast
+    shape of the parameters.
+
+    Notes
+    -----
+    Only the parts of the parameters needed for a block are read (or
+    computed, for dask arrays) at a time. The blocks are aligned with the
+    chunks of the parameters having chunk metadata, so that no block spans
+    several chunks, and split further to respect the memory limit. The
+    memory needed per element is measured on a first small block.
+
+    """
+    fixed = dict(fixed or {})
+    func = _function(criterion)
+    # Fail early on missing or unknown parameters
+    inspect.signature(func).bind(**dict(fixed, **params))
+    params = dict((name, value if _sliceable(value) else
+                   np.asarray(value, dtype=float))
+                  for name, value in params.items())
+    shape = np.broadcast(*[np.broadcast_to(0., np.shape(value))
+                           for value in params.values()]).shape
+    ndim = len(shape)
+    if out is None:
+        out = np.empty(shape)
+    elif isinstance(out, str):
+        out = np.lib.format.open_memmap(out, mode='w+', dtype=float,
+                                        shape=shape)
+    elif out.shape != shape:
+        raise ValueError('out must have the shape %r of the parameters'
+                         % (shape,))
+    size = int(np.prod(shape))
+    if size == 0:
+        return out
+    # Edges of the chunks of the parameters, along the axes of the output
+    edges = [set([0, n]) for n in shape]
+    for value in params.values():
+        if _sliceable(value):
+            offset = ndim - len(value.shape)
+            for axis, e in enumerate(_chunk_edges(value)):
+                if value.shape[axis] > 1:
+                    edges[offset+axis].update(e)
+    edges = [sorted(e) for e in edges]
+    probe = next(blocks(shape, _PROBE_ELEMENTS, edges))
+    bytes_per_element = _bytes_per_element(func, params, fixed, probe, ndim) \
+                        + 8*(len(params) + 1)
+    max_elements = max(int(memory // bytes_per_element), 1)
+    done = 0
+    for block in blocks(shape, max_elements, edges):
+        kwargs = dict(fixed)
+        for name, value in params.items():
+            kwargs[name] = _read(value, block, ndim)
+        block_shape = tuple(s.stop - s.start for s in block)
+        out[block] = np.broadcast_to(func(**kwargs), block_shape)
+        done += int(np.prod(block_shape))
+        if progress is not None:
+            progress(done, size)
+    if hasattr(out, 'flush'):
+        out.flush()
+    return out
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import argparse
+import csv
+import inspect
+import itertools
+import sys
+import numpy as np # version 1.16.2
+from .sweep import _function
+
+# Functions that do not return one radius per row, or that take a pumping
+# schedule (not a column)
+_UNSUPPORTED = ('recovery.rinv_stream', 'recovery.characteristics',
+                'recovery.cyclic_schedule', 'recovery.rinv_schedule',
+                'recovery.tmax_schedule', 'recovery.rinvmax_schedule',
+                'recovery.tend_schedule')
+
+###############################################################################
+# Input
+###############################################################################
+
+def _parse_rows(lines, columns):
+    """
+    Parse CSV lines one by one.
+
+    Returns
+    -------
+    Array of the values of the columns (NaN for the rows that cannot be
+    parsed), and list of (index, message) of these rows.
+
+    """
+    values = np.full((len(lines), len(columns)), np.nan)
+    errors = []
+    for i, fields in enumerate(csv.reader(lines)):
+        try:
+            values[i] = [float(fields[j]) for j in columns]
+        except (ValueError, IndexError) as e:
+            errors.append((i, 'cannot parse row: %s' % e))
+    return values, errors
+
+def read_header(f):
+    """
+    Read the header line of a CSV file.
+
+    Parameters
+    ----------
+    f: file
+        CSV file open in text mode.
+
+    Returns
+    -------
+    List of the names of the columns.
+
+    """
+    return [column.strip() for column in next(csv.reader([f.readline()]), [])]
+
+def read_chunks(f, header, names, chunk_size=100000):
+    """
+    Read the columns of a CSV file by chunks of rows.
+
+    Parameters
+    ----------
+    f: file
+        CSV file open in text mode, positioned after the header line.
+    header: list of str
+        Names of the columns of the file (see read_header).
+    names: list of str
+        Names of the columns to read.
+    chunk_size: int, optional
+        Number of rows per chunk.
+
+    Yields
+    ------
+    Dictionary of the columns of the chunk by name, and list of (index,
+    message) of the rows of the chunk that cannot be parsed (set to NaN).
+
+    Notes
+    -----
+    Chunks are parsed with numpy.loadtxt, and row by row with the csv module
+    if that fails (e.g. because of quoted or missing values), so that every
+    line of the file gives one row.
+
+    """
+    missing = [name for name in names if name not in header]
+    if missing:
+        raise ValueError('Missing column(s) in input: %s' % ', '.join(missing))
+    columns = [header.index(name) for name in names]
+    while True:
+        lines = list(itertools.islice(f, chunk_size))
+        if not lines:
+            return
+        errors = []
+        try:
+            values = np.loadtxt(lines, delimiter=',', usecols=columns,
+                                ndmin=2)
+        except ValueError:
+            values = None
+        if values is None or values.shape[0] != len(lines):
+            values, errors = _parse_rows(lines, columns)
+        yield dict((name, values[:,i]) for i, name in enumerate(names)), \
+              errors
+
+###############################################################################
+# Output
+###############################################################################
+
+class _CSVWriter(object):
+
+    def __init__(self, f, names, fmt='%.10g'):
+        self._f = f
+        self._fmt = fmt
+        csv.writer(f, lineterminator='\n').writerow(names)
+
+    def write(self, res):
+        if res.size:
+            np.savetxt(self._f, np.column_stack([res[name]
+                                                 for name in res.dtype.names]),
+                       fmt=self._fmt, delimiter=',')
+
+    def close(self):
+        if self._f is sys.stdout:
+            self._f.flush()
+        else:
+            self._f.close()
+
+def _npy_header(dtype, size, length=None):
+    """
+    Header of a .npy file of a one-dimensional array, padded to a given
+    length (aligned on 64 bytes by default, as numpy does).
+    """
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (
+        np.lib.format.dtype_to_descr(np.dtype(dtype)), size)
+    prefix = np.lib.format.magic(1, 0)
+    if length is None:
+        length = -(-(len(prefix) + 2 + len(header) + 1) // 64) * 64
+    header = header.ljust(length - len(prefix) - 3) + '\n'
+    return prefix + np.array(len(header), '<u2').tobytes() + \
+        header.encode('latin1')
+
+class _NpyWriter(object):
+    """
+    Write a one-dimensional structured array to a .npy file by chunks, the
+    number of rows being written in the header at the end.
+    """
+
+    def __init__(self, f, dtype):
+        self._f = f
+        self._dtype = np.dtype(dtype)
+        self._size = 0
+        # The header is padded to the length it has with the largest
+        # possible number of rows, so that it can be rewritten in place
+        self._length = len(_npy_header(self._dtype, 2**63))
+        f.write(_npy_header(self._dtype, 0, self._length))
+
+    def write(self, res):
+        self._f.write(np.ascontiguousarray(res, self._dtype).tobytes())
+        self._size += res.size
+
+    def close(self):
+        self._f.seek(0)
+        self._f.write(_npy_header(self._dtype, self._size, self._length))
+        self._f.close()
+
+###############################################################################
+# Evaluation
+###############################################################################
+
+def _arguments(func, columns, constants):
+    """
+    Names of the parameters of a function to read from the input (the
+    required ones and the thresholds present in the input).
+    """
+    names = []
+    for param in inspect.signature(func).parameters.values():
+        if param.name in constants:
+            continue
+        if param.default is param.empty or param.name in columns:
+            names.append(param.name)
+    return names
+
+def _evaluate_rows(func, kwargs, out, start, stop, errors, name):
+    """
+    Evaluate a function for the rows start to stop, splitting them in halves
+    while the vectorized evaluation fails, so that only the rows that raise
+    are left as NaN.
+    """
+    row_kwargs = dict((param, value[start:stop] if np.ndim(value) else value)
+                      for param, value in kwargs.items())
+    try:
+        out[start:stop] = np.broadcast_to(func(**row_kwargs),
+                                          (stop - start,))
+    except Exception as e:
+        if stop - start == 1:
+            errors.append((start, name, '%s: %s' % (type(e).__name__, e)))
+        elif stop - start > 1:
+            middle = (start + stop) // 2
+            _evaluate_rows(func, kwargs, out, start, middle, errors, name)
+            _evaluate_rows(func, kwargs, out, middle, stop, errors, name)
+
+def evaluate_chunk(funcs, values, constants=None):
+    """
+    Evaluate radius functions for a chunk of rows, by bisection of the
+    chunk where the vectorized evaluation fails.
+
+    Parameters
+    ----------
+    funcs: dict
+        Radius functions by output name.
+    values: dict
+        Columns of the chunk by parameter name.
+    constants: dict, optional
+        Values of the parameters that are not in the input.
+
+    Returns
+    -------
+    Structured array with one field per function, and list of (index,
+    name, message) of the rows that failed (set to NaN), i.e. that raise or
+    give NaN although their parameters are finite.
+
+    """
+    if constants is None:
+        constants = {}
+    size = len(next(iter(values.values()))) if values else 0
+    res = np.full(size, np.nan, dtype=[(name, float) for name in funcs])
+    errors = []
+    with np.errstate(all='ignore'):
+        for name, func in funcs.items():
+            params = inspect.signature(func).parameters
+            kwargs = dict((param, value) for param, value in constants.items()
+                          if param in params)
+            for param in _arguments(func, values, constants):
+                kwargs[param] = values[param]
+            raised = len(errors)
+            _evaluate_rows(func, kwargs, res[name], 0, size, errors, name)
+            failed = np.isnan(res[name])
+            for value in kwargs.values():
+                failed &= np.isfinite(value)
+            failed[[error[0] for error in errors[raised:]]] = False
+            errors.extend((i, name, 'no result (NaN) for finite parameters')
+                          for i in np.flatnonzero(failed).tolist())
+    return res, errors
+
+def main(argv=None):
+    """
+    Command-line batch processor: calculate radii for the rows of a CSV
+    file.
+
+    Parameters
+    ----------
+    argv: list of str, optional
+        Command-line arguments (sys.argv[1:] by default).
+
+    Returns
+    -------
+    Exit status: 0 on success, 2 if some rows failed (their results are
+    NaN).
+
+    Notes
+    -----
+    The input is read and the output written by chunks of rows, so that
+    memory use does not depend on the size of the file. Run
+    ``wellradpy -h`` for the options.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='wellradpy',
+        description='Calculate radii of influence and investigation for the '
+                    'rows of a CSV file, whose header names the parameters '
+                    '(t, T, S, Q, rw, tp, delta, B, and optionally the '
+                    'thresholds sc and alpha).')
+    parser.add_argument('input', help='CSV input file ("-" for stdin)')
+    parser.add_argument('-c', '--criteria', nargs='+', required=True,
+                        help='functions of the drawdown module (e.g. '
+                             'rinfl_absdraw) or of the recovery or leaky '
+                             'module (e.g. recovery.rinv)')
+    parser.add_argument('-o', '--output', default='-',
+                        help='output file, CSV or .npy (structured array); '
+                             'CSV on stdout by default')
+    parser.add_argument('-p', '--param', action='append', default=[],
+                        metavar='NAME=VALUE',
+                        help='value of a parameter that is not in the input '
+                             '(repeatable)')
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help='number of rows per chunk (default: '
+                             '%(default)s)')
+    parser.add_argument('--errors', metavar='FILE',
+                        help='CSV file listing all the rows that failed')
+    parser.add_argument('--max-messages', type=int, default=20,
+                        help='number of failed rows reported on stderr '
+                             '(default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    funcs = {}
+    constants = {}
+    try:
+        for name in args.criteria:
+            if name in _UNSUPPORTED:
+                raise ValueError('Unsupported criterion: %s' % name)
+            funcs[name] = _function(name)
+        for param in args.param:
+            key, _, value = param.partition('=')
+            constants[key.strip()] = float(value)
+    except ValueError as e:
+        parser.error(str(e))
+    infile = sys.stdin if args.input == '-' else open(args.input, newline='')
+    if args.output == '-':
+        writer = _CSVWriter(sys.stdout, list(funcs))
+    elif args.output.endswith('.npy'):
+        writer = _NpyWriter(open(args.output, 'wb'),
+                            [(name, float) for name in funcs])
+    else:
+        writer = _CSVWriter(open(args.output, 'w', newline=''), list(funcs))
+    errfile = None
+    if args.errors is not None:
+        errfile = open(args.errors, 'w', newline='')
+        errwriter = csv.writer(errfile, lineterminator='\n')
+        errwriter.writerow(['line', 'criterion', 'message'])
+
+    rows = 0
+    failed = 0
+    messages = 0
+    try:
+        # Thresholds given as columns are read in addition to the required
+        # parameters
+        header = read_header(infile)
+        names = sorted(set(param for func in funcs.values()
+                           for param in _arguments(func, header, constants)))
+        chunks = read_chunks(infile, header, names, args.chunk_size)
+        for values, parse_errors in chunks:
+            res, errors = evaluate_chunk(funcs, values, constants)
+            errors = [(i, '', message) for i, message in parse_errors] + \
+                     sorted(errors)
+            failed += len(set(error[0] for error in errors))
+            for i, name, message in errors:
+                # Line numbers in the input file, the header being line 1
+                line = rows + i + 2
+                if messages < args.max_messages:
+                    sys.stderr.write('wellradpy: line %d: %s%s\n'
+                                     % (line, name + ': ' if name else '',
+                                        message))
+                messages += 1
+                if errfile is not None:
+                    errwriter.writerow([line, name, message])
+            writer.write(res)
+            rows += res.size
+    except ValueError as e:
+        sys.stderr.write('wellradpy: %s\n' % e)
+        return 1
+    finally:
+        writer.close()
+        if errfile is not None:
+            errfile.close()
+        if infile is not sys.stdin:
+            infile.close()
+    if failed:
+        sys.stderr.write('wellradpy: %d row(s) processed, %d failed row(s)\n'
+                         % (rows, failed))
+        return 2
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
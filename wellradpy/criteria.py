@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import collections
+import functools
+import inspect
+import numpy as np # version 1.16.2
+from . import drawdown
+from .utils import E1, E1inv
+from .profiling import instrumented
+
+###############################################################################
+# Registry of the drawdown radius criteria
+###############################################################################
+
+Criterion = collections.namedtuple('Criterion', [
+    'name',         # name of the function of the drawdown module
+    'kind',         # 'rinfl' (influence) or 'rinv' (investigation)
+    'params',       # parameters needed in addition to t, T and S
+    'thresholds',   # thresholds with their default values
+    'group',        # dimensionless group of the coefficient ('sc_star', 'uw'
+                    # or None)
+    'cost',         # 'closed-form', 'root-solve' or 'table' (interpolation
+                    # in a precomputed table)
+    'coefficient',  # function of the shared intermediates and thresholds
+                    # returning the coefficient C of C * sqrt(T*t/S)
+    ])
+
+CRITERIA = collections.OrderedDict()
+
+def _key(name, **thresholds):
+    """
+    Key of a quantity shared between criteria, or None if it depends on
+    array thresholds (which are not shared).
+    """
+    if any(np.ndim(value) != 0 for value in thresholds.values()):
+        return None
+    return (name,) + tuple(sorted((param, float(value))
+                                  for param, value in thresholds.items()))
+
+def _coefficient(name, x, **thresholds):
+    """
+    Coefficient C of the radius C * sqrt(T*t/S) of a criterion, obtained by
+    evaluating the function of the drawdown module with t = T = S = 1, and
+    with Q = 4*pi (so that sc_star = sc) or rw = 2*sqrt(uw) (so that the
+    well radius gives uw), as in the plans module.
+    """
+    criterion = CRITERIA[name]
+    key = _key(name, **thresholds)
+    if criterion.group == 'sc_star':
+        thresholds['sc'] = x.sc_star(thresholds['sc'])
+    args = [4*np.pi if param == 'Q' else x.rw_uw if param == 'rw' else
+            x.delta for param in criterion.params]
+    return x._shared(key, getattr(drawdown, name), 1., 1., 1., *args,
+                     **thresholds)
+
+def _reldraw_coefficient(factor, x, alpha):
+    """
+    Coefficient of rinfl_reldraw (factor 2) and rinv_reldrawdiff (factor 1),
+    which share the root uw_alpha of E1(uw_alpha) = alpha*E1(uw).
+    """
+    return factor * np.sqrt(x.reldraw_root(alpha))
+
+def _register(name, group, cost, coefficient=None):
+    """
+    Add a criterion to the registry, reading its parameters and thresholds
+    from the signature of the function of the drawdown module (with the
+    coefficient evaluated by _coefficient by default).
+    """
+    func = getattr(drawdown, name)
+    params = []
+    thresholds = collections.OrderedDict()
+    for param in list(inspect.signature(func).parameters.values())[3:]:
+        if param.default is param.empty:
+            params.append(param.name)
+        else:
+            thresholds[param.name] = param.default
+    CRITERIA[name] = Criterion(name, name.split('_')[0], tuple(params),
+                               thresholds, group, cost,
+                               coefficient or
+                               functools.partial(_coefficient, name))
+
+# Radius of influence
+_register('rinfl_absdraw', 'sc_star', 'root-solve')
+_register('rinfl_reldraw', 'uw', 'root-solve',
+          functools.partial(_reldraw_coefficient, 2))
+_register('rinfl_relflow', None, 'closed-form')
+_register('rinfl_relvol', None, 'root-solve')
+_register('rinfl_quasisteady', None, 'closed-form')
+_register('rinfl_jones', None, 'closed-form')
+_register('rinfl_closedres', None, 'closed-form')
+_register('rinfl_impulse', None, 'closed-form')
+_register('rinfl_log', None, 'closed-form')
+
+# Radius of investigation
+_register('rinv_absdrawdiff', 'sc_star', 'root-solve')
+_register('rinv_absdrawderivdiff', 'sc_star', 'closed-form')
+_register('rinv_reldrawdiff', 'uw', 'root-solve',
+          functools.partial(_reldraw_coefficient, 1))
+_register('rinv_reldrawderivdiff', 'uw', 'closed-form')
+_register('rinv_reldrawave', 'uw', 'table')
+_register('rinv_reldrawderivave', 'uw', 'table')
+_register('rinv_propbarrierregime_lin', None, 'closed-form')
+_register('rinv_propbarrierregime_log', None, 'closed-form')
+_register('rinv_consthead', None, 'closed-form')
+_register('rinv_closedres', None, 'closed-form')
+_register('rinv_linearbarr', None, 'closed-form')
+_register('rinv_impulse', None, 'closed-form')
+
+###############################################################################
+# Batch evaluation
+###############################################################################
+
+class _Intermediates(object):
+    """
+    Quantities shared between criteria, calculated once on first use.
+    """
+
+    def __init__(self, t, T, S, Q, rw, delta):
+        self.t = t
+        self.T = T
+        self.S = S
+        self.Q = Q
+        self.rw = rw
+        self.delta = delta
+        self._values = {}
+
+    def _shared(self, key, func, *args, **kwargs):
+        if key is None:
+            return func(*args, **kwargs)
+        if key not in self._values:
+            self._values[key] = func(*args, **kwargs)
+        return self._values[key]
+
+    @property
+    def sqrt_Tt_S(self):
+        return self._shared('sqrt_Tt_S', np.sqrt, self.T*self.t/self.S)
+
+    @property
+    def uw(self):
+        return self._shared('uw', lambda: self.S*self.rw**2/(4*self.T*self.t))
+
+    @property
+    def rw_uw(self):
+        # Well radius giving uw for t = T = S = 1
+        return self._shared('rw_uw', lambda: 2*np.sqrt(self.uw))
+
+    def sc_star(self, sc):
+        return self._shared(_key('sc_star', sc=sc),
+                            lambda: 4*np.pi*self.T*sc/self.Q)
+
+    def reldraw_root(self, alpha):
+        # Root uw_alpha of E1(uw_alpha) = alpha*E1(uw)
+        return self._shared(_key('reldraw_root', alpha=alpha),
+                            lambda: E1inv(alpha*E1(self.uw)))
+
+@instrumented
+def evaluate(t, T, S, Q=None, rw=None, delta=None, criteria=None,
+             thresholds=None):
+    """
+    Calculate radii of influence and investigation during drawdown for
+    several criteria at once.
+
+    Parameters
+    ----------
+    t: float or ndarray
+        Time from beginning of pumping.
+    T: float or ndarray
+        Transmissivity.
+    S: float or ndarray
+        Storativity.
+    Q: float or ndarray, optional
+        Pumping rate.
+    rw: float or ndarray, optional
+        Well radius.
+    delta: float or ndarray, optional
+        Window size used to calculate derivative.
+    criteria: list of str, optional
+        Names of the criteria (functions of the drawdown module) to evaluate.
+        By default, all the criteria whose parameters are given.
+    thresholds: dict, optional
+        Thresholds by criterion name, e.g. {'rinfl_absdraw': {'sc': 0.1}}
+        (default thresholds of the drawdown functions otherwise).
+
+    Returns
+    -------
+    Structured array with the broadcast shape of the parameters, with one
+    field per criterion, and the fields rinfl_min, rinfl_max, rinv_min and
+    rinv_max giving the envelope of the radii of influence and investigation
+    (ignoring NaN values; only present if criteria of that kind are
+    evaluated).
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    The quantities shared between criteria, such as sqrt(T*t/S),
+    sc_star = 4*pi*T*sc/Q, uw = S*rw**2/(4*T*t) and the root of
+    E1(u) = alpha*E1(uw) used by rinfl_reldraw and rinv_reldrawdiff, are
+    calculated only once (for each value of the thresholds, unless these
+    are arrays). The coefficient C of each radius C * sqrt(T*t/S) is
+    obtained from the function of the drawdown module evaluated on the
+    dimensionless groups (or from the shared root for rinfl_reldraw and
+    rinv_reldrawdiff), so that the radii follow the drawdown module.
+
+    """
+    given = {'Q': Q, 'rw': rw, 'delta': delta}
+    if criteria is None:
+        criteria = [name for name, criterion in CRITERIA.items()
+                    if all(given[param] is not None
+                           for param in criterion.params)]
+    else:
+        for name in criteria:
+            if name not in CRITERIA:
+                raise ValueError('Unknown criterion: %s' % name)
+            missing = [param for param in CRITERIA[name].params
+                       if given[param] is None]
+            if missing:
+                raise ValueError('Criterion %s requires the parameter(s) %s'
+                                 % (name, ', '.join(missing)))
+    if thresholds is None:
+        thresholds = {}
+    arrays = [np.asarray(a, dtype=float)
+              for a in (t, T, S, Q, rw, delta) if a is not None]
+    shape = np.broadcast(*arrays).shape
+    x = _Intermediates(*[None if a is None else np.asarray(a, dtype=float)
+                         for a in (t, T, S, Q, rw, delta)])
+    kinds = [kind for kind in ('rinfl', 'rinv')
+             if any(CRITERIA[name].kind == kind for name in criteria)]
+    envelope = ['%s_%s' % (kind, bound) for kind in kinds
+                for bound in ('min', 'max')]
+    res = np.empty(shape, dtype=[(name, float)
+                                 for name in list(criteria) + envelope])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for name in criteria:
+            criterion = CRITERIA[name]
+            kwargs = dict(criterion.thresholds, **thresholds.get(name, {}))
+            res[name] = criterion.coefficient(x, **kwargs) * x.sqrt_Tt_S
+    for kind in kinds:
+        columns = [res[name] for name in criteria
+                   if CRITERIA[name].kind == kind]
+        res[kind + '_min'] = np.fmin.reduce(columns)
+        res[kind + '_max'] = np.fmax.reduce(columns)
+    return res
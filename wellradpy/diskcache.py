@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import numpy as np # version 1.16.2
+from . import __version__
+
+# Directory of the cache (empty until set or first used), by default from the
+# environment variable WELLRADPY_CACHE_DIR if defined (an empty value
+# disables the cache), otherwise the user cache directory of the platform
+_directory = []
+
+def _default_directory():
+    if 'WELLRADPY_CACHE_DIR' in os.environ:
+        return os.environ['WELLRADPY_CACHE_DIR'] or None
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or \
+               os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        return os.path.join(base, 'wellradpy', 'Cache')
+    if sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or \
+               os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'wellradpy')
+
+def get_directory():
+    """
+    Get the directory of the on-disk cache.
+
+    Returns
+    -------
+    Path of the directory (None if the cache is disabled). The tables are
+    stored in a subdirectory named after the version of the package.
+
+    """
+    if not _directory:
+        _directory.append(_default_directory())
+    return _directory[0]
+
+def set_directory(path):
+    """
+    Set the directory of the on-disk cache.
+
+    Parameters
+    ----------
+    path: str or None
+        Path of the directory (created when needed), or None to disable the
+        cache.
+
+    """
+    _directory[:] = [path]
+
+# Names of the files written in the cache (see persistent)
+_FILE = re.compile(r'wellradpy\..+-[0-9a-f]{16}\.(json|\d+\.npy)$')
+
+def clear():
+    """
+    Delete the tables stored in the on-disk cache (for all the versions of
+    the package).
+
+    Notes
+    -----
+    Only the files written by wellradpy are deleted, and the version
+    subdirectories if they are then empty, so that the cache can be located
+    in a directory holding other files.
+
+    """
+    root = get_directory()
+    if root is None or not os.path.isdir(root):
+        return
+    for version in os.listdir(root):
+        directory = os.path.join(root, version)
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            if _FILE.match(name):
+                os.remove(os.path.join(directory, name))
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+
+def _key(name, args, parameters):
+    description = json.dumps({'name': name, 'args': [repr(a) for a in args],
+                              'parameters': parameters,
+                              'version': __version__}, sort_keys=True)
+    return description, hashlib.sha256(description.encode()).hexdigest()
+
+def _load(stem, description):
+    """
+    Load the arrays stored under a stem, if they were generated with the
+    same description.
+    """
+    try:
+        with open(stem + '.json') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('description') != description:
+        return None
+    try:
+        arrays = [np.load('%s.%d.npy' % (stem, i), mmap_mode='r')
+                  for i in range(meta['count'])]
+    except (OSError, ValueError):
+        return None
+    values = [float(a) if a.ndim == 0 else a for a in arrays]
+    return values[0] if meta['single'] else tuple(values)
+
+def _replace(directory, path, write):
+    # Written to a temporary file first, so that concurrent processes never
+    # see a partial file
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+def _store(directory, stem, description, value):
+    single = not isinstance(value, tuple)
+    arrays = [np.asarray(a) for a in ((value,) if single else value)]
+    for i, a in enumerate(arrays):
+        _replace(directory, '%s.%d.npy' % (stem, i),
+                 lambda f: np.save(f, a))
+    # The metadata, written last, validates the arrays
+    meta = json.dumps({'description': description, 'count': len(arrays),
+                       'single': single})
+    _replace(directory, stem + '.json', lambda f: f.write(meta.encode()))
+
+def persistent(*parameters):
+    """
+    Store the results of a table generator in the on-disk cache.
+
+    Parameters
+    ----------
+    *parameters: str
+        Names of the module constants on which the tables depend (e.g.
+        '_U_TABLE_MIN'), which are part of the key with the arguments and
+        the version of the package.
+
+    Returns
+    -------
+    Decorator of functions of hashable arguments returning an array, a
+    float, or a tuple of them.
+
+    Notes
+    -----
+    The tables are stored as .npy files and loaded as read-only
+    memory-mapped arrays, so that the processes using them share their
+    pages. They are generated on first use (or by wellradpy.warmup) and
+    regenerated if their metadata do not match the key. If the cache cannot
+    be written, the tables are simply generated in memory.
+
+    """
+    def decorator(func):
+        name = '%s.%s' % (func.__module__, func.__name__)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            root = get_directory()
+            if root is None:
+                return func(*args)
+            values = dict((p, repr(func.__globals__[p])) for p in parameters)
+            description, digest = _key(name, args, values)
+            directory = os.path.join(root, __version__)
+            stem = os.path.join(directory, '%s-%s' % (name, digest[:16]))
+            value = _load(stem, description)
+            if value is None:
+                value = func(*args)
+                try:
+                    os.makedirs(directory, exist_ok=True)
+                    _store(directory, stem, description, value)
+                except OSError:
+                    return value
+                # Returned memory-mapped, as when loaded by other processes
+                loaded = _load(stem, description)
+                if loaded is not None:
+                    value = loaded
+            return value
+
+        return wrapper
+    return decorator
@@ -5,15 +5,23 @@ Created on 2019/06/26
 @author: Etienne Bresciani
 """
 
+import functools
 import numpy as np # version 1.16.2
 from .utils import E1, E1inv, whittaker
-import scipy.optimize as opt # version 1.2.1
-import scipy.integrate as integrate # version 1.2.1
+from .solvers import bracket_root
+from .cache import memoize
+from .diskcache import persistent
+from .profiling import instrumented
+from .precision import get_precision
+
+# SciPy is imported in the functions that need it, so that importing this
+# module (e.g. for the closed-form criteria) does not pay its import time
 
 ###############################################################################
 # Radius of influence functions
 ###############################################################################
 
+@instrumented
 def rinfl_absdraw(t, T, S, Q, sc=0.05):
     """
     Calculate radius of influence during drawdown based on an absolute drawdown
@@ -45,6 +53,7 @@ def rinfl_absdraw(t, T, S, Q, sc=0.05):
     C = 2 * np.sqrt(E1inv(sc_star))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinfl_reldraw(t, T, S, rw, alpha=0.01):
     """
     Calculate radius of influence during drawdown based on a relative drawdown
@@ -76,6 +85,7 @@ def rinfl_reldraw(t, T, S, rw, alpha=0.01):
     C = 2 * np.sqrt(E1inv(alpha*E1(uw)))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinfl_relflow(t, T, S, alpha=0.01):
     """
     Calculate radius of influence during drawdown based on a relative flow rate
@@ -123,6 +133,8 @@ def _F(u):
 def _func_root_F(u, x):
     return _F(u) - x
 
+@instrumented
+@memoize
 def _Finv(x):
     """
     Inverse F function.
@@ -137,13 +149,10 @@ def _Finv(x):
     Finv(x).
 
     """
-    # Note: Another method (e.g. Newton) could be more efficient, but bisection
-    # is simple and robust, and we expect that efficiency will not be an issue
-    # in practice
-    sol = opt.root_scalar(_func_root_F, args=(x), method='bisect',
-                          bracket=(1e-12, 1e2), rtol=1e-5)
-    return sol.root
+    return bracket_root(_func_root_F, 1e-12, 1e2, args=(x,),
+                        rtol=get_precision().rtol)
 
+@instrumented
 def rinfl_relvol(t, T, S, alpha=0.01):
     """
     Calculate radius of influence during drawdown based on a relative volume
@@ -172,6 +181,7 @@ def rinfl_relvol(t, T, S, alpha=0.01):
     C = 2 * np.sqrt(_Finv(alpha))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinfl_quasisteady(t, T, S):
     """
     Calculate radius of influence during drawdown based on quasi-steady state
@@ -198,6 +208,7 @@ def rinfl_quasisteady(t, T, S):
     C = 2
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinfl_jones(t, T, S):
     """
     Calculate radius of influence during drawdown based on Jones'formula.
@@ -223,6 +234,7 @@ def rinfl_jones(t, T, S):
     C = 4
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinfl_closedres(t, T, S):
     """
     Calculate radius of influence during drawdown based on extension of closed
@@ -249,6 +261,7 @@ def rinfl_closedres(t, T, S):
     C = 2.83
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinfl_impulse(t, T, S):
     """
     Calculate radius of influence during drawdown based on impulse response
@@ -275,6 +288,7 @@ def rinfl_impulse(t, T, S):
     C = 2
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinfl_log(t, T, S):
     """
     Calculate radius of influence during drawdown based on extension of
@@ -305,6 +319,7 @@ def rinfl_log(t, T, S):
 # Radius of investigation functions
 ###############################################################################
 
+@instrumented
 def rinv_absdrawdiff(t, T, S, Q, sc=0.05):
     """
     Calculate radius of investigation during drawdown based on an absolute
@@ -336,6 +351,7 @@ def rinv_absdrawdiff(t, T, S, Q, sc=0.05):
     C = np.sqrt(E1inv(sc_star))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_absdrawderivdiff(t, T, S, Q, delta, sc=0.05):
     """
     Calculate radius of investigation during drawdown based on an absolute
@@ -370,6 +386,7 @@ def rinv_absdrawderivdiff(t, T, S, Q, delta, sc=0.05):
     C = np.sqrt(-np.log(np.sqrt(2)*sc_star/(delta)))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_reldrawdiff(t, T, S, rw, alpha=0.01):
     """
     Calculate radius of investigation during drawdown based on a relative
@@ -401,6 +418,7 @@ def rinv_reldrawdiff(t, T, S, rw, alpha=0.01):
     C = np.sqrt(E1inv(alpha*E1(uw)))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_reldrawderivdiff(t, T, S, rw, alpha=0.01):
     """
     Calculate radius of investigation during drawdown based on a relative
@@ -431,10 +449,7 @@ def rinv_reldrawderivdiff(t, T, S, rw, alpha=0.01):
     C = np.sqrt(S*rw**2/(4*T*t) - np.log(alpha))
     return C * np.sqrt(T*t/S)
 
-def _w_aux(u):
-    res = np.exp(-2*u) * whittaker(4*u)
-    return float(res)
-
+@instrumented
 def _w(u):
     """
     Weighting function that measures the contribution of transmissivity
@@ -442,17 +457,222 @@ def _w(u):
 
     Parameters
     ----------
-    u: float
-        Any positive real number.
+    u: float or ndarray
+        Any positive real number(s).
 
     Returns
     -------
     w(u).
 
+    Notes
+    -----
+    The weighting function is defined by
+    w(u) = sqrt(pi)/u*int_u^inf(exp(-2x)*W(4x)dx), with W the Whittaker
+    function. Since W(4x) = 2x*(K0(2x)+K1(2x))/sqrt(pi) and
+    d/dy(y*exp(-y)*K1(y)) = -y*exp(-y)*(K0(y)+K1(y)), the integral has a
+    closed form, which gives w(u) = exp(-2u)*K1(2u). This is evaluated with
+    the exponentially scaled Bessel function.
+
+    """
+    import scipy.special as spe # version 1.2.1
+    u = np.asarray(u, dtype=float)
+    return np.exp(-4*u) * spe.k1e(2*u)
+
+# Bounds and density of the logarithmic grid used to tabulate the tail
+# integrals of the weighting functions (w decreases like exp(-4u) beyond the
+# upper bound)
+_U_TABLE_MIN = 1e-14
+_U_TABLE_MAX = 50.
+_U_TABLE_POINTS_PER_UNIT = 80 # number of points per unit of ln(u)
+
+def _u_grid(u_min, density):
+    """
+    Logarithmic grid of u up to _U_TABLE_MAX, with _U_TABLE_POINTS_PER_UNIT
+    points per unit of ln(u) times the relative density.
+    """
+    n = int(round(np.log(_U_TABLE_MAX/u_min) * _U_TABLE_POINTS_PER_UNIT *
+                  density))
+    return np.linspace(np.log(u_min), np.log(_U_TABLE_MAX), n+1)
+
+def _integral_w(log_a, log_b):
+    """
+    Integral of w between exp(log_a) and exp(log_b), with a 8-point
+    Gauss-Legendre rule in ln(x).
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(8)
+    dlog = log_b - log_a
+    x = np.exp(log_a[:,None] + 0.5*dlog[:,None]*(nodes+1))
+    return np.sum(_w(x) * x * weights, axis=1) * 0.5*dlog
+
+@instrumented
+@functools.lru_cache(maxsize=None)
+@persistent('_U_TABLE_MIN', '_U_TABLE_MAX', '_U_TABLE_POINTS_PER_UNIT')
+def _K_table(density=1.):
+    """
+    Tabulate K(u) = int_u^inf(w).
+
+    Parameters
+    ----------
+    density: float, optional
+        Density of the grid relative to the default one.
+
+    Returns
+    -------
+    ln(u) on a dense logarithmic grid, and the corresponding values of K(u).
+
+    Notes
+    -----
+    The integral is accumulated from the upper bound of the grid with a
+    8-point Gauss-Legendre rule in ln(x) on each grid interval. Only positive
+    terms are summed, so that the results are accurate to about machine
+    precision.
+
+    """
+    log_u = _u_grid(_U_TABLE_MIN, density)
+    interval_integral = _integral_w(log_u[:-1], log_u[1:])
+    K = np.append(np.cumsum(interval_integral[::-1])[::-1], 0.)
+    return log_u, K
+
+@functools.lru_cache(maxsize=None)
+def _K_interpolants(density=1.):
+    """
+    Monotone interpolants of ln(K) as a function of ln(u) and conversely.
+    """
+    from scipy.interpolate import PchipInterpolator # version 1.2.1
+    log_u, K = _K_table(density)
+    positive = K > 0
+    log_u = log_u[positive]
+    log_K = np.log(K[positive])
+    return PchipInterpolator(log_u, log_K), \
+           PchipInterpolator(log_K[::-1], log_u[::-1])
+
+def _inner_points(log_a, log_b):
+    """
+    Points at one quarter, one half and three quarters of the intervals of a
+    grid, where the interpolation error of cubic Hermite interpolants is
+    maximum (the error due to the estimated derivatives cancels out at the
+    midpoints only).
+    """
+    return (log_a[:,None] + (log_b - log_a)[:,None]*[0.25, 0.5, 0.75]).ravel()
+
+def _local_errors(log_u, errors, u):
+    """
+    Look up the interpolation errors measured on the intervals of a grid of
+    ln(u), taking the maximum over the interval containing u and its
+    neighbours.
+    """
+    padded = np.concatenate((errors[:1], errors, errors[-1:]))
+    local = np.maximum(np.maximum(padded[:-2], padded[1:-1]), padded[2:])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        i = np.searchsorted(log_u, np.log(u)) - 1
+    return local[np.clip(i, 0, len(local)-1)]
+
+@functools.lru_cache(maxsize=None)
+@persistent('_U_TABLE_MIN', '_U_TABLE_MAX', '_U_TABLE_POINTS_PER_UNIT')
+def _K_errors_table(density):
+    # Exact values inside the intervals of the grid (where K is positive)
+    log_u, K = _K_table(density)
+    keep = np.flatnonzero(K[1:] > 0)
+    log_mid = _inner_points(log_u[keep], log_u[keep+1])
+    K_mid = K[keep+1].repeat(3) + _integral_w(log_mid, log_u[keep+1].repeat(3))
+    log_K_interp, log_u_interp = _K_interpolants(density)
+    error_K = np.abs(np.exp(log_K_interp(log_mid))/K_mid - 1)
+    error_Kinv = np.abs(np.exp(log_u_interp(np.log(K_mid)) - log_mid) - 1)
+    return log_u[keep], error_K.reshape(-1, 3).max(axis=1), \
+           error_Kinv.reshape(-1, 3).max(axis=1)
+
+def _K_errors(u):
+    """
+    Interpolation errors of K and Kinv, measured inside the intervals of the
+    table grid, for the precision in effect.
+
+    Parameters
+    ----------
+    u: float or ndarray
+        Any positive real number(s).
+
+    Returns
+    -------
+    Relative errors of K(u) and of Kinv(K(u)).
+
+    """
+    log_u, error_K, error_Kinv = \
+        _K_errors_table(get_precision().table_density)
+    return _local_errors(log_u, error_K, u), \
+           _local_errors(log_u, error_Kinv, u)
+
+@instrumented
+def _K(u):
+    """
+    K function defined by K(u) = int_u^inf(w).
+
+    Parameters
+    ----------
+    u: float or ndarray
+        Any positive real number(s).
+
+    Returns
+    -------
+    K(u).
+
+    Notes
+    -----
+    K is interpolated from a table with a monotone cubic interpolant in
+    log-log space. With the default precision, the relative interpolation
+    error is below 6e-7 for u < 10 (and below 3e-6 for u < 50, beyond which
+    K is negligible and set to 0); it decreases like the cube of the table
+    density (see _K_errors).
+    Below the table, the asymptotic behavior
+    K(u) = K(umin) + umin*w(umin)*ln(umin/u), which follows from
+    w(u) ~ 1/(2u) for small u, is used. It is exact up to O(umin) = O(1e-14).
+
+    """
+    density = get_precision().table_density
+    log_u_table, K_table = _K_table(density)
+    log_K_interp, _ = _K_interpolants(density)
+    shape = np.shape(u)
+    with np.errstate(divide='ignore'):
+        log_u = np.log(np.atleast_1d(u).astype(float))
+    with np.errstate(over='ignore'):
+        K = np.exp(log_K_interp(np.clip(log_u, log_u_table[0],
+                                        log_u_table[-2])))
+    below = log_u < log_u_table[0]
+    K[below] += _U_TABLE_MIN * _w(_U_TABLE_MIN) * \
+                (log_u_table[0]-log_u[below])
+    K[log_u > log_u_table[-2]] = 0.
+    return K.reshape(shape)[()]
+
+@instrumented
+def _Kinv(K):
+    """
+    Inverse K function.
+
+    Parameters
+    ----------
+    K: float or ndarray
+        Any positive real number(s).
+
+    Returns
+    -------
+    Kinv(K).
+
+    Notes
+    -----
+    Kinv is interpolated from the same table as K, with a relative
+    interpolation error below 2e-8 with the default precision.
+
     """
-    [aux_integral, aux_integral_err] = integrate.quad(_w_aux, u, np.inf,
-                                                      epsrel=1e-5)
-    return np.sqrt(np.pi) / u * aux_integral
+    density = get_precision().table_density
+    log_u_table, K_table = _K_table(density)
+    _, log_u_interp = _K_interpolants(density)
+    shape = np.shape(K)
+    K = np.atleast_1d(K).astype(float)
+    log_K = np.log(np.clip(K, K_table[-2], K_table[0]))
+    log_u = log_u_interp(log_K)
+    above = K > K_table[0]
+    log_u[above] = log_u_table[0] - (K[above]-K_table[0]) / \
+                   (_U_TABLE_MIN*_w(_U_TABLE_MIN))
+    return np.exp(log_u).reshape(shape)[()]
 
 def _G(u, uw):
     """
@@ -460,30 +680,15 @@ def _G(u, uw):
 
     Parameters
     ----------
-    u: float
-        Any positive real number.
+    u: float or ndarray
+        Any positive real number(s).
 
     Returns
     -------
     G(u, uw).
 
     """
-    # use this value instead of np.inf otherwise the integration results appear
-    # to be wrong; this value is safe for a realistic range of values of u
-    # (typically u < 5, while w decreases extremely fast beyond that)
-    effective_inf = 10
-    [cumul_tail, err_tail] = integrate.quad(_w, u, effective_inf, epsrel=1e-5)
-    if uw==1e-2:
-        cumul_all = 1.520 # pre-calculated to speed up this particular case
-    elif uw==1e-16:
-        cumul_all = 17.632 # pre-calculated to speed up this particular case
-    else:
-        [cumul_all, err_all] = integrate.quad(_w, uw, effective_inf,
-                                              epsrel=1e-5)
-    return cumul_tail/cumul_all
-
-def _func_root_G(u, x, uw):
-    return _G(u, uw) - x
+    return _K(u) / _K(uw)
 
 def _Ginv(x, uw):
     """
@@ -491,27 +696,22 @@ def _Ginv(x, uw):
 
     Parameters
     ----------
-    x: float
-        Any positive real number.
+    x: float or ndarray
+        Any positive real number(s).
 
     Returns
     -------
     Ginv(x).
 
+    Notes
+    -----
+    Since G(u, uw) = K(u)/K(uw), Ginv(x) = Kinv(x*K(uw)), and no root solving
+    is needed.
+
     """
-    # Set up bounds
-    if uw==0:
-        b1 = 1e-16
-    else:
-        b1 = 1.00001 * uw
-    b2 = 1e1
-    # Note: Another method (e.g. Newton) could be more efficient, but bisection
-    # is simple and robust, and we expect that efficiency will not be an issue
-    # in practice
-    sol = opt.root_scalar(_func_root_G, args=(x, uw), method='bisect',
-                          bracket=(b1, b2), rtol=1e-5)
-    return sol.root
+    return _Kinv(x * _K(uw))
 
+@instrumented
 def rinv_reldrawave(t, T, S, rw, alpha=0.01):
     """
     Calculate radius of investigation during drawdown based on a relative
@@ -550,16 +750,118 @@ def _wprime(u):
 
     Parameters
     ----------
-    u: float
-        Any positive real number.
+    u: float or ndarray
+        Any positive real number(s).
 
     Returns
     -------
     wprime(u).
 
     """
-    res = np.sqrt(np.pi) * np.exp(-2*u) * whittaker(4*u)
-    return float(res)
+    return np.sqrt(np.pi) * np.exp(-2*u) * whittaker(4*u)
+
+@instrumented
+def _Kprime(u):
+    """
+    Kprime function defined by Kprime(u) = int_u^inf(wprime).
+
+    Parameters
+    ----------
+    u: float or ndarray
+        Any positive real number(s).
+
+    Returns
+    -------
+    Kprime(u).
+
+    Notes
+    -----
+    Since wprime(u) = sqrt(pi)*exp(-2u)*W(4u) = 2u*exp(-2u)*(K0(2u)+K1(2u))
+    and d/dy(y*exp(-y)*K1(y)) = -y*exp(-y)*(K0(y)+K1(y)), the integral has
+    the closed form Kprime(u) = u*exp(-2u)*K1(2u) = u*w(u).
+
+    """
+    u = np.asarray(u, dtype=float)
+    with np.errstate(invalid='ignore'):
+        Kprime = u * _w(u)
+    # Limit for u -> 0
+    return np.where(u==0, 0.5, Kprime)[()]
+
+@functools.lru_cache(maxsize=None)
+def _Kprime_inv_interpolant(density=1.):
+    """
+    Monotone interpolant of ln(u) as a function of ln(Kprime).
+    """
+    from scipy.interpolate import PchipInterpolator # version 1.2.1
+    # Kprime ~ 1/2 - u is not resolved in double precision below u = 1e-8
+    log_u = _u_grid(1e-8, density)
+    log_Kprime = np.log(_Kprime(np.exp(log_u)))
+    return PchipInterpolator(log_Kprime[::-1], log_u[::-1])
+
+@functools.lru_cache(maxsize=None)
+def _Kprime_inv_error_table(density):
+    # Kprime has a closed form, so the error is measured directly inside the
+    # intervals of the grid
+    log_u = _u_grid(1e-8, density)
+    log_mid = _inner_points(log_u[:-1], log_u[1:])
+    log_u_interp = _Kprime_inv_interpolant(density)
+    error = np.abs(np.exp(log_u_interp(np.log(_Kprime(np.exp(log_mid)))) -
+                          log_mid) - 1)
+    return log_u[:-1], error.reshape(-1, 3).max(axis=1)
+
+def _Kprime_inv_error(u):
+    """
+    Interpolation error of Kprime_inv, measured inside the intervals of the
+    table grid, for the precision in effect.
+
+    Parameters
+    ----------
+    u: float or ndarray
+        Any positive real number(s).
+
+    Returns
+    -------
+    Relative error of Kprime_inv(Kprime(u)).
+
+    """
+    return _local_errors(*_Kprime_inv_error_table(
+        get_precision().table_density), u=u)
+
+@instrumented
+def _Kprime_inv(Kprime):
+    """
+    Inverse Kprime function.
+
+    Parameters
+    ----------
+    Kprime: float or ndarray
+        Any real number(s) between 0 and 1/2.
+
+    Returns
+    -------
+    Kprime_inv(Kprime).
+
+    Notes
+    -----
+    Kprime_inv is interpolated with a monotone cubic interpolant in log-log
+    space from Kprime tabulated on the same grid as K (truncated at
+    u = 1e-8), with a relative interpolation error below 2e-8 for u > 1e-6
+    with the default precision.
+    For smaller u, Kprime = 1/2 - u + O(u**2*ln(u)) and the problem becomes
+    ill-conditioned (the rounding error on Kprime alone causes a relative
+    error of about 1e-16/u). The error is then below 2e-7 for u > 1e-8, and
+    the linear asymptote is used below.
+
+    """
+    log_u_interp = _Kprime_inv_interpolant(get_precision().table_density)
+    shape = np.shape(Kprime)
+    Kprime = np.atleast_1d(Kprime).astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = np.exp(log_u_interp(np.log(Kprime)))
+    small = Kprime > _Kprime(1e-8)
+    u[small] = 0.5 - Kprime[small]
+    u[(Kprime <= 0) | (Kprime > 0.5)] = np.nan
+    return u.reshape(shape)[()]
 
 def _H(u, uw):
     """
@@ -567,20 +869,15 @@ def _H(u, uw):
 
     Parameters
     ----------
-    u: float
-        Any positive real number.
+    u: float or ndarray
+        Any positive real number(s).
 
     Returns
     -------
     H(u, uw).
 
     """
-    [cumul_tail, err_tail] = integrate.quad(_wprime, u, np.inf, epsrel=1e-5)
-    [cumul_all, err_all] = integrate.quad(_wprime, uw, np.inf, epsrel=1e-5)
-    return cumul_tail/cumul_all
-
-def _func_root_H(u, x, uw):
-    return _H(u, uw) - x
+    return _Kprime(u) / _Kprime(uw)
 
 def _Hinv(x, uw):
     """
@@ -588,27 +885,22 @@ def _Hinv(x, uw):
 
     Parameters
     ----------
-    x: float
-        Any positive real number.
+    x: float or ndarray
+        Any positive real number(s).
 
     Returns
     -------
     Hinv(x).
 
+    Notes
+    -----
+    Since H(u, uw) = Kprime(u)/Kprime(uw), Hinv(x) = Kprime_inv(x*Kprime(uw)),
+    and no root solving is needed.
+
     """
-    # Set up bounds
-    if uw==0:
-        b1 = 1e-16
-    else:
-        b1 = 1.00001 * uw
-    b2 = 1e1
-    # Note: Another method (e.g. Newton) could be more efficient, but bisection
-    # is simple and robust, and we expect that efficiency will not be an issue
-    # in practice
-    sol = opt.root_scalar(_func_root_H, args=(x, uw), method='bisect',
-                          bracket=(b1, b2), rtol=1e-5)
-    return sol.root
+    return _Kprime_inv(x * _Kprime(uw))
 
+@instrumented
 def rinv_reldrawderivave(t, T, S, rw, alpha=0.01):
     """
     Calculate radius of investigation during drawdown based on a relative
@@ -616,7 +908,7 @@ def rinv_reldrawderivave(t, T, S, rw, alpha=0.01):
 
     Parameters
     ----------
-    t: float
+    t: float or ndarray
         Time from beginning of pumping.
     T: float
         Transmissivity.
@@ -640,6 +932,7 @@ def rinv_reldrawderivave(t, T, S, rw, alpha=0.01):
     C = 2 * np.sqrt(_Hinv(alpha, uw))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_propbarrierregime_lin(t, T, S, alpha=0.5):
     """
     Calculate radius of investigation during drawdown based on a proportion of
@@ -669,6 +962,7 @@ def rinv_propbarrierregime_lin(t, T, S, alpha=0.5):
     C = np.sqrt(-np.log(alpha))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_propbarrierregime_log(t, T, S, alpha=0.5):
     """
     Calculate radius of investigation during drawdown based on a proportion of
@@ -697,6 +991,7 @@ def rinv_propbarrierregime_log(t, T, S, alpha=0.5):
     C = np.sqrt(-np.log(np.power(2, alpha)-1))
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_consthead(t, T, S):
     """
     Calculate radius of investigation during drawdown based on semi-empirical
@@ -723,6 +1018,7 @@ def rinv_consthead(t, T, S):
     C = 2.64
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_closedres(t, T, S):
     """
     Calculate radius of investigation during drawdown based on intersection of
@@ -749,6 +1045,7 @@ def rinv_closedres(t, T, S):
     C = 2
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_linearbarr(t, T, S):
     """
     Calculate radius of investigation during drawdown based on intersection of
@@ -775,6 +1072,7 @@ def rinv_linearbarr(t, T, S):
     C = 0.75
     return C * np.sqrt(T*t/S)
 
+@instrumented
 def rinv_impulse(t, T, S):
     """
     Calculate radius of investigation during drawdown based on impulse response
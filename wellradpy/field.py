@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import functools
+import warnings
+import numpy as np # version 1.16.2
+from .utils import E1
+from .profiling import instrumented
+
+###############################################################################
+# Drawdown field
+###############################################################################
+
+# Beyond u = 50, E1(u) < 4e-24 and the contribution of a well is neglected
+_U_MAX = 50.
+
+# Bounds and density of the logarithmic grid used to tabulate E1
+_E1_TABLE_MIN = 1e-12
+_E1_TABLE_POINTS_PER_UNIT = 128 # number of points per unit of ln(u)
+
+@functools.lru_cache(maxsize=None)
+def _E1_table():
+    """
+    Tabulate G(u) = exp(u)*E1(u) against ln(u).
+
+    Returns
+    -------
+    Start and step of the grid of ln(u), and coefficients of the cubic
+    polynomials in the fractional position f within each interval, from the
+    constant one to the cubic one.
+
+    """
+    n = int(round(np.log(_U_MAX/_E1_TABLE_MIN) * _E1_TABLE_POINTS_PER_UNIT))
+    log_u, step = np.linspace(np.log(_E1_TABLE_MIN), np.log(_U_MAX), n+1,
+                              retstep=True)
+    u = np.exp(log_u)
+    G = np.exp(u) * E1(u)
+    # Derivative of G with respect to ln(u), times the step
+    D = (u*G - 1) * step
+    return log_u[0], step, (G[:-1], D[:-1],
+                            3*(G[1:] - G[:-1]) - 2*D[:-1] - D[1:],
+                            2*(G[:-1] - G[1:]) + D[:-1] + D[1:])
+
+def _E1_fast(u):
+    """
+    Exponential integral function, interpolated from a table.
+
+    Parameters
+    ----------
+    u: ndarray
+        Positive real numbers.
+
+    Returns
+    -------
+    Exponential integral of u.
+
+    Notes
+    -----
+    exp(u)*E1(u), which is smooth and varies like -ln(u) for small u and
+    like 1/u for large u, is interpolated with cubic Hermite polynomials in
+    ln(u), with a relative error below 1e-11. Below the table,
+    E1(u) = -gamma - ln(u) is exact to 1e-12. Beyond the table, exp(u)*E1(u)
+    is taken constant, which only matters below E1(50) = 4e-24. The cost is
+    about 40 ns per element whatever u, whereas the continued fraction used
+    by scipy.special.exp1 for u > 1 takes up to 600 ns.
+
+    """
+    log_u_min, step, (c0, c1, c2, c3) = _E1_table()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_u = np.log(u)
+        f = np.clip((log_u - log_u_min) / step, 0, c0.size)
+        # (NaN values give NaN results)
+        i = np.clip(f.astype(np.intp), 0, c0.size - 1)
+        f -= i
+        G = c3[i]
+        G *= f
+        G += c2[i]
+        G *= f
+        G += c1[i]
+        G *= f
+        G += c0[i]
+        G *= np.exp(-u)
+    small = u < _E1_TABLE_MIN
+    if np.any(small):
+        G[small] = -np.euler_gamma - log_u[small]
+    return G
+
+@instrumented
+def drawdown_field(x, y, t, T, S, xw, yw, Q, rw=0., out=None,
+                   max_elements=2**16):
+    """
+    Calculate the drawdown of several pumping wells on a grid, by
+    superposition of Theis solutions.
+
+    Parameters
+    ----------
+    x: ndarray
+        Coordinates of the columns of the grid (1D, increasing).
+    y: ndarray
+        Coordinates of the rows of the grid (1D, increasing).
+    t: float
+        Time from beginning of pumping.
+    T: float
+        Transmissivity.
+    S: float
+        Storativity.
+    xw, yw: float or ndarray
+        Coordinates of the wells.
+    Q: float or ndarray
+        Pumping rates of the wells.
+    rw: float, optional
+        Well radius, below which the distance to a well is clipped (the
+        drawdown is infinite at a well with the default rw = 0).
+    out: ndarray, optional
+        Array of shape (len(y), len(x)) where the drawdown is written (e.g. a
+        numpy.memmap for very large grids).
+    max_elements: int, optional
+        Maximum number of (cell, well) pairs evaluated at once, which bounds
+        the memory used.
+
+    Returns
+    -------
+    Drawdown, with shape (len(y), len(x)).
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    The drawdown is s = sum(Q/(4*pi*T)*E1(r**2*S/(4*T*t))) over the wells,
+    r being the distance to each well. The grid is processed by blocks of
+    rows, and only the wells closer to a block than the distance where
+    u = r**2*S/(4*T*t) reaches 50 (beyond which E1(u) < 4e-24) are included.
+    E1 is interpolated from a table built with utils.E1 (relative error
+    below 1e-11), at a cost of about 25 ns per (cell, well) pair.
+
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xw, yw, Q = [np.ravel(a).astype(float)
+                 for a in np.broadcast_arrays(xw, yw, Q)]
+    if out is None:
+        out = np.empty((y.size, x.size))
+    nx = max(x.size, 1)
+    well_block = max(1, min(xw.size, max_elements // nx))
+    row_block = max(1, max_elements // (nx * well_block))
+    r_max = np.sqrt(_U_MAX*4*T*t/S)
+    # u = (dx**2 + dy**2)*S/(4*T*t), with dx and dy the distances to the
+    # wells along x and y
+    a = S/(4*T*t)
+    ux = a * (x[:,None] - xw)**2
+    uy = a * (y[:,None] - yw)**2
+    for start in range(0, y.size, row_block):
+        stop = min(start + row_block, y.size)
+        s = np.zeros((stop - start, x.size))
+        near = np.flatnonzero((yw > y[start] - r_max) &
+                              (yw < y[stop-1] + r_max))
+        for i in range(0, near.size, well_block):
+            wells = near[i:i+well_block]
+            u = ux[None,:,wells] + uy[start:stop,None,wells]
+            np.maximum(u, a*rw**2, out=u)
+            s += np.dot(_E1_fast(u), Q[wells])
+        out[start:stop] = s/(4*np.pi*T)
+    return out
+
+###############################################################################
+# Contours
+###############################################################################
+
+def _contour_cells(x, y, field, level):
+    """
+    Marching squares on the cells of a block of the grid (see contour).
+    """
+    # Values at the corners of the cells, counterclockwise from the lower
+    # left corner (rows along y, columns along x)
+    values = [field[:-1,:-1], field[:-1,1:], field[1:,1:], field[1:,:-1]]
+    with np.errstate(invalid='ignore'):
+        above = [v >= level for v in values]
+    entries = [above[k] & ~above[(k+1)%4] for k in range(4)]
+    exits = [~above[k] & above[(k+1)%4] for k in range(4)]
+    saddle = (above[0] == above[2]) & (above[1] == above[3]) & \
+             (above[0] != above[1])
+
+    def crossing(k, i, j):
+        # Point where edge k (from corner k to corner k+1) of cells (i, j)
+        # crosses the level
+        corners = [(j, i), (j+1, i), (j+1, i+1), (j, i+1)]
+        (ja, ia), (jb, ib) = corners[k], corners[(k+1)%4]
+        va = field[ia,ja]
+        vb = field[ib,jb]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            f = (level - va) / (vb - va)
+        f = np.where(np.isinf(va), 1., np.where(np.isinf(vb), 0., f))
+        f = np.where(np.isnan(f), 0.5, f)
+        return np.stack((x[ja] + f*(x[jb] - x[ja]),
+                         y[ia] + f*(y[ib] - y[ia])), axis=-1)
+
+    segments = []
+    for k in range(4):
+        i, j = np.nonzero(entries[k])
+        # The segment from edge k ends on the only exit edge of the cell,
+        # except in ambiguous cells, where it cuts off corner k if the center
+        # is below the level, and corner k+1 otherwise
+        exit_edge = np.argmax([e[i,j] for e in exits], axis=0) \
+                    if i.size else np.zeros(0, dtype=int)
+        ambiguous = np.flatnonzero(saddle[i,j])
+        ia, ja = i[ambiguous], j[ambiguous]
+        with np.errstate(invalid='ignore'):
+            center_above = (field[ia,ja] + field[ia,ja+1] + field[ia+1,ja+1] +
+                            field[ia+1,ja]) / 4 >= level
+        exit_edge[ambiguous] = np.where(center_above, k+1, k-1) % 4
+        end = np.empty((i.size, 2))
+        for e in range(4):
+            selected = exit_edge == e
+            end[selected] = crossing(e, i[selected], j[selected])
+        segments.append(np.stack((crossing(k, i, j), end), axis=1))
+    return np.concatenate(segments)
+
+@instrumented
+def contour(x, y, field, level, closed=False, max_cells=2**20):
+    """
+    Extract a contour line of a field on a grid, with the marching squares
+    algorithm.
+
+    Parameters
+    ----------
+    x: ndarray
+        Coordinates of the columns of the grid (1D, increasing).
+    y: ndarray
+        Coordinates of the rows of the grid (1D, increasing).
+    field: ndarray
+        Values on the grid, with shape (len(y), len(x)).
+    level: float
+        Value of the contour.
+    closed: bool, optional
+        Whether to close the contour along the edges of the grid, around the
+        areas where the field is above the level.
+    max_cells: int, optional
+        Maximum number of cells processed at once, which bounds the memory
+        used.
+
+    Returns
+    -------
+    Segments of the contour, as an array of shape (n, 2, 2) giving the (x, y)
+    coordinates of their start and end points. They are oriented so that the
+    field is above the level on their left, i.e. counterclockwise around the
+    areas above the level.
+
+    Notes
+    -----
+    The crossing points are interpolated linearly along the edges of the
+    cells (at the finite corner next to infinite values). Ambiguous cells,
+    with two opposite corners above the level, are resolved with the mean of
+    the four corners. The cells are processed by blocks of rows, without
+    joining the segments into polylines.
+
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    field = np.asarray(field, dtype=float)
+    if closed:
+        # Border of values below the level, on degenerate cells
+        x = np.concatenate((x[:1], x, x[-1:]))
+        y = np.concatenate((y[:1], y, y[-1:]))
+        field = np.pad(field, 1, mode='constant', constant_values=-np.inf)
+    rows = max(1, max_cells // max(x.size, 1))
+    segments = [np.zeros((0, 2, 2))]
+    for start in range(0, y.size - 1, rows):
+        stop = min(start + rows, y.size - 1) + 1
+        segments.append(_contour_cells(x, y[start:stop], field[start:stop],
+                                       level))
+    return np.concatenate(segments)
+
+def enclosed_area(segments):
+    """
+    Calculate the area enclosed by a closed contour.
+
+    Parameters
+    ----------
+    segments: ndarray
+        Segments of the contour, as returned by contour with closed=True.
+
+    Returns
+    -------
+    Area on the left of the segments (above the level of the contour).
+
+    """
+    (x1, y1), (x2, y2) = np.moveaxis(segments, (1, 2), (0, 1))
+    return 0.5 * np.sum(x1*y2 - x2*y1)
+
+###############################################################################
+# Radius of influence of a wellfield
+###############################################################################
+
+@instrumented
+def rinfl_absdraw(x, y, t, T, S, xw, yw, Q, sc=0.05, rw=0.,
+                  max_elements=2**16):
+    """
+    Calculate the effective radius of influence of a wellfield based on an
+    absolute drawdown criterion.
+
+    Parameters
+    ----------
+    x: ndarray
+        Coordinates of the columns of the grid (1D, increasing), which must
+        cover the area of influence.
+    y: ndarray
+        Coordinates of the rows of the grid (1D, increasing).
+    t: float
+        Time from beginning of pumping.
+    T: float
+        Transmissivity.
+    S: float
+        Storativity.
+    xw, yw: float or ndarray
+        Coordinates of the wells.
+    Q: float or ndarray
+        Pumping rates of the wells.
+    sc: float, optional
+        Absolute drawdown threshold.
+    rw: float, optional
+        Well radius (see drawdown_field).
+    max_elements: int, optional
+        Maximum number of (cell, well) pairs evaluated at once.
+
+    Returns
+    -------
+    Radius of the disk with the same area as the area where the drawdown
+    exceeds sc.
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    For a single well, this is the radius given by
+    drawdown.rinfl_absdraw(t, T, S, Q, sc), up to the resolution of the
+    grid. A warning is issued if the area of influence reaches the edges of
+    the grid, in which case the radius is underestimated.
+
+    """
+    field = drawdown_field(x, y, t, T, S, xw, yw, Q, rw=rw,
+                           max_elements=max_elements)
+    edges = np.concatenate((field[0], field[-1], field[:,0], field[:,-1]))
+    if np.any(edges >= sc):
+        warnings.warn('The area of influence reaches the edges of the grid, '
+                      'the radius of influence is underestimated')
+    area = enclosed_area(contour(x, y, field, sc, closed=True))
+    return np.sqrt(area/np.pi)
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import collections
+import inspect
+import numpy as np # version 1.16.2
+from . import drawdown, recovery
+from .utils import E1
+
+# The derivatives are calculated from the logarithmic derivatives of the
+# radii, d(ln r)/dp, which are sums of terms coef*d(ln g)/dp for the
+# dimensionless groups g of the radius (e.g. sc_star = 4*pi*T*sc/Q). The
+# dimensionless roots (e.g. u = E1inv(sc_star)) are differentiated
+# implicitly from the equations that define them, and are recovered from the
+# value of the radius, so that no equation is solved again.
+
+def _d_log(name, value):
+    # Logarithmic derivative of a parameter
+    return {name: 1/value}
+
+def _d_sc_star(p):
+    return {'T': 1/p['T'], 'sc': 1/p['sc'], 'Q': -1/p['Q']}
+
+def _d_uw(p):
+    return {'S': 1/p['S'], 'rw': 2/p['rw'], 'T': -1/p['T'], 't': -1/p['t']}
+
+def _d_t_star(p):
+    return {'t': 1/p['t'], 'tp': -1/p['tp']}
+
+def _sum(*terms):
+    """
+    Sum terms of the form (coef, d(ln g)/dp by parameter p).
+    """
+    res = {}
+    for coef, d_log_g in terms:
+        for name, d in d_log_g.items():
+            res[name] = res.get(name, 0.) + coef*d
+    return res
+
+###############################################################################
+# Drawdown radii, r = C*sqrt(T*t/S)
+###############################################################################
+
+def _u(p, r, factor):
+    # Dimensionless root u = (r/factor)**2*S/(T*t) for C = factor*sqrt(u)
+    return r**2 * p['S'] / (factor**2 * p['T']*p['t'])
+
+def _absdraw(factor):
+    def d_log_C(p, r):
+        # E1(u) = sc_star, with dE1/du = -exp(-u)/u
+        u = _u(p, r, factor)
+        sc_star = 4*np.pi*p['T']*p['sc']/p['Q']
+        return _sum((-0.5*np.exp(u + np.log(sc_star)), _d_sc_star(p)))
+    return d_log_C
+
+def _reldraw(factor):
+    def d_log_C(p, r):
+        # E1(u) = alpha*E1(uw)
+        u = _u(p, r, factor)
+        uw = p['S']*p['rw']**2/(4*p['T']*p['t'])
+        alpha = p['alpha']
+        return _sum((-0.5*np.exp(u + np.log(alpha*E1(uw))),
+                     _d_log('alpha', alpha)),
+                    (0.5*alpha*np.exp(u - uw), _d_uw(p)))
+    return d_log_C
+
+def _log_alpha(p, r):
+    # C proportional to sqrt(-ln(alpha))
+    alpha = p['alpha']
+    return {'alpha': 0.5/(alpha*np.log(alpha))}
+
+def _relvol(p, r):
+    # F(u) = alpha, with dF/du = -E1(u)
+    u = _u(p, r, 2)
+    return {'alpha': -0.5/(u*E1(u))}
+
+def _absdrawderivdiff(p, r):
+    # C**2 = -ln(sqrt(2)*sc_star/delta)
+    C_sq = _u(p, r, 1)
+    return _sum((-0.5/C_sq, _d_sc_star(p)),
+                (0.5/C_sq, _d_log('delta', p['delta'])))
+
+def _reldrawderivdiff(p, r):
+    # C**2 = uw - ln(alpha)
+    C_sq = _u(p, r, 1)
+    uw = p['S']*p['rw']**2/(4*p['T']*p['t'])
+    return _sum((0.5*uw/C_sq, _d_uw(p)),
+                (-0.5/C_sq, _d_log('alpha', p['alpha'])))
+
+def _ave(K, w):
+    def d_log_C(p, r):
+        # K(u) = alpha*K(uw), with dK/du = -w(u)
+        u = _u(p, r, 2)
+        uw = p['S']*p['rw']**2/(4*p['T']*p['t'])
+        alpha = p['alpha']
+        u_w = u*w(u)
+        return _sum((-0.5*alpha*K(uw)/u_w, _d_log('alpha', alpha)),
+                    (0.5*alpha*uw*w(uw)/u_w, _d_uw(p)))
+    return d_log_C
+
+def _propbarrierregime_log(p, r):
+    # C**2 = -ln(2**alpha - 1)
+    C_sq = _u(p, r, 1)
+    alpha = p['alpha']
+    return {'alpha': -0.5*np.log(2.)/((1 - np.power(2., -alpha))*C_sq)}
+
+def _constant(p, r):
+    return {}
+
+_DRAWDOWN = {
+    'rinfl_absdraw': _absdraw(2),
+    'rinfl_reldraw': _reldraw(2),
+    'rinfl_relflow': _log_alpha,
+    'rinfl_relvol': _relvol,
+    'rinfl_quasisteady': _constant,
+    'rinfl_jones': _constant,
+    'rinfl_closedres': _constant,
+    'rinfl_impulse': _constant,
+    'rinfl_log': _constant,
+    'rinv_absdrawdiff': _absdraw(1),
+    'rinv_absdrawderivdiff': _absdrawderivdiff,
+    'rinv_reldrawdiff': _reldraw(1),
+    'rinv_reldrawderivdiff': _reldrawderivdiff,
+    'rinv_reldrawave': _ave(drawdown._K, drawdown._w),
+    'rinv_reldrawderivave': _ave(drawdown._Kprime, drawdown._wprime),
+    'rinv_propbarrierregime_lin': _log_alpha,
+    'rinv_propbarrierregime_log': _propbarrierregime_log,
+    'rinv_consthead': _constant,
+    'rinv_closedres': _constant,
+    'rinv_linearbarr': _constant,
+    'rinv_impulse': _constant,
+}
+
+def _drawdown_d_log(name, p, r):
+    return _sum((1., _DRAWDOWN[name](p, r)),
+                (0.5, {'T': 1/p['T'], 't': 1/p['t'], 'S': -1/p['S']}))
+
+###############################################################################
+# Recovery
+###############################################################################
+
+def _d_rp(p):
+    # rp = sqrt(T*tp/S)
+    return {'T': 0.5/p['T'], 'tp': 0.5/p['tp'], 'S': -0.5/p['S']}
+
+def _rinv_d_log(p, r):
+    # E1(a) - E1(b) = sc_star with a = v/t_star and b = v/(t_star-1), where
+    # v = rinv_star**2. The derivatives of the barrier effect with respect to
+    # ln(v) and ln(t_star), exp(-b) - exp(-a) and exp(-a) -
+    # exp(-b)*t_star/(t_star-1), are divided by exp(-a) to avoid underflows
+    v = r**2 * p['S'] / (p['T']*p['tp'])
+    t_star = p['t']/p['tp']
+    sc_star = 4*np.pi*p['T']*p['sc']/p['Q']
+    a = v/t_star
+    a_m_b = -v/(t_star*(t_star-1))
+    d_v = np.expm1(a_m_b)
+    d_t_star = 1 - np.exp(a_m_b)*t_star/(t_star-1)
+    return _sum((0.5*np.exp(a + np.log(sc_star))/d_v, _d_sc_star(p)),
+                (-0.5*d_t_star/d_v, _d_t_star(p)),
+                (1., _d_rp(p)))
+
+def _log1p_minus(y, c):
+    """
+    ln(1+y) - y/(1+y) (c=1) or ln(1+y) - y (c=0), with a series for small y
+    where the difference cancels.
+    """
+    with np.errstate(over='ignore', invalid='ignore'):
+        direct = np.log1p(y) - y/(1 + c*y)
+    if c == 1:
+        series = y**2*(1/2. - y*(2/3. - y*(3/4. - y*4/5.)))
+    else:
+        series = -y**2*(1/2. - y*(1/3. - y*(1/4. - y/5.)))
+    return np.where(y < 1e-4, series, direct)
+
+def _d_tmax_star_m1(sc_star):
+    """
+    tmax_star-1 and its derivative with respect to ln(sc_star), from the
+    barrier effect at tmax g(m) = E1(m*L) - E1((1+m)*L), with m =
+    tmax_star-1 and L = ln(1+1/m).
+    """
+    m = recovery._tmax_star_m1(sc_star)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        y = 1/m
+        L = np.log1p(y)
+        # d(m*L)/dm = L - 1/(1+m) and d((1+m)*L)/dm = L - 1/m
+        dg = -np.exp(-m*L)/(m*L) * _log1p_minus(y, 1) + \
+             np.exp(-(1+m)*L)/((1+m)*L) * _log1p_minus(y, 0)
+        d_m = np.where(m > 0, sc_star/dg, 0.)
+    return m, d_m
+
+def _tmax_d_log(p, m, d_m):
+    # tmax = (1+m)*tp
+    return _sum((d_m/(1+m), _d_sc_star(p)), (1., _d_log('tp', p['tp'])))
+
+def _rinvmax_d_log(p, m, d_m):
+    # rinvmax = sqrt((1+m)*m*L)*rp
+    with np.errstate(divide='ignore', invalid='ignore'):
+        L = np.log1p(1/m)
+        d_log_v = ((1+2*m)*L - 1) / ((1+m)*m*L)
+    return _sum((0.5*d_log_v*d_m, _d_sc_star(p)), (1., _d_rp(p)))
+
+def _tend_d_log(p):
+    # tend = tp/(1-exp(-sc_star))
+    sc_star = 4*np.pi*p['T']*p['sc']/p['Q']
+    return _sum((-sc_star/np.expm1(sc_star), _d_sc_star(p)),
+                (1., _d_log('tp', p['tp'])))
+
+def _recovery_d_log(name, p, value):
+    if name == 'rinv':
+        return _rinv_d_log(p, value)
+    if name == 'tend':
+        return _tend_d_log(p)
+    m, d_m = _d_tmax_star_m1(4*np.pi*p['T']*p['sc']/p['Q'])
+    if name == 'tmax':
+        return _tmax_d_log(p, m, d_m)
+    if name == 'rinvmax':
+        return _rinvmax_d_log(p, m, d_m)
+    return (_tmax_d_log(p, m, d_m), _rinvmax_d_log(p, m, d_m),
+            _tend_d_log(p))
+
+_RECOVERY = ('rinv', 'tmax', 'rinvmax', 'tend', 'characteristics')
+
+###############################################################################
+# Gradients and Jacobians
+###############################################################################
+
+def _derivatives(value, d_log, names):
+    """
+    Derivatives of a value from its logarithmic derivatives, for all the
+    parameters (0 where the value is 0, e.g. after the end of a recovery
+    test).
+    """
+    value = np.asarray(value, dtype=float)
+    res = collections.OrderedDict()
+    for name in names:
+        with np.errstate(invalid='ignore'):
+            d = np.where(value == 0, 0., value * d_log.get(name, 0.))
+        res[name] = np.broadcast_to(d, value.shape).copy()[()]
+    return res
+
+def gradient(func, *args, **kwargs):
+    """
+    Call a function of the drawdown or recovery module and calculate the
+    derivatives of the result with respect to its parameters.
+
+    Parameters
+    ----------
+    func: callable
+        Function of the drawdown module, or recovery.rinv, recovery.tmax,
+        recovery.rinvmax, recovery.tend or recovery.characteristics.
+    *args, **kwargs:
+        Parameters of the function.
+
+    Returns
+    -------
+    Value of the function, and OrderedDict of its partial derivatives by
+    parameter name, for all the parameters including the thresholds (e.g.
+    {'t': dr/dt, 'T': dr/dT, 'S': dr/dS, 'Q': dr/dQ, 'sc': dr/dsc}), with the
+    shape of the value. For recovery.characteristics, tuples of the values
+    and of the dictionaries.
+
+    Notes
+    -----
+    The derivatives are calculated by implicit differentiation of the
+    equations defining the radii (e.g. E1(u) = sc_star, F(u) = alpha,
+    K(u) = alpha*K(uw) or the barrier effect during recovery), from the
+    value of the function, which costs a few closed-form evaluations per
+    element. They are thus exact up to the tolerance of the root solves and
+    the interpolation errors of the tables, unlike finite differences.
+
+    The parameters are broadcast against each other, and the derivatives
+    are elementwise: the derivative with respect to an array parameter of a
+    smaller shape than the value is to be summed over the broadcast axes.
+
+    """
+    module = func.__module__.split('.')[-1]
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    params = bound.arguments
+    if not ((module == 'drawdown' and func.__name__ in _DRAWDOWN) or
+            (module == 'recovery' and func.__name__ in _RECOVERY)):
+        raise ValueError('Gradients are not available for %s.%s'
+                         % (module, func.__name__))
+    value = func(*args, **kwargs)
+    p = dict((name, np.asarray(v, dtype=float)) for name, v in params.items())
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if module == 'drawdown':
+            d_log = _drawdown_d_log(func.__name__, p, value)
+        else:
+            d_log = _recovery_d_log(func.__name__, p, value)
+    if isinstance(value, tuple):
+        return value, tuple(_derivatives(v, d, params)
+                            for v, d in zip(value, d_log))
+    return value, _derivatives(value, d_log, params)
+
+def jacobian(func, *args, **kwargs):
+    """
+    Call a function of the drawdown or recovery module and calculate its
+    Jacobian with respect to its parameters.
+
+    Parameters
+    ----------
+    func: callable
+        Function of the drawdown module, or recovery.rinv, recovery.tmax,
+        recovery.rinvmax or recovery.tend.
+    *args, **kwargs:
+        Parameters of the function.
+
+    Returns
+    -------
+    Value of the function, Jacobian of shape value.shape + (n,) whose last
+    axis follows the order of the n parameters of the function (including
+    the thresholds), and names of the parameters.
+
+    """
+    value, derivatives = gradient(func, *args, **kwargs)
+    if isinstance(value, tuple):
+        raise ValueError('Use gradient for functions returning tuples')
+    names = list(derivatives)
+    J = np.stack([np.asarray(derivatives[name]) for name in names], axis=-1)
+    return value, J, names
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from .utils import E1, E1inv, hantush
+from .solvers import bracket_root
+from .profiling import instrumented
+from .precision import get_precision
+
+# Radius functions for leaky aquifers (Hantush-Jacob solution), with B the
+# leakage factor, B = sqrt(T*b'/K') for an aquitard of thickness b' and
+# vertical hydraulic conductivity K'. Since u = r**2*S/(4*T*t) and
+# beta = r/B, beta**2/(4*u) = T*t/(S*B**2) =: rho does not depend on r, and
+# the drawdown at a distance r is proportional to W(u, 2*sqrt(u*rho)).
+
+def _rho(t, T, S, B):
+    return T*t/(S*B**2)
+
+def _func_root_u(u, x, rho):
+    # W underflows to 0 for u+rho > 745, where it is smaller than x anyway
+    W = hantush(u, 2*np.sqrt(u*rho))
+    return np.log(np.maximum(W, np.finfo(float).tiny)) - np.log(x)
+
+def _log_slope(u, rho):
+    """
+    Logarithmic derivative d(ln W)/d(ln u) along beta = 2*sqrt(u*rho), by
+    central differences (used for the condition number of _hantush_inv).
+    """
+    h = 1e-4
+    W = [hantush(u*np.exp(k*h), 2*np.sqrt(u*np.exp(k*h)*rho)) for k in (-1, 1)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (np.log(W[1]) - np.log(W[0])) / (2*h)
+
+def _hantush_inv(x, rho):
+    """
+    Inverse of the leaky well function along beta = 2*sqrt(u*rho).
+
+    Parameters
+    ----------
+    x: float or ndarray
+        Any positive real number(s).
+    rho: float or ndarray
+        Any nonnegative real number(s).
+
+    Returns
+    -------
+    u such that W(u, 2*sqrt(u*rho)) = x.
+
+    Notes
+    -----
+    W decreases with u along beta = 2*sqrt(u*rho), and the roots are found
+    together by bracketing. Since exp(-rho)*E1(u) <= W <= E1(u), they lie
+    between E1inv(x*exp(rho)) and E1inv(x). The first bound becomes loose
+    (or overflows) for large rho, where the bound obtained from
+    W(u, beta) >= 2*K0(beta) - E1(rho) and K0(y) >= -ln(y/2) - gamma,
+    u >= exp(-x - 2*gamma - E1(rho))/rho, is used instead.
+
+    """
+    x, rho = np.broadcast_arrays(np.asarray(x, dtype=float),
+                                 np.asarray(rho, dtype=float))
+    upper = E1inv(x)
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        lower = np.fmax(E1inv(x*np.exp(rho)),
+                        np.exp(-x - 2*np.euler_gamma - E1(rho))/rho)
+    lower = np.clip(lower, 1e-300, upper)
+    return bracket_root(_func_root_u, lower, upper, args=(x, rho),
+                        rtol=get_precision().rtol)
+
+@instrumented
+def rinfl_absdraw(t, T, S, Q, B, sc=0.05):
+    """
+    Calculate radius of influence during drawdown in a leaky aquifer based on
+    an absolute drawdown criterion.
+
+    Parameters
+    ----------
+    t: float
+        Time from beginning of pumping.
+    T: float
+        Transmissivity.
+    S: float
+        Storativity.
+    Q: float
+        Pumping rate.
+    B: float
+        Leakage factor.
+    sc: float, optional
+        Absolute drawdown threshold.
+
+    Returns
+    -------
+    Radius of influence.
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    The radius tends to the one of drawdown.rinfl_absdraw for large B, and to
+    a steady state (2*K0(r/B) = 4*pi*T*sc/Q) for large t.
+
+    """
+    sc_star = 4*np.pi*T*sc/Q
+    C = 2 * np.sqrt(_hantush_inv(sc_star, _rho(t, T, S, B)))
+    return C * np.sqrt(T*t/S)
+
+@instrumented
+def rinfl_reldraw(t, T, S, rw, B, alpha=0.01):
+    """
+    Calculate radius of influence during drawdown in a leaky aquifer based on
+    a relative drawdown criterion.
+
+    Parameters
+    ----------
+    t: float
+        Time from beginning of pumping.
+    T: float
+        Transmissivity.
+    S: float
+        Storativity.
+    rw: float
+        Well radius.
+    B: float
+        Leakage factor.
+    alpha: float, optional
+        Drawdown threshold relative to drawdown at the well.
+
+    Returns
+    -------
+    Radius of influence.
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    """
+    uw = S*rw**2/(4*T*t)
+    rho = _rho(t, T, S, B)
+    C = 2 * np.sqrt(_hantush_inv(alpha*hantush(uw, rw/B), rho))
+    return C * np.sqrt(T*t/S)
+
+@instrumented
+def rinv_absdrawdiff(t, T, S, Q, B, sc=0.05):
+    """
+    Calculate radius of investigation during drawdown in a leaky aquifer
+    based on an absolute drawdown difference criterion.
+
+    Parameters
+    ----------
+    t: float
+        Time from beginning of pumping.
+    T: float
+        Transmissivity.
+    S: float
+        Storativity.
+    Q: float
+        Pumping rate.
+    B: float
+        Leakage factor.
+    sc: float, optional
+        Absolute drawdown difference threshold.
+
+    Returns
+    -------
+    Radius of investigation.
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    As for drawdown.rinv_absdrawdiff, the drawdown difference at the well is
+    the drawdown of the image well of a barrier at the distance r, i.e. at
+    the distance 2*r.
+
+    """
+    sc_star = 4*np.pi*T*sc/Q
+    C = np.sqrt(_hantush_inv(sc_star, _rho(t, T, S, B)))
+    return C * np.sqrt(T*t/S)
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import functools
+import numpy as np # version 1.16.2
+from . import drawdown
+from .criteria import CRITERIA
+from .solvers import bracket_root
+from .precision import get_precision
+
+# Every radius returned by the functions of the drawdown module is of the form
+# C * sqrt(T*t/S), where the dimensionless coefficient C depends on the
+# thresholds and, for some criteria, on one dimensionless group:
+# sc_star = 4*pi*T*sc/Q or uw = S*rw**2/(4*T*t). The coefficient is obtained by
+# evaluating the criterion with t = T = S = 1, and with Q = 4*pi (so that
+# sc_star = sc) or rw = 2*sqrt(uw) (so that the well radius gives uw).
+
+# Ranges and density of the logarithmic grids used to tabulate the
+# coefficients (values outside of these ranges are calculated directly)
+_TABLE_RANGES = {'sc_star': (1e-12, 1e1), 'uw': (1e-30, 1e1)}
+_TABLE_POINTS_PER_UNIT = 40 # number of points per unit of ln(group)
+
+# Range of uw searched when calculating the time needed to reach a radius
+# (the averaged criteria are not resolved beyond uw = 45)
+_UW_BRACKET = (1e-30, 40.)
+
+class RadiusPlan(object):
+    """
+    Reusable plan to calculate a radius for many parameter values with a
+    given criterion and given thresholds.
+
+    Parameters
+    ----------
+    criterion: str
+        Name of a radius function of the drawdown module (e.g.
+        'rinfl_absdraw').
+    **thresholds: float, optional
+        Thresholds of the criterion (e.g. sc, alpha), with the same defaults
+        as the radius function, and parameters other than Q and rw (i.e.
+        delta, which is required by rinv_absdrawderivdiff).
+
+    Attributes
+    ----------
+    args: tuple of str
+        Names of the parameters expected after t, T and S when calling the
+        plan: ('Q',) for criteria depending on sc_star, ('rw',) for criteria
+        depending on uw, and () otherwise.
+
+    Notes
+    -----
+    The coefficient C of the radius C * sqrt(T*t/S) is calculated once when
+    the plan is created, or tabulated when it depends on sc_star or uw and
+    involves a root solve. In the latter case, it is interpolated with a
+    cubic spline in log-log space, with a relative error below 2e-7 (values
+    of sc_star or uw outside of the tabulated ranges are calculated
+    directly). Calling the plan on arrays of parameters then requires no
+    further solving. Plans can be pickled, e.g. to be sent to worker
+    processes.
+
+    Examples
+    --------
+    >>> plan = RadiusPlan('rinfl_absdraw', sc=0.05)
+    >>> r = plan(t, T, S, Q)
+    >>> t = plan.time(r, T, S, Q)
+
+    """
+
+    def __init__(self, criterion, **thresholds):
+        if criterion not in CRITERIA:
+            raise ValueError('Unknown criterion: %s' % criterion)
+        # Parameters other than Q and rw (e.g. delta) are fixed by the plan
+        missing = [param for param in CRITERIA[criterion].params
+                   if param not in ('Q', 'rw') and param not in thresholds]
+        if missing:
+            raise ValueError('Criterion %s requires the parameter(s) %s to '
+                             'be given to the plan'
+                             % (criterion, ', '.join(missing)))
+        self.criterion = criterion
+        self.thresholds = thresholds
+        self.group = CRITERIA[criterion].group
+        if self.group == 'sc_star':
+            self.args = ('Q',)
+        elif self.group == 'uw':
+            self.args = ('rw',)
+        else:
+            self.args = ()
+        self._C = None
+        self._log_group = None
+        self._log_C = None
+        self._spline = None
+        if self.group is None:
+            self._C = float(self.coefficient())
+        elif CRITERIA[criterion].cost != 'closed-form':
+            group_min, group_max = _TABLE_RANGES[self.group]
+            n = int(round(np.log(group_max/group_min) *
+                          _TABLE_POINTS_PER_UNIT))
+            self._log_group = np.linspace(np.log(group_min),
+                                          np.log(group_max), n+1)
+            C = self._coefficient(np.exp(self._log_group))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self._log_C = np.log(C)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_spline'] = None
+        return state
+
+    def __repr__(self):
+        thresholds = ''.join(', %s=%r' % item
+                             for item in sorted(self.thresholds.items()))
+        return 'RadiusPlan(%r%s)' % (self.criterion, thresholds)
+
+    def _coefficient(self, group):
+        func = getattr(drawdown, self.criterion)
+        if self.group == 'sc_star':
+            thresholds = dict(self.thresholds, sc=group)
+            return func(1., 1., 1., 4*np.pi, **thresholds)
+        elif self.group == 'uw':
+            return func(1., 1., 1., 2*np.sqrt(group), **self.thresholds)
+        else:
+            return func(1., 1., 1., **self.thresholds)
+
+    def coefficient(self, group=None):
+        """
+        Calculate the dimensionless coefficient C of the radius.
+
+        Parameters
+        ----------
+        group: float or ndarray, optional
+            Value(s) of the dimensionless group sc_star or uw on which the
+            coefficient depends (not needed if it only depends on the
+            thresholds).
+
+        Returns
+        -------
+        C
+
+        """
+        if self._C is not None:
+            return self._C
+        if self._log_C is None:
+            return self._coefficient(group)
+        if self._spline is None:
+            from scipy.interpolate import CubicSpline # version 1.2.1
+            finite = np.isfinite(self._log_C)
+            self._spline = CubicSpline(self._log_group[finite],
+                                       self._log_C[finite])
+        group = np.asarray(group, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_group = np.log(group)
+        C = np.exp(self._spline(np.clip(log_group, self._log_group[0],
+                                        self._log_group[-1])))
+        outside = ~((log_group >= self._log_group[0]) &
+                    (log_group <= self._log_group[-1]))
+        if np.any(outside):
+            C = np.array(C, dtype=float)
+            C[outside] = self._coefficient(group[outside])
+        return C[()]
+
+    def __call__(self, t, T, S, *args):
+        """
+        Calculate the radius.
+
+        Parameters
+        ----------
+        t: float or ndarray
+            Time from beginning of pumping.
+        T: float or ndarray
+            Transmissivity.
+        S: float or ndarray
+            Storativity.
+        *args: float or ndarray
+            Pumping rate Q or well radius rw, depending on the criterion (see
+            the args attribute).
+
+        Returns
+        -------
+        Radius, with the broadcast shape of the parameters.
+
+        Notes
+        -----
+        Units as you wish, but must be consistent for all the parameters.
+
+        """
+        if len(args) != len(self.args):
+            raise TypeError('%s expects the parameters t, T, S%s'
+                            % (self, ''.join(', ' + arg for arg in self.args)))
+        if self.group == 'sc_star':
+            Q, = args
+            sc = self.thresholds.get(
+                'sc', CRITERIA[self.criterion].thresholds['sc'])
+            C = self.coefficient(4*np.pi*T*sc/Q)
+        elif self.group == 'uw':
+            rw, = args
+            C = self.coefficient(S*rw**2/(4*T*t))
+        else:
+            C = self._C
+        return C * np.sqrt(T*t/S)
+
+    def _uw_for_ratio(self, ratio):
+        """
+        Solve for uw the ratio C(uw)/(2*sqrt(uw)) of the radius to the well
+        radius (NaN where the ratio is not reached within _UW_BRACKET).
+        """
+        def func(uw, log_ratio):
+            return np.log(self.coefficient(uw)/(2*np.sqrt(uw))) - log_ratio
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_ratio = np.log(np.asarray(ratio, dtype=float))
+        uw_min, uw_max = _UW_BRACKET
+        # The ratio decreases with uw
+        valid = (func(uw_min, log_ratio) >= 0) & (func(uw_max, log_ratio) <= 0)
+        uw = np.full(log_ratio.shape, np.nan)
+        if np.any(valid):
+            uw[valid] = bracket_root(func, uw_min, uw_max,
+                                     args=(log_ratio[valid],),
+                                     rtol=get_precision().rtol)
+        return uw
+
+    def time(self, r, T, S, *args):
+        """
+        Calculate the time from beginning of pumping needed to reach a radius.
+
+        Parameters
+        ----------
+        r: float or ndarray
+            Target radius.
+        T: float or ndarray
+            Transmissivity.
+        S: float or ndarray
+            Storativity.
+        *args: float or ndarray
+            Pumping rate Q or well radius rw, depending on the criterion (see
+            the args attribute).
+
+        Returns
+        -------
+        Time, with the broadcast shape of the parameters (NaN where the
+        radius is never reached).
+
+        Notes
+        -----
+        Units as you wish, but must be consistent for all the parameters.
+
+        Unless the coefficient C of the radius C * sqrt(T*t/S) depends on uw,
+        the time is simply S*r**2/(T*C**2). Otherwise, the ratio
+        r/rw = C(uw)/(2*sqrt(uw)), which decreases with uw, is solved for uw
+        for all the elements at once, with the relative tolerance of the
+        precision in effect, and t = S*rw**2/(4*T*uw). Radii reached before
+        uw = 40 (i.e. too close to the well) give NaN. The time is
+        consistent with the plan to the solver tolerance, and with the
+        radius functions to about twice the interpolation error of the
+        coefficient.
+
+        """
+        if len(args) != len(self.args):
+            raise TypeError('%s expects the parameters r, T, S%s'
+                            % (self, ''.join(', ' + arg for arg in self.args)))
+        r = np.asarray(r, dtype=float)
+        if self.group == 'uw':
+            rw, = args
+            uw = self._uw_for_ratio(*np.broadcast_arrays(r/rw))
+            return (S*rw**2/(4*T*uw))[()]
+        if self.group == 'sc_star':
+            Q, = args
+            sc = self.thresholds.get(
+                'sc', CRITERIA[self.criterion].thresholds['sc'])
+            C = self.coefficient(4*np.pi*T*sc/Q)
+        else:
+            C = self._C
+        return (S*r**2/(T*C**2))[()]
+
+@functools.lru_cache(maxsize=32)
+def _plan(criterion, thresholds):
+    return RadiusPlan(criterion, **dict(thresholds))
+
+def time_to_radius(criterion, r, T, S, *args, **thresholds):
+    """
+    Calculate the time from beginning of pumping needed for a radius of
+    influence or investigation to reach a target distance.
+
+    Parameters
+    ----------
+    criterion: str
+        Name of a radius function of the drawdown module (e.g.
+        'rinv_reldrawave').
+    r: float or ndarray
+        Target radius.
+    T: float or ndarray
+        Transmissivity.
+    S: float or ndarray
+        Storativity.
+    *args: float or ndarray
+        Pumping rate Q or well radius rw, depending on the criterion (see
+        RadiusPlan.args).
+    **thresholds: float, optional
+        Thresholds of the criterion (e.g. sc, alpha), with the same defaults
+        as the radius function, and parameters other than Q and rw (i.e.
+        delta, which is required by rinv_absdrawderivdiff).
+
+    Returns
+    -------
+    Time, with the broadcast shape of the parameters (NaN where the radius is
+    never reached).
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    This is the inverse of the radius function in t, calculated with a
+    RadiusPlan (see RadiusPlan.time), which is kept for subsequent calls
+    with the same criterion and thresholds.
+
+    Examples
+    --------
+    >>> t = time_to_radius('rinv_reldrawave', 100., T, S, rw, alpha=0.01)
+
+    """
+    return _plan(criterion, tuple(sorted(thresholds.items()))).time(
+        r, T, S, *args)
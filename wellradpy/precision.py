@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import collections
+import contextlib
+import contextvars
+import inspect
+import numpy as np # version 1.16.2
+
+Precision = collections.namedtuple('Precision', [
+    'rtol',             # relative tolerance of the iterative solvers
+    'table_density',    # density of the interpolation tables, relative to
+                        # the default one
+    ])
+
+MODES = {
+    'fast': Precision(1e-5, 0.25),
+    'default': Precision(1e-10, 1.),
+    'reference': Precision(1e-13, 4.),
+}
+
+# Precision used when none is set in the current context
+_global = [MODES['default']]
+
+_current = contextvars.ContextVar('wellradpy_precision', default=None)
+
+def _resolve(mode=None, rtol=None, table_density=None):
+    if mode is None:
+        base = get_precision()
+    elif isinstance(mode, Precision):
+        base = mode
+    elif isinstance(mode, str):
+        try:
+            base = MODES[mode]
+        except KeyError:
+            raise ValueError('Unknown precision mode: %s' % mode)
+    else:
+        base = get_precision()._replace(rtol=float(mode))
+    if rtol is not None:
+        base = base._replace(rtol=float(rtol))
+    if table_density is not None:
+        base = base._replace(table_density=float(table_density))
+    return base
+
+def get_precision():
+    """
+    Get the precision in effect.
+
+    Returns
+    -------
+    Precision(rtol, table_density)
+
+    """
+    current = _current.get()
+    return _global[0] if current is None else current
+
+def set_precision(mode='default', rtol=None, table_density=None):
+    """
+    Set the precision globally (i.e. for all the contexts and threads where
+    it is not set with precision).
+
+    Parameters
+    ----------
+    mode: str, float or Precision, optional
+        'fast', 'default' or 'reference', or a relative tolerance of the
+        iterative solvers (with the table density in effect).
+    rtol: float, optional
+        Relative tolerance of the iterative solvers, overriding the mode.
+    table_density: float, optional
+        Density of the interpolation tables relative to the default one,
+        overriding the mode.
+
+    """
+    _global[0] = _resolve(mode, rtol, table_density)
+
+@contextlib.contextmanager
+def precision(mode=None, rtol=None, table_density=None):
+    """
+    Set the precision within a with block.
+
+    Parameters
+    ----------
+    mode: str, float or Precision, optional
+        'fast', 'default' or 'reference', or a relative tolerance of the
+        iterative solvers (precision in effect by default).
+    rtol: float, optional
+        Relative tolerance of the iterative solvers, overriding the mode.
+    table_density: float, optional
+        Density of the interpolation tables relative to the default one,
+        overriding the mode.
+
+    Returns
+    -------
+    Precision(rtol, table_density) in effect within the block.
+
+    Notes
+    -----
+    The setting is stored in a context variable, so that it only applies to
+    the current thread (or asyncio task), which makes it safe in threaded
+    servers. It does not propagate to worker processes.
+
+    Examples
+    --------
+    >>> with precision('fast'):
+    ...     r = dr.rinv_reldrawave(t, T, S, rw)
+
+    """
+    token = _current.set(_resolve(mode, rtol, table_density))
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+###############################################################################
+# Error bounds
+###############################################################################
+
+_EPS = 4*np.finfo(float).eps
+
+# Safety factor on the interpolation errors measured inside the intervals of
+# the tables, which are sampled at three points only
+_SAFETY = 2.
+
+def _relative_error_bound(name, params, value):
+    """
+    Relative error bound of the value of a radius function for the precision
+    in effect.
+    """
+    from . import drawdown, leaky, recovery, utils
+    if name in ('drawdown.rinfl_absdraw', 'drawdown.rinfl_reldraw',
+                'drawdown.rinfl_relvol', 'drawdown.rinv_absdrawdiff',
+                'drawdown.rinv_reldrawdiff', 'recovery.rinv',
+                'recovery.rinv_schedule', 'recovery.rinvmax_schedule'):
+        # Radius proportional to the square root of the root of an equation
+        # solved to rtol
+        return 0.5*get_precision().rtol + _EPS
+    if name in ('drawdown.rinv_reldrawave', 'drawdown.rinv_reldrawderivave'):
+        # The dimensionless radius is sqrt(u) with u = Kinv(alpha*K(uw))
+        # (or Kprime_inv(alpha*Kprime(uw))), whose error is the
+        # interpolation error of the inverse function at u plus the error on
+        # K(uw), amplified by the condition number K(u)/(u*w(u)) of Kinv
+        uw = params['S'] * params['rw']**2 / (4*params['T']*params['t'])
+        u = value**2 * params['S'] / (4*params['T']*params['t'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if name == 'drawdown.rinv_reldrawave':
+                error_K = drawdown._K_errors(uw)[0]
+                error_Kinv = drawdown._K_errors(u)[1]
+                cond = drawdown._K(u) / (u*drawdown._w(u))
+            else:
+                # Kprime has a closed form, but its rounding error close to
+                # 1/2 for small u is amplified by the inversion
+                error_K = _EPS
+                error_Kinv = drawdown._Kprime_inv_error(u) + \
+                             _EPS/np.minimum(u, 1)
+                cond = drawdown._Kprime(u) / (u*drawdown._wprime(u))
+            # Close to the end of the tables (u = 50, where K and Kprime are
+            # about 1e-23), the inversion is not resolved
+            resolved = np.maximum(u, uw) < 0.9*drawdown._U_TABLE_MAX
+        return np.where(resolved,
+                        0.5*_SAFETY*(error_Kinv + cond*error_K) + _EPS,
+                        np.inf)
+    if name in ('leaky.rinfl_absdraw', 'leaky.rinfl_reldraw',
+                'leaky.rinv_absdrawdiff'):
+        # The dimensionless radius is proportional to sqrt(u) with u solved
+        # to rtol from W(u, 2*sqrt(u*rho)) = x, whose error is the one of W
+        # (interpolated or not, the table error is taken) amplified by the
+        # condition number 1/|d(ln W)/d(ln u)|, and counted twice when x
+        # depends on W at the well
+        factor = 1 if name == 'leaky.rinv_absdrawdiff' else 4
+        u = value**2 * params['S'] / (factor*params['T']*params['t'])
+        rho = leaky._rho(params['t'], params['T'], params['S'], params['B'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cond = 1 / np.abs(leaky._log_slope(u, rho))
+        count = 2 if name == 'leaky.rinfl_reldraw' else 1
+        return 0.5*(get_precision().rtol +
+                    _SAFETY*count*utils._hantush_error()*cond) + _EPS
+    if name in ('recovery.tmax', 'recovery.rinvmax',
+                'recovery.characteristics'):
+        # tmax_star-1 is interpolated, and the relative errors on tmax and
+        # rinvmax are at most the one on tmax_star-1
+        return _SAFETY*recovery._tmax_star_error() + _EPS
+    if name in ('recovery.tmax_schedule', 'recovery.tend_schedule'):
+        # Times solved to rtol
+        return get_precision().rtol + _EPS
+    # Closed-form radii
+    return _EPS
+
+def with_error(func, *args, **kwargs):
+    """
+    Call a function of the drawdown, recovery or leaky module and estimate the
+    error of the result.
+
+    Parameters
+    ----------
+    func: callable
+        Function of the drawdown, recovery or leaky module (e.g.
+        drawdown.rinfl_absdraw).
+    *args, **kwargs:
+        Parameters of the function.
+
+    Returns
+    -------
+    Value of the function, and bound of its absolute error (same shape) for
+    the precision in effect. For recovery.characteristics, tuples of the
+    values and of the bounds.
+
+    Notes
+    -----
+    The bounds cover the numerical errors (solver tolerance, interpolation
+    error of the tables measured when they are built, and rounding errors),
+    not the uncertainty of the parameters. The interpolation errors of the
+    tables are measured once per table density, at the quarter points and
+    midpoints of their grids.
+
+    """
+    name = '%s.%s' % (func.__module__.split('.')[-1], func.__name__)
+    params = inspect.signature(func).bind(*args, **kwargs).arguments
+    value = func(*args, **kwargs)
+    bound = _relative_error_bound(name, params, value)
+    if isinstance(value, tuple):
+        return value, tuple((np.abs(v)*bound)[()] for v in value)
+    return value, (np.abs(value)*bound)[()]
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import collections
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+import numpy as np # version 1.16.2
+
+Counter = collections.namedtuple('Counter', [
+    'calls',        # number of calls
+    'elements',     # number of elements processed, summed over the calls
+    'time',         # cumulated run time in seconds (including nested calls)
+    'iterations',   # solver iterations (all elements advanced together)
+    'failures',     # elements that failed to converge
+    ])
+
+class Profiler(object):
+    """
+    Counters and timers of the instrumented functions of wellradpy.
+
+    Notes
+    -----
+    Each call is attributed to the outermost instrumented function being
+    run, typically the radius function that was called (e.g.
+    'drawdown.rinv_reldrawave'), which gives a per-criterion summary. Calls
+    from several threads sharing the profiler (e.g. run in copies of the
+    context of the profile block) are recorded safely.
+
+    """
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _add(self, name, calls=0, elements=0, time=0., iterations=0,
+             failures=0):
+        stack = self._stack()
+        section = stack[0] if stack else name
+        key = (section, name)
+        with self._lock:
+            counter = self._counters.setdefault(key, [0, 0, 0., 0, 0])
+            counter[0] += calls
+            counter[1] += elements
+            counter[2] += time
+            counter[3] += iterations
+            counter[4] += failures
+
+    def summary(self):
+        """
+        Summarize the counters by criterion.
+
+        Returns
+        -------
+        Dictionary by criterion (outermost function called) of dictionaries
+        of Counter by instrumented function.
+
+        """
+        res = collections.OrderedDict()
+        with self._lock:
+            for (section, name), counter in sorted(self._counters.items()):
+                res.setdefault(section, collections.OrderedDict())[name] = \
+                    Counter(*counter)
+        return res
+
+    def totals(self):
+        """
+        Sum the counters over all criteria.
+
+        Returns
+        -------
+        Dictionary of Counter by instrumented function.
+
+        """
+        res = {}
+        for counters in self.summary().values():
+            for name, counter in counters.items():
+                total = res.get(name, Counter(0, 0, 0., 0, 0))
+                res[name] = Counter(*[a + b for a, b in zip(total, counter)])
+        return collections.OrderedDict(sorted(res.items()))
+
+    def report(self):
+        """
+        Format the summary as a table.
+
+        Returns
+        -------
+        str
+
+        """
+        lines = ['%-34s %8s %10s %10s %10s %8s' % ('', 'calls', 'elements',
+                                                 'time (s)', 'iterations',
+                                                 'failures')]
+        for section, counters in self.summary().items():
+            lines.append(section)
+            for name, c in counters.items():
+                lines.append('  %-32s %8d %10d %10.3e %10d %8d'
+                             % ((name,) + tuple(c)))
+        return '\n'.join(lines)
+
+# Active profiler in the current context (None when profiling is disabled)
+_active = contextvars.ContextVar('wellradpy_profiler', default=None)
+
+@contextlib.contextmanager
+def profile():
+    """
+    Enable the instrumentation of wellradpy within a with block.
+
+    Returns
+    -------
+    Profiler collecting the counters and timers of the block.
+
+    Notes
+    -----
+    The profiler is stored in a context variable, like the precision, so
+    that it only records the calls of the current thread (or asyncio task)
+    and blocks in different threads do not interfere. When profiling is
+    disabled, the only overhead of the instrumented functions is a lookup
+    of the context variable _active.
+
+    Examples
+    --------
+    >>> with profile() as prof:
+    ...     dr.rinv_reldrawave(t, T, S, rw)
+    >>> print(prof.report())
+
+    """
+    token = _active.set(Profiler())
+    try:
+        yield _active.get()
+    finally:
+        _active.reset(token)
+
+def instrumented(func):
+    """
+    Count and time the calls of a function when profiling is enabled.
+
+    Parameters
+    ----------
+    func: callable
+        Function to instrument.
+
+    Returns
+    -------
+    Instrumented function, registered under its module and name (e.g.
+    'utils.E1').
+
+    """
+    name = '%s.%s' % (func.__module__.split('.')[-1], func.__name__)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _active.get()
+        if profiler is None:
+            return func(*args, **kwargs)
+        stack = profiler._stack()
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            # The elements of solvers (whose first argument is the function
+            # to solve) are recorded by count_iterations
+            elements = 0
+            if args and not callable(args[0]):
+                elements = int(np.size(args[0]))
+            profiler._add(name, calls=1, elements=elements, time=elapsed)
+            stack.pop()
+
+    return wrapper
+
+def count_iterations(iterations, elements, failures=0):
+    """
+    Record the work of the solver being run, if profiling is enabled.
+
+    Parameters
+    ----------
+    iterations: int
+        Number of iterations.
+    elements: int
+        Number of elements solved.
+    failures: int, optional
+        Number of elements that failed to converge.
+
+    """
+    profiler = _active.get()
+    if profiler is not None:
+        stack = profiler._stack()
+        if stack:
+            profiler._add(stack[-1], elements=elements,
+                          iterations=iterations, failures=failures)
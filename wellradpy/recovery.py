@@ -5,62 +5,115 @@ Created on 2020/03/20
 @author: Etienne Bresciani
 """
 
+import functools
 import numpy as np # version 1.16.2
 from .utils import E1, E1inv
-import scipy.optimize as opt # version 1.2.1
+from .solvers import bracket_root, newton
+from .diskcache import persistent
+from .profiling import instrumented
+from .precision import get_precision
 
 def _barrier_effect_star(rinv_star, t_star):
     return E1(rinv_star**2/t_star) - E1(rinv_star**2/(t_star-1))
 
-def _func_root_rinv_star(rinv_star_unknown, sc_star_target, t_star):
-    return _barrier_effect_star(rinv_star_unknown, t_star) - sc_star_target
-
-def _rinv_star(sc_star, t_star):
+def _func_root_rinv_star(rinv_star_sq, sc_star, t_star):
+    # Value and derivative of ln(barrier effect) - ln(sc_star) with respect to
+    # rinv_star**2, a formulation that is close to linear for both small and
+    # large rinv_star
+    a = rinv_star_sq/t_star
+    b = rinv_star_sq/(t_star-1)
+    barrier_effect = E1(a) - E1(b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.log(barrier_effect) - np.log(sc_star)
+        df = (np.exp(-b) - np.exp(-a)) / (rinv_star_sq*barrier_effect)
+    return f, df
+
+@instrumented
+def _rinv_star(sc_star, t_star, rinv_star_0=None):
     """
     Calculate the dimensionless radius of investigation during recovery.
 
     Parameters
     ----------
-    sc_star: float
+    sc_star: float or ndarray
         Dimensionless apparent resolution.
-    t_star: float
+    t_star: float or ndarray
         Dimensionless time from beginning of pumping.
+    rinv_star_0: float or ndarray, optional
+        Starting points of the iterations (e.g. the solution at a close
+        time), used where they are positive.
 
     Returns
     -------
     rinv_star
 
-    """
-    # Note: Another method (e.g. Newton) could be more efficient, but bisection
-    # is simple and robust, and we expect that efficiency will not be an issue
-    # in practice
-    sol = opt.root_scalar(_func_root_rinv_star, args=(sc_star,t_star),
-                          method='bisect', bracket=(1e-12, 1e3), rtol=1e-5)
-    return sol.root
+    Notes
+    -----
+    All the elements are solved together with a safeguarded Newton method,
+    using the closed-form derivative of the barrier effect
+    E1(rinv_star**2/t_star) - E1(rinv_star**2/(t_star-1)) with respect to
+    rinv_star**2, i.e. (exp(-rinv_star**2/(t_star-1)) -
+    exp(-rinv_star**2/t_star)) / rinv_star**2. The iterations start from the
+    root of the linearization of the barrier effect for small rinv_star,
+    ln(t_star/(t_star-1)) - rinv_star**2/(t_star*(t_star-1)), unless
+    starting points are given.
+
+    The barrier effect is maximum for rinv_star = 0, where it is equal to
+    ln(t_star/(t_star-1)). When this is smaller than sc_star, the recovery
+    test may be considered terminated, and the returned rinv_star is 0. It
+    is NaN for sc_star <= 0.
 
+    """
+    sc_star, t_star, rinv_star_0 = np.broadcast_arrays(
+        np.asarray(sc_star, dtype=float), np.asarray(t_star, dtype=float),
+        np.asarray(np.nan if rinv_star_0 is None else rinv_star_0,
+                   dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        barrier_effect_max = np.log(t_star/(t_star-1))
+    rinv_star_sq = np.where(barrier_effect_max <= sc_star, 0., np.nan)
+    # The apparent resolution must be positive (as for E1inv)
+    has_root = (barrier_effect_max > sc_star) & (sc_star > 0)
+    sc_star = sc_star[has_root]
+    t_star = t_star[has_root]
+    rinv_star_0 = rinv_star_0[has_root]
+    with np.errstate(invalid='ignore'):
+        rinv_star_sq_0 = np.where(rinv_star_0 > 0, rinv_star_0**2,
+                                  (barrier_effect_max[has_root] - sc_star) *
+                                  t_star * (t_star-1))
+    rinv_star_sq[has_root] = newton(_func_root_rinv_star, rinv_star_sq_0,
+                                    1e-24, 1e6, args=(sc_star, t_star),
+                                    rtol=get_precision().rtol, sign_a=1.)
+    return np.sqrt(rinv_star_sq)[()]
+
+@instrumented
 def rinv(t, T, S, Q, tp, sc=0.05):
     """
     Calculate the radius of investigation during recovery.
 
     Parameters
     ----------
-    t: float
+    t: float or ndarray
         Time from beginning of pumping.
-    T: float
+    T: float or ndarray
         Transmissivity.
-    S: float
+    S: float or ndarray
         Storativity.
-    Q: float
+    Q: float or ndarray
         Pumping rate.
-    tp: float
+    tp: float or ndarray
         Pumping duration.
-    sc: float, optional
+    sc: float or ndarray, optional
         Apparent resolution.
 
     Returns
     -------
     rinv
 
+    Notes
+    -----
+    Arrays are broadcast against each other and solved in one vectorized
+    pass.
+
     """
     sc_star = 4*np.pi*T*sc/Q
     t_star = t/tp
@@ -69,13 +122,153 @@ def rinv(t, T, S, Q, tp, sc=0.05):
     rinv = rinv_star*rp
     return rinv
 
-def _barrier_effect_at_tmax_star(tmax_star):
-    return E1((tmax_star-1)*np.log(tmax_star/(tmax_star-1))) - \
-           E1(tmax_star*np.log(tmax_star/(tmax_star-1)))
+def rinv_stream(times, T, S, Q, tp, sc=0.05):
+    """
+    Calculate the radius of investigation during recovery for a stream of
+    times, e.g. as measurements arrive.
+
+    Parameters
+    ----------
+    times: iterable
+        Times from beginning of pumping (floats, or arrays broadcast against
+        the other parameters), in any order but preferably increasing.
+    T: float or ndarray
+        Transmissivity.
+    S: float or ndarray
+        Storativity.
+    Q: float or ndarray
+        Pumping rate.
+    tp: float or ndarray
+        Pumping duration.
+    sc: float or ndarray, optional
+        Apparent resolution.
+
+    Yields
+    ------
+    rinv for each time.
+
+    Notes
+    -----
+    The radius of investigation varies smoothly with time, so each solve
+    starts from the previous solution and converges in a few Newton
+    iterations. Arrays of parameters (e.g. several wells) are handled
+    element by element.
+
+    """
+    sc_star = 4*np.pi*T*sc/Q
+    rp = np.sqrt(T*tp/S)
+    rinv_star = None
+    for t in times:
+        t_star = t/tp
+        if np.shape(rinv_star) != np.broadcast(sc_star, t_star).shape:
+            rinv_star = None
+        rinv_star = _rinv_star(sc_star, t_star, rinv_star)
+        yield rinv_star*rp
+
+def _barrier_effect_at_tmax_star(tmax_star_m1):
+    # Barrier effect at tmax as a function of tmax_star-1 (which keeps its
+    # precision close to 1), where rinv_star**2 = t*(t-1)*ln(t/(t-1)) for the
+    # dimensionless time t
+    L = np.log1p(1/tmax_star_m1)
+    return E1(tmax_star_m1*L) - E1((1+tmax_star_m1)*L)
+
+# Range and density of the logarithmic grid of tmax_star-1 used to tabulate
+# sc_star (above the range, the asymptote tmax_star = exp(-1)/sc_star + 1/2
+# is used; below it, tmax_star-1 underflows)
+_TMAX_TABLE_MIN = 1e-300
+_TMAX_TABLE_MAX = 1e6
+_TMAX_TABLE_POINTS_PER_UNIT = 20
+
+def _tmax_star_grid(density):
+    n = int(round(np.log(_TMAX_TABLE_MAX/_TMAX_TABLE_MIN) *
+                  _TMAX_TABLE_POINTS_PER_UNIT * density))
+    return np.linspace(np.log(_TMAX_TABLE_MAX), np.log(_TMAX_TABLE_MIN), n+1)
+
+@instrumented
+@functools.lru_cache(maxsize=None)
+@persistent('_TMAX_TABLE_MIN', '_TMAX_TABLE_MAX',
+            '_TMAX_TABLE_POINTS_PER_UNIT')
+def _tmax_star_table(density=1.):
+    """
+    Tabulate the dimensionless apparent resolution at tmax against
+    tmax_star-1.
+
+    Parameters
+    ----------
+    density: float, optional
+        Density of the grid relative to the default one.
+
+    Returns
+    -------
+    ln(sc_star) (increasing) and ln(tmax_star-1)
+
+    """
+    log_tmax_star_m1 = _tmax_star_grid(density)
+    sc_star = _barrier_effect_at_tmax_star(np.exp(log_tmax_star_m1))
+    return np.log(sc_star), log_tmax_star_m1
+
+@functools.lru_cache(maxsize=None)
+def _tmax_star_interpolant(density=1.):
+    from scipy.interpolate import PchipInterpolator # version 1.2.1
+    return PchipInterpolator(*_tmax_star_table(density))
+
+@functools.lru_cache(maxsize=None)
+@persistent('_TMAX_TABLE_MIN', '_TMAX_TABLE_MAX',
+            '_TMAX_TABLE_POINTS_PER_UNIT')
+def _tmax_star_error_table(density):
+    log_tmax_star_m1 = _tmax_star_grid(density)
+    # Quarter points and midpoints of the intervals, where the interpolation
+    # error is maximum
+    dlog = np.diff(log_tmax_star_m1)
+    log_mid = (log_tmax_star_m1[:-1,None] +
+               dlog[:,None]*[0.25, 0.5, 0.75]).ravel()
+    sc_star = _barrier_effect_at_tmax_star(np.exp(log_mid))
+    return np.max(np.abs(np.exp(_tmax_star_interpolant(density)(
+        np.log(sc_star)) - log_mid) - 1))
+
+def _tmax_star_error():
+    """
+    Measure the interpolation error of tmax_star-1 inside the intervals of
+    the table grid, for the precision in effect.
+
+    Returns
+    -------
+    Maximum relative error of tmax_star-1.
+
+    """
+    return _tmax_star_error_table(get_precision().table_density)
+
+def _tmax_star_m1(sc_star):
+    """
+    Calculate tmax_star-1 by monotone interpolation in log-log space of the
+    tabulated barrier effect at tmax (relative error below 2e-7 with the
+    default precision, see _tmax_star_error).
+
+    Parameters
+    ----------
+    sc_star: float or ndarray
+        Dimensionless apparent resolution.
 
-def _func_root_tmax_star(tmax_star_unknown, sc_star_target):
-    return _barrier_effect_at_tmax_star(tmax_star_unknown) - sc_star_target
+    Returns
+    -------
+    tmax_star-1 (0 for sc_star beyond the tabulated range, NaN for sc_star
+    <= 0)
 
+    """
+    sc_star = np.asarray(sc_star, dtype=float)
+    density = get_precision().table_density
+    log_sc_star, log_tmax_star_m1 = _tmax_star_table(density)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_x = np.log(sc_star)
+        tmax_star_m1 = np.exp(_tmax_star_interpolant(density)(
+            np.clip(log_x, log_sc_star[0], log_sc_star[-1])))
+        tmax_star_m1 = np.where(log_x < log_sc_star[0],
+                                np.exp(-1)/sc_star - 0.5, tmax_star_m1)
+    tmax_star_m1 = np.where(log_x > log_sc_star[-1], 0., tmax_star_m1)
+    tmax_star_m1 = np.where(sc_star > 0, tmax_star_m1, np.nan)
+    return tmax_star_m1[()]
+
+@instrumented
 def _tmax_star(sc_star):
     """
     Calculate the dimensionless time at which radius of investigation is
@@ -83,21 +276,29 @@ def _tmax_star(sc_star):
 
     Parameters
     ----------
-    sc_star: float
+    sc_star: float or ndarray
         Dimensionless apparent resolution.
 
     Returns
     -------
     tmax_star
 
+    Notes
+    -----
+    The barrier effect at tmax is an explicit function of tmax_star, which
+    is tabulated once and inverted by interpolation, so that no equation
+    needs to be solved.
+
     """
-    # Note: Another method (e.g. Newton) could be more efficient, but bisection
-    # is simple and robust, and we expect that efficiency will not be an issue
-    # in practice
-    sol = opt.root_scalar(_func_root_tmax_star, args=(sc_star),
-                          method='bisect', bracket=(1.0000000001,1e5), rtol=1e-5)
-    return sol.root
+    return 1 + _tmax_star_m1(sc_star)
+
+def _rinvmax_star_from_tmax_star_m1(tmax_star_m1):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rinvmax_star_sq = (1+tmax_star_m1) * tmax_star_m1 * \
+                          np.log1p(1/tmax_star_m1)
+    return np.sqrt(np.where(tmax_star_m1 == 0, 0., rinvmax_star_sq))[()]
 
+@instrumented
 def tmax(T, Q, tp, sc=0.05):
     """
     Calculate the time at which the radius of investigation is maximum during
@@ -105,13 +306,13 @@ def tmax(T, Q, tp, sc=0.05):
 
     Parameters
     ----------
-    T: float
+    T: float or ndarray
         Transmissivity.
-    Q: float
+    Q: float or ndarray
         Pumping rate.
-    tp: float
+    tp: float or ndarray
         Pumping duration.
-    sc: float, optional
+    sc: float or ndarray, optional
         Apparent resolution.
 
     Returns
@@ -131,39 +332,37 @@ def _rinvmax_star(sc_star):
 
     Parameters
     ----------
-    sc: float, optional
+    sc_star: float or ndarray
         Dimensionless apparent resolution.
 
     Returns
     -------
-    tmax
+    rinvmax_star
 
     """
-    tmax_star = _tmax_star(sc_star)
-    rinvmax_star = np.sqrt(tmax_star * (tmax_star-1) * np.log(tmax_star / \
-                           (tmax_star-1)))
-    return rinvmax_star
+    return _rinvmax_star_from_tmax_star_m1(_tmax_star_m1(sc_star))
 
+@instrumented
 def rinvmax(T, S, Q, tp, sc=0.05):
     """
     Calculate the maximum radius of investigation during recovery.
 
     Parameters
     ----------
-    T: float
+    T: float or ndarray
         Transmissivity.
-    S: float
+    S: float or ndarray
         Storativity.
-    Q: float
+    Q: float or ndarray
         Pumping rate.
-    tp: float
+    tp: float or ndarray
         Pumping duration.
-    sc: float, optional
+    sc: float or ndarray, optional
         Apparent resolution.
 
     Returns
     -------
-    tmax
+    rinvmax
 
     """
     sc_star = 4*np.pi*T*sc/Q
@@ -172,12 +371,7 @@ def rinvmax(T, S, Q, tp, sc=0.05):
     rinvmax = rinvmax_star*rp
     return rinvmax
 
-def _barrier_effect_at_tend_star(tend_star):
-    return E1(1.e-10/tend_star) - E1(1.e-10/(tend_star-1))
-
-def _func_root_tend_star(tend_star_unknown, sc_star_target):
-    return _barrier_effect_at_tend_star(tend_star_unknown) - sc_star_target
-
+@instrumented
 def _tend_star(sc_star):
     """
     Calculate the dimensionless time at which the radius of investigation
@@ -186,21 +380,25 @@ def _tend_star(sc_star):
 
     Parameters
     ----------
-    sc_star: float
+    sc_star: float or ndarray
         Dimensionless apparent resolution.
 
     Returns
     -------
-    tend_star
+    tend_star (NaN for sc_star <= 0)
+
+    Notes
+    -----
+    The barrier effect is maximum for rinv_star = 0, where it is equal to
+    ln(tend_star/(tend_star-1)), hence tend_star = 1/(1-exp(-sc_star)).
 
     """
-    # Note: Another method (e.g. Newton) could be more efficient, but bisection
-    # is simple and robust, and we expect that efficiency will not be an issue
-    # in practice
-    sol = opt.root_scalar(_func_root_tend_star, args=(sc_star),
-                          method='bisect', bracket=(1.00000001,1e5), rtol=1e-5)
-    return sol.root
+    sc_star = np.asarray(sc_star, dtype=float)
+    with np.errstate(divide='ignore'):
+        tend_star = -1/np.expm1(-sc_star)
+    return np.where(sc_star > 0, tend_star, np.nan)[()]
 
+@instrumented
 def tend(T, Q, tp, sc=0.05):
     """
     Calculate the time at which the radius of investigation becomes zero during
@@ -208,13 +406,13 @@ def tend(T, Q, tp, sc=0.05):
 
     Parameters
     ----------
-    T: float
+    T: float or ndarray
         Transmissivity.
-    Q: float
+    Q: float or ndarray
         Pumping rate.
-    tp: float
+    tp: float or ndarray
         Pumping duration.
-    sc: float, optional
+    sc: float or ndarray, optional
         Apparent resolution.
 
     Returns
@@ -226,3 +424,359 @@ def tend(T, Q, tp, sc=0.05):
     tend_star = _tend_star(sc_star)
     tend = tend_star*tp
     return tend
+
+@instrumented
+def characteristics(T, S, Q, tp, sc=0.05):
+    """
+    Calculate the time at which the radius of investigation is maximum, the
+    maximum radius of investigation and the time at which the radius of
+    investigation becomes zero during recovery, at once.
+
+    Parameters
+    ----------
+    T: float or ndarray
+        Transmissivity.
+    S: float or ndarray
+        Storativity.
+    Q: float or ndarray
+        Pumping rate.
+    tp: float or ndarray
+        Pumping duration.
+    sc: float or ndarray, optional
+        Apparent resolution.
+
+    Returns
+    -------
+    tmax, rinvmax, tend
+
+    Notes
+    -----
+    Equivalent to calling tmax, rinvmax and tend, but the dimensionless
+    apparent resolution and tmax are only calculated once.
+
+    """
+    sc_star = 4*np.pi*T*sc/Q
+    tmax_star_m1 = _tmax_star_m1(sc_star)
+    tmax = (1 + tmax_star_m1)*tp
+    rinvmax = _rinvmax_star_from_tmax_star_m1(tmax_star_m1) * \
+              np.sqrt(T*tp/S)
+    tend = _tend_star(sc_star)*tp
+    return tmax, rinvmax, tend
+
+def cyclic_schedule(Q, t_on, t_off, cycles):
+    """
+    Build the schedule of a cyclic (intermittent) pumping test.
+
+    Parameters
+    ----------
+    Q: float
+        Pumping rate during the pumping periods.
+    t_on: float
+        Duration of the pumping periods.
+    t_off: float
+        Duration of the rest periods between them.
+    cycles: int
+        Number of pumping periods.
+
+    Returns
+    -------
+    times, rates (see rinv_schedule), with pumping starting at time 0 and
+    recovery starting at the end of the last pumping period.
+
+    """
+    durations = np.tile([t_on, t_off], cycles)[:-1]
+    times = np.concatenate(([0.], np.cumsum(durations)))
+    rates = np.tile([Q, 0.], cycles)[:-1]
+    return times, rates
+
+def _schedule(times, rates):
+    """
+    Check a pumping schedule and convert it to a superposition of constant
+    rates starting at the times where the rate changes.
+
+    Parameters
+    ----------
+    times: array_like
+        Times at which the steps begin, followed by the time at which the
+        last step ends (increasing).
+    rates: array_like
+        Pumping rates of the steps (nonnegative).
+
+    Returns
+    -------
+    Times of the rate changes relative to the beginning of pumping (the
+    last one is the beginning of recovery), rate changes, rates after the
+    changes, and time of the beginning of pumping.
+
+    """
+    times = np.asarray(times, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    if times.ndim != 1 or rates.ndim != 1 or times.size != rates.size + 1:
+        raise ValueError('times must be a 1D array with one more element '
+                         'than rates')
+    if np.any(np.diff(times) <= 0):
+        raise ValueError('times must be increasing')
+    if np.any(rates < 0) or not np.any(rates > 0):
+        raise ValueError('rates must be nonnegative and not all zero')
+    levels = np.concatenate(([0.], rates, [0.]))
+    dQ = np.diff(levels)
+    change = dQ != 0
+    changes = times[change]
+    return changes - changes[0], dQ[change], levels[1:][change], changes[0]
+
+def _func_root_x(x, target, rows, rho, dQ):
+    # Value and derivative of ln(superposed drawdown) - ln(target) with
+    # respect to x, evaluated for all the rate changes at once
+    u = x[:,None] * rho[rows.astype(int)]
+    drawdown = np.dot(E1(u), dQ)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.log(drawdown) - np.log(target)
+        df = -np.dot(np.exp(-u), dQ) / (x*drawdown)
+    return f, df
+
+def _schedule_x(target, frac, dQ, pumping):
+    """
+    Calculate the dimensionless squared radius x = r**2*S/(T*t0), with t0
+    the time since the beginning of pumping, at which the superposed
+    drawdown (times 4*pi*T) is equal to target.
+
+    Parameters
+    ----------
+    target: ndarray
+        4*pi*T*sc, for each time.
+    frac: ndarray
+        Times of the rate changes divided by t0 (one row per time, >= 1 for
+        the changes that have not occurred yet).
+    dQ: ndarray
+        Rate changes.
+    pumping: ndarray
+        Whether the pumping rate is positive at each time.
+
+    Returns
+    -------
+    x (0 where the drawdown at the well is smaller than target)
+
+    Notes
+    -----
+    The drawdown sum(dQ*E1(x/(1-frac))) is decreasing with x for
+    nonnegative rates, and it is solved for all the times at once with a
+    safeguarded Newton method. It is at most P*E1(x), with P the sum of the
+    positive rate changes, which bounds the root. At the well, the drawdown
+    is infinite during pumping, and equal to sum(dQ*ln(1-frac)) otherwise
+    (the rate changes that have occurred sum to zero); the iterations start
+    from the root of the linearization of the drawdown for small x when it
+    is finite.
+
+    """
+    occurred = frac < 1
+    with np.errstate(divide='ignore'):
+        rho = np.where(occurred, 1/(1-np.where(occurred, frac, 0.)), np.inf)
+        at_well = np.dot(np.log1p(-np.where(occurred, frac, 0.)), dQ)
+    at_well = np.where(pumping, np.inf, at_well)
+    x = np.zeros(target.shape)
+    has_root = np.flatnonzero(at_well > target)
+    if has_root.size == 0:
+        return x
+    target = target[has_root]
+    rho = rho[has_root]
+    x_max = E1inv(target / np.dot(occurred[has_root], np.maximum(dQ, 0.)))
+    slope = -np.dot(np.where(occurred[has_root], rho, 0.), dQ)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_0 = (at_well[has_root] - target) / slope
+    x_0 = np.where(x_0 > 0, x_0, x_max)
+    func = functools.partial(_func_root_x, rho=rho, dQ=dQ)
+    x[has_root] = newton(func, x_0, 1e-24*x_max, x_max,
+                         args=(target, np.arange(has_root.size)),
+                         rtol=get_precision().rtol, sign_a=1.)
+    return x
+
+@instrumented
+def rinv_schedule(t, T, S, times, rates, sc=0.05):
+    """
+    Calculate the radius of investigation for a piecewise-constant pumping
+    schedule (e.g. step-drawdown or cyclic pumping test).
+
+    Parameters
+    ----------
+    t: float or ndarray
+        Time (on the same clock as times).
+    T: float or ndarray
+        Transmissivity.
+    S: float or ndarray
+        Storativity.
+    times: array_like
+        Times at which the steps begin, followed by the time at which the
+        last step ends and recovery begins (increasing).
+    rates: array_like
+        Pumping rates of the steps (nonnegative, 0 for rest periods).
+    sc: float or ndarray, optional
+        Apparent resolution.
+
+    Returns
+    -------
+    rinv
+
+    Notes
+    -----
+    The radius of investigation is the distance at which the drawdown,
+    superposed from all the rate changes, is equal to the apparent
+    resolution, at any time (during pumping, rest periods or recovery).
+    With times = [0, tp] and rates = [Q], it is the same as
+    rinv(t, T, S, Q, tp, sc) during recovery.
+
+    The arrays t, T, S and sc are broadcast against each other, and the
+    drawdown is evaluated for all their elements and all the rate changes in
+    one array operation per iteration.
+
+    """
+    changes, dQ, levels, t_start = _schedule(times, rates)
+    t, T, S, sc = np.broadcast_arrays(*[np.asarray(arr, dtype=float)
+                                        for arr in (t, T, S, sc)])
+    t0 = t - t_start
+    with np.errstate(invalid='ignore'):
+        x = np.where(t0 <= 0, 0., np.nan)
+    started = t0 > 0
+    t0_started = t0[started]
+    occurred = np.searchsorted(changes, t0_started)
+    pumping = levels[occurred-1] > 0
+    x[started] = _schedule_x(4*np.pi*T[started]*sc[started],
+                             changes / t0_started[:,None], dQ, pumping)
+    with np.errstate(invalid='ignore'):
+        rinv = np.sqrt(x*np.maximum(t0, 0.)*T/S)
+    return rinv[()]
+
+def _schedule_recovery(T, times, rates, sc):
+    # Rate changes, time of the beginning of pumping, target drawdown and
+    # time after the beginning of recovery at which the drawdown at the well
+    # is equal to it
+    changes, dQ, levels, t_start = _schedule(times, rates)
+    target = np.atleast_1d(4*np.pi*np.asarray(T, dtype=float)*sc)
+    t_rec = changes[-1]
+    # The drawdown at the well is at least the one due to the last pumping
+    # step alone, and at most the pumped volume divided by the time since
+    # the end of pumping. Roots below 1e-12*t_rec (e.g. after a last step at
+    # a very low rate) are not resolved.
+    with np.errstate(over='ignore'):
+        y_min = np.maximum((t_rec - changes[-2]) / np.expm1(target/levels[-2]),
+                           1e-12*t_rec)
+    y_max = np.maximum(-np.dot(dQ, changes) / target, y_min)
+    def func(y, target):
+        return np.dot(np.log1p((t_rec - changes) / y[:,None]), dQ) - target
+    y_end = y_min.copy()
+    has_root = np.flatnonzero(func(y_min, target) > 0)
+    y_end[has_root] = bracket_root(func, y_min[has_root], y_max[has_root],
+                                   args=(target[has_root],),
+                                   rtol=get_precision().rtol)
+    return changes, dQ, t_start, target, y_end
+
+@instrumented
+def tend_schedule(T, times, rates, sc=0.05):
+    """
+    Calculate the time at which the radius of investigation becomes zero
+    during recovery for a piecewise-constant pumping schedule.
+
+    Parameters
+    ----------
+    T: float or ndarray
+        Transmissivity.
+    times: array_like
+        Times at which the steps begin, followed by the time at which the
+        last step ends and recovery begins (increasing).
+    rates: array_like
+        Pumping rates of the steps (nonnegative, 0 for rest periods).
+    sc: float or ndarray, optional
+        Apparent resolution.
+
+    Returns
+    -------
+    tend
+
+    Notes
+    -----
+    The drawdown at the well, sum(dQ*ln(t-t_k)) over the rate changes dQ at
+    times t_k, decreases during recovery and is solved for the time at
+    which it is equal to the apparent resolution.
+
+    """
+    shape = np.broadcast(np.asarray(T), np.asarray(sc)).shape
+    changes, dQ, t_start, target, y_end = _schedule_recovery(T, times,
+                                                             rates, sc)
+    return (t_start + changes[-1] + y_end).reshape(shape)[()]
+
+@instrumented
+def tmax_schedule(T, times, rates, sc=0.05):
+    """
+    Calculate the time at which the radius of investigation is maximum
+    during recovery for a piecewise-constant pumping schedule.
+
+    Parameters
+    ----------
+    T: float or ndarray
+        Transmissivity.
+    times: array_like
+        Times at which the steps begin, followed by the time at which the
+        last step ends and recovery begins (increasing).
+    rates: array_like
+        Pumping rates of the steps (nonnegative, 0 for rest periods).
+    sc: float or ndarray, optional
+        Apparent resolution.
+
+    Returns
+    -------
+    tmax
+
+    Notes
+    -----
+    Along the radius of investigation, the derivative of the drawdown with
+    respect to time, sum(dQ*exp(-r**2*S/(T*(t-t_k)))/(t-t_k)), has the sign
+    of the derivative of the radius. It is positive at the beginning of
+    recovery and negative at tend, and its root is found by bracketing, the
+    radius of investigation being solved at each iteration. When the radius
+    of investigation decreases from the beginning of recovery (e.g. after a
+    last step at a much lower rate), tmax is the beginning of recovery.
+
+    """
+    shape = np.broadcast(np.asarray(T), np.asarray(sc)).shape
+    changes, dQ, t_start, target, y_end = _schedule_recovery(T, times,
+                                                             rates, sc)
+    def func(y, target):
+        t0 = changes[-1] + y
+        frac = changes / t0[:,None]
+        x = _schedule_x(target, frac, dQ, np.zeros(t0.shape, dtype=bool))
+        rho = 1/(1-frac)
+        return np.dot(rho*np.exp(-x[:,None]*rho), dQ)
+    y_min = 1e-9*y_end
+    y = np.zeros(target.shape)
+    increasing = np.flatnonzero(func(y_min, target) > 0)
+    y[increasing] = bracket_root(func, y_min[increasing], y_end[increasing],
+                                 args=(target[increasing],),
+                                 rtol=get_precision().rtol)
+    return (t_start + changes[-1] + y).reshape(shape)[()]
+
+@instrumented
+def rinvmax_schedule(T, S, times, rates, sc=0.05):
+    """
+    Calculate the maximum radius of investigation during recovery for a
+    piecewise-constant pumping schedule.
+
+    Parameters
+    ----------
+    T: float or ndarray
+        Transmissivity.
+    S: float or ndarray
+        Storativity.
+    times: array_like
+        Times at which the steps begin, followed by the time at which the
+        last step ends and recovery begins (increasing).
+    rates: array_like
+        Pumping rates of the steps (nonnegative, 0 for rest periods).
+    sc: float or ndarray, optional
+        Apparent resolution.
+
+    Returns
+    -------
+    rinvmax
+
+    """
+    return rinv_schedule(tmax_schedule(T, times, rates, sc), T, S, times,
+                         rates, sc)
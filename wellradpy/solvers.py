@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import numpy as np # version 1.16.2
+from .profiling import instrumented, count_iterations
+
+def _flatten(*arrays):
+    """
+    Broadcast arrays against each other and flatten them.
+
+    Parameters
+    ----------
+    arrays: float or ndarray
+        Arrays to broadcast.
+
+    Returns
+    -------
+    Shape of the broadcast arrays and list of the flattened arrays.
+
+    """
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=float)
+                                   for a in arrays])
+    shape = arrays[0].shape
+    return shape, [a.ravel() for a in arrays]
+
+@instrumented
+def bracket_root(func, a, b, args=(), method='itp', rtol=1e-5, maxiter=100):
+    """
+    Find the roots of a function within brackets, for many brackets at once.
+
+    Parameters
+    ----------
+    func: callable
+        Function of the form func(x, *args) whose roots are sought. It must
+        accept arrays and be continuous on the brackets.
+    a, b: float or ndarray
+        Lower and upper bounds of the brackets (must be positive).
+    args: tuple, optional
+        Extra arguments of func (floats or arrays, broadcast against a and b).
+    method: str, optional
+        'itp' (interpolate, truncate and project; default) or 'bisect'.
+    rtol: float, optional
+        Relative tolerance on the roots.
+    maxiter: int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    Roots, with the broadcast shape of a, b and args (NaN where func returns
+    NaN, or has the same sign at both bounds).
+
+    Notes
+    -----
+    The search is carried out in the variable ln(x), so that the tolerance
+    is relative and brackets spanning many orders of magnitude are handled
+    efficiently. All the brackets are advanced together at each iteration,
+    and the function is only evaluated for the elements that have not
+    converged yet. The ITP method has the same worst-case number of
+    iterations as bisection but converges superlinearly for smooth functions.
+
+    """
+    if method not in ('itp', 'bisect'):
+        raise ValueError('Unknown method: %s' % method)
+    shape, flat = _flatten(a, b, *args)
+    sa = np.log(flat[0])
+    sb = np.log(flat[1])
+    args = flat[2:]
+    ya = func(np.exp(sa), *args)
+    yb = func(np.exp(sb), *args)
+    # Elements whose brackets do not contain a root are not solved
+    ya = np.where(ya*yb > 0, np.nan, ya)
+    # Orient the function so that it is negative at sa and positive at sb
+    sign = np.where(ya > 0, -1., 1.)
+    ya = sign*ya
+    yb = sign*yb
+    # Elements where the root is one of the bounds
+    sb[ya==0] = sa[ya==0]
+    sa[yb==0] = sb[yb==0]
+    # Elements with NaN function values are not solved
+    root_nan = np.isnan(ya) | np.isnan(yb)
+    # ITP parameters
+    eps = rtol
+    width = sb - sa
+    k1 = 0.2 / np.where(width > 0, width, 1.)
+    n_max = np.ceil(np.log2(np.maximum(width, 2*eps)/(2*eps))) + 1
+    active = np.flatnonzero((width > 2*eps) & ~root_nan)
+    iterations = maxiter
+    for j in range(maxiter):
+        if active.size == 0:
+            iterations = j
+            break
+        sa_act = sa[active]
+        sb_act = sb[active]
+        s_half = 0.5 * (sa_act+sb_act)
+        if method == 'bisect':
+            s = s_half
+        else:
+            ya_act = ya[active]
+            yb_act = yb[active]
+            half_width = 0.5 * (sb_act-sa_act)
+            r = eps*np.power(2., n_max[active]-j) - half_width
+            delta = k1[active] * (2*half_width)**2
+            # Interpolation (regula falsi)
+            s_f = (yb_act*sa_act - ya_act*sb_act) / (yb_act - ya_act)
+            sigma = np.sign(s_half - s_f)
+            # Truncation
+            s_t = np.where(delta <= np.abs(s_half - s_f), s_f + sigma*delta,
+                           s_half)
+            # Projection
+            s = np.where(np.abs(s_t - s_half) <= r, s_t, s_half - sigma*r)
+        y = sign[active] * func(np.exp(s), *[arg[active] for arg in args])
+        above = y > 0
+        below = y < 0
+        sb[active[above]] = s[above]
+        yb[active[above]] = y[above]
+        sa[active[below]] = s[below]
+        ya[active[below]] = y[below]
+        on_root = y == 0
+        sa[active[on_root]] = s[on_root]
+        sb[active[on_root]] = s[on_root]
+        root_nan[active[np.isnan(y)]] = True
+        active = active[(above | below) & (sb[active] - sa[active] > 2*eps)]
+    count_iterations(iterations, sa.size, active.size)
+    if active.size > 0:
+        raise RuntimeError('Failed to converge after %d iterations' % maxiter)
+    root = np.exp(0.5 * (sa+sb))
+    root[root_nan] = np.nan
+    return root.reshape(shape)[()]
+
+@instrumented
+def halley(func, x0, args=(), tol=1e-10, maxiter=50, max_step=10):
+    """
+    Find the roots of a function with Halley's method, for many starting
+    points at once.
+
+    Parameters
+    ----------
+    func: callable
+        Function of the form func(x, *args) returning the tuple (f, f', f'')
+        of the function whose roots are sought and its first two derivatives.
+        It must accept arrays.
+    x0: float or ndarray
+        Starting points.
+    args: tuple, optional
+        Extra arguments of func (floats or arrays, broadcast against x0).
+    tol: float, optional
+        Absolute tolerance on the last step (use ln(x) as the unknown for a
+        relative tolerance on x).
+    maxiter: int, optional
+        Maximum number of iterations.
+    max_step: float, optional
+        Maximum absolute step allowed in one iteration.
+
+    Returns
+    -------
+    Roots, with the broadcast shape of x0 and args (NaN where func returns
+    NaN).
+
+    Notes
+    -----
+    The Halley correction to the Newton step is limited, so that the method
+    reverts to Newton's method far from the roots. It is meant for functions
+    that are monotonic and convex or concave, for which convergence is
+    guaranteed from any reasonable starting point. The function is only
+    evaluated for the elements that have not converged yet.
+
+    """
+    shape, flat = _flatten(x0, *args)
+    x = flat[0].copy()
+    args = flat[1:]
+    active = np.flatnonzero(~np.isnan(x))
+    iterations = maxiter
+    for j in range(maxiter):
+        if active.size == 0:
+            iterations = j
+            break
+        f, df, d2f = func(x[active], *[arg[active] for arg in args])
+        step = -f/df
+        step = step / np.clip(1 - 0.5*step*d2f/df, 0.5, 2)
+        step = np.clip(step, -max_step, max_step)
+        x[active] += step
+        active = active[np.abs(step) > tol]
+    count_iterations(iterations, x.size, active.size)
+    if active.size > 0:
+        raise RuntimeError('Failed to converge after %d iterations' % maxiter)
+    return x.reshape(shape)[()]
+
+@instrumented
+def newton(func, x0, a, b, args=(), rtol=1e-10, maxiter=100, sign_a=None):
+    """
+    Find the roots of a function with a safeguarded Newton method, for many
+    starting points at once.
+
+    Parameters
+    ----------
+    func: callable
+        Function of the form func(x, *args) returning the tuple (f, f') of
+        the function whose roots are sought and its derivative. It must
+        accept arrays.
+    x0: float or ndarray
+        Starting points.
+    a, b: float or ndarray
+        Lower and upper bounds of brackets containing the roots (must be
+        positive).
+    args: tuple, optional
+        Extra arguments of func (floats or arrays, broadcast against x0).
+    rtol: float, optional
+        Relative tolerance on the roots.
+    maxiter: int, optional
+        Maximum number of iterations.
+    sign_a: float or ndarray, optional
+        Sign of func at the lower bounds, if known in advance (saves the
+        evaluation of func at the bounds, which must then be guaranteed to
+        contain the roots).
+
+    Returns
+    -------
+    Roots, with the broadcast shape of x0, a, b and args (NaN where func
+    returns NaN, or has the same sign, at the bounds).
+
+    Notes
+    -----
+    The brackets are narrowed at each iteration, and a Newton step falling
+    outside of its bracket is replaced by a bisection step (geometric mean of
+    the bounds), so that convergence is guaranteed. The function is only
+    evaluated for the elements that have not converged yet.
+
+    """
+    shape, flat = _flatten(x0, a, b, *args)
+    x, a, b = [arr.copy() for arr in flat[:3]]
+    args = flat[3:]
+    x = np.clip(x, a, b)
+    if sign_a is None:
+        fa = func(a, *args)[0]
+        fb = func(b, *args)[0]
+        sign_a = np.sign(fa)
+        # Elements whose brackets do not contain a root are not solved
+        x[np.isnan(fa) | np.isnan(fb) | (fa*fb > 0)] = np.nan
+    else:
+        sign_a = np.broadcast_to(sign_a, shape).ravel()
+    active = np.flatnonzero(~np.isnan(x))
+    iterations = maxiter
+    for j in range(maxiter):
+        if active.size == 0:
+            iterations = j
+            break
+        x_act = x[active]
+        f, df = func(x_act, *[arg[active] for arg in args])
+        # Narrow the brackets
+        same_side = np.sign(f) == sign_a[active]
+        a[active[same_side]] = x_act[same_side]
+        b[active[~same_side]] = x_act[~same_side]
+        a_act = a[active]
+        b_act = b[active]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_new = x_act - f/df
+        outside = ~((x_new > a_act) & (x_new < b_act))
+        x_new[outside] = np.sqrt(a_act[outside] * b_act[outside])
+        x_new[f==0] = x_act[f==0]
+        x[active] = x_new
+        active = active[(np.abs(x_new - x_act) > rtol*np.abs(x_new)) &
+                        (b_act - a_act > rtol*np.abs(x_new))]
+    count_iterations(iterations, x.size, active.size)
+    if active.size > 0:
+        raise RuntimeError('Failed to converge after %d iterations' % maxiter)
+    return x.reshape(shape)[()]
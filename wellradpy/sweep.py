@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import collections
+import concurrent.futures
+import inspect
+from multiprocessing import shared_memory
+import numpy as np # version 1.16.2
+from . import drawdown, leaky, recovery
+
+def _function(name):
+    """
+    Get a radius function from its name, e.g. 'rinfl_absdraw' or
+    'recovery.rinv' (functions of the drawdown module by default).
+    """
+    module, _, func = name.rpartition('.')
+    if module in ('', 'drawdown'):
+        module = drawdown
+    elif module == 'recovery':
+        module = recovery
+    elif module == 'leaky':
+        module = leaky
+    else:
+        raise ValueError('Unknown module: %s' % module)
+    try:
+        return getattr(module, func)
+    except AttributeError:
+        raise ValueError('Unknown criterion: %s' % name)
+
+def _evaluate_chunk(name, grid, fixed, start, stop):
+    """
+    Evaluate a radius function for the flat indices start to stop of the
+    grid.
+    """
+    shape = tuple(len(values) for values in grid.values())
+    indices = np.unravel_index(np.arange(start, stop), shape)
+    kwargs = dict(fixed)
+    for (param, values), index in zip(grid.items(), indices):
+        kwargs[param] = np.asarray(values, dtype=float)[index]
+    return np.broadcast_to(_function(name)(**kwargs), (stop - start,))
+
+def _run_chunk(shm_name, size, name, grid, fixed, start, stop):
+    """
+    Evaluate a chunk in a worker process and write it into the shared output.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((size,), dtype=float, buffer=shm.buf)
+        out[start:stop] = _evaluate_chunk(name, grid, fixed, start, stop)
+        del out
+    finally:
+        shm.close()
+    return stop - start
+
+def chunks(size, chunk_size):
+    """
+    Split a flat range of indices into chunks.
+
+    Parameters
+    ----------
+    size: int
+        Number of elements.
+    chunk_size: int
+        Number of elements per chunk (the last chunk may be smaller).
+
+    Returns
+    -------
+    List of (start, stop) tuples.
+
+    """
+    return [(start, min(start + chunk_size, size))
+            for start in range(0, size, chunk_size)]
+
+def sweep(criterion, grid, fixed=None, workers=None, chunk_size=10000,
+          progress=None):
+    """
+    Calculate a radius over a grid of parameters, in parallel.
+
+    Parameters
+    ----------
+    criterion: str
+        Name of a function of the drawdown module (e.g. 'rinv_reldrawave'),
+        or of the recovery or leaky module prefixed with its name (e.g.
+        'recovery.rinv' or 'leaky.rinfl_absdraw').
+    grid: dict
+        Values of the swept parameters or thresholds, by name, e.g.
+        {'T': T_values, 'S': S_values, 't': t_values, 'alpha': alpha_values}.
+        Use an OrderedDict (or Python 3.7+) to control the order of the axes.
+    fixed: dict, optional
+        Values of the other parameters and thresholds, by name.
+    workers: int, optional
+        Number of worker processes (number of processors by default). With 1
+        worker, the chunks are evaluated in the calling process.
+    chunk_size: int, optional
+        Number of grid points evaluated per task.
+    progress: callable, optional
+        Function called as progress(done, total) each time a chunk is
+        completed, with the numbers of grid points done and in total.
+
+    Returns
+    -------
+    Radius, as an array of shape (len(values) for values in grid.values()).
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    The grid is split into chunks of consecutive flat indices, which only
+    depend on the grid shape and chunk_size, so that the results do not
+    depend on the number of workers. The workers write their results
+    directly into an output array in shared memory, so that no result is
+    sent back through pickling.
+
+    """
+    grid = collections.OrderedDict(grid)
+    fixed = dict(fixed or {})
+    func = _function(criterion)
+    # Fail early on missing or unknown parameters
+    inspect.signature(func).bind(**dict(fixed, **grid))
+    shape = tuple(len(values) for values in grid.values())
+    size = int(np.prod(shape))
+    tasks = chunks(size, chunk_size)
+    if workers == 1 or len(tasks) <= 1:
+        res = np.empty(size)
+        done = 0
+        for start, stop in tasks:
+            res[start:stop] = _evaluate_chunk(criterion, grid, fixed, start,
+                                              stop)
+            done += stop - start
+            if progress is not None:
+                progress(done, size)
+        return res.reshape(shape)
+    shm = shared_memory.SharedMemory(create=True,
+                                     size=max(size, 1)*np.dtype(float).itemsize)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_run_chunk, shm.name, size, criterion,
+                                       grid, fixed, start, stop)
+                       for start, stop in tasks]
+            done = 0
+            for future in concurrent.futures.as_completed(futures):
+                done += future.result()
+                if progress is not None:
+                    progress(done, size)
+        res = np.ndarray((size,), dtype=float, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return res.reshape(shape)
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Created on 2026/10/16
+
+@author: Etienne Bresciani
+"""
+
+import collections
+import inspect
+import numpy as np # version 1.16.2
+from . import recovery
+from .criteria import CRITERIA, evaluate
+
+###############################################################################
+# Distributions of the parameters
+###############################################################################
+
+# Each distribution is a function of the form sample(rng, size) returning an
+# array of size random values, where rng is a numpy random generator
+
+def uniform(low, high):
+    """
+    Uniform distribution between low and high.
+    """
+    return lambda rng, size: rng.uniform(low, high, size)
+
+def loguniform(low, high):
+    """
+    Log-uniform distribution between low and high.
+    """
+    return lambda rng, size: np.exp(rng.uniform(np.log(low), np.log(high),
+                                                size))
+
+def normal(mean, std):
+    """
+    Normal distribution with given mean and standard deviation.
+    """
+    return lambda rng, size: mean + std*rng.standard_normal(size)
+
+def lognormal(median, sigma_log10):
+    """
+    Log-normal distribution with given median and standard deviation of the
+    decimal logarithm (as usually reported for T and S).
+    """
+    return lambda rng, size: median * \
+        np.power(10., sigma_log10*rng.standard_normal(size))
+
+###############################################################################
+# Streaming statistics
+###############################################################################
+
+class RunningStats(object):
+    """
+    Moments and quantiles of a stream of positive values, updated chunk by
+    chunk without storing the values.
+
+    Parameters
+    ----------
+    vmin, vmax: float, optional
+        Range of the logarithmic histogram used to estimate the quantiles.
+    bins_per_decade: int, optional
+        Resolution of the histogram.
+
+    Notes
+    -----
+    The mean and variance are updated with the pairwise formulas of Chan et
+    al. (1979), which are numerically stable, and two instances can be
+    merged (e.g. when chunks are processed in parallel). NaN values are
+    counted separately and excluded from the statistics. Zero values (e.g.
+    radius of investigation at the end of a recovery test) are counted apart
+    from the histogram. The quantiles are interpolated in the logarithmic
+    histogram, with a relative error below 10**(1/bins_per_decade) - 1
+    (0.2% by default).
+
+    """
+
+    def __init__(self, vmin=1e-10, vmax=1e10, bins_per_decade=1000):
+        self.edges = np.logspace(np.log10(vmin), np.log10(vmax),
+                                 int(round(np.log10(vmax/vmin) *
+                                           bins_per_decade)) + 1)
+        # Counts of the positive values below vmin, in each bin, and above
+        # vmax
+        self.counts = np.zeros(self.edges.size + 1, dtype=np.int64)
+        self.zeros = 0
+        self.nans = 0
+        self.count = 0
+        self.mean = 0.
+        self._m2 = 0.
+        self.min = np.inf
+        self.max = -np.inf
+        self.min_positive = np.inf
+
+    def update(self, values):
+        """
+        Add values to the statistics.
+
+        Parameters
+        ----------
+        values: ndarray
+            Values.
+
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        isnan = np.isnan(values)
+        self.nans += int(np.count_nonzero(isnan))
+        values = values[~isnan]
+        n = values.size
+        if n == 0:
+            return
+        mean = values.mean()
+        m2 = np.sum((values - mean)**2)
+        self._merge_moments(n, mean, m2)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        positive = values[values > 0]
+        self.zeros += n - positive.size
+        if positive.size > 0:
+            self.min_positive = min(self.min_positive, positive.min())
+            self.counts += np.bincount(np.searchsorted(self.edges, positive,
+                                                       side='right'),
+                                       minlength=self.counts.size)
+
+    def _merge_moments(self, n, mean, m2):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n/total
+        self._m2 += m2 + delta**2 * self.count*n/total
+        self.count = total
+
+    def merge(self, other):
+        """
+        Add the statistics of another instance (with the same histogram).
+
+        Parameters
+        ----------
+        other: RunningStats
+            Statistics to add.
+
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError('Cannot merge statistics with different '
+                             'histograms')
+        self.nans += other.nans
+        if other.count == 0:
+            return
+        self._merge_moments(other.count, other.mean, other._m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.min_positive = min(self.min_positive, other.min_positive)
+        self.zeros += other.zeros
+        self.counts += other.counts
+
+    @property
+    def var(self):
+        """
+        Sample variance.
+        """
+        if self.count < 2:
+            return np.nan
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self):
+        """
+        Sample standard deviation.
+        """
+        return np.sqrt(self.var)
+
+    def quantile(self, q):
+        """
+        Estimate quantiles.
+
+        Parameters
+        ----------
+        q: float or ndarray
+            Probabilities (between 0 and 1).
+
+        Returns
+        -------
+        Quantiles (NaN if no value was added).
+
+        """
+        q = np.asarray(q, dtype=float)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)[()]
+        # Rank among the positive values, which are interpolated in the
+        # logarithm of the values within each bin, the first and last bins
+        # being bounded by the extreme values
+        rank = q*self.count - self.zeros
+        cumcounts = np.cumsum(self.counts)
+        i = np.minimum(np.searchsorted(cumcounts, rank, side='left'),
+                       self.counts.size - 1)
+        below = np.where(i > 0, cumcounts[i-1], 0)
+        inside = np.maximum(self.counts[i], 1)
+        frac = np.clip((rank - below) / inside, 0, 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_min = np.log(self.min_positive)
+            log_max = np.log(self.max)
+            log_edges = np.clip(np.concatenate([[log_min], np.log(self.edges),
+                                                [log_max]]), log_min, log_max)
+            value = np.exp(log_edges[i] +
+                           frac*(log_edges[i+1] - log_edges[i]))
+        value = np.where(rank <= 0, self.min, value)
+        return value[()]
+
+###############################################################################
+# Monte Carlo propagation
+###############################################################################
+
+_PARAMS = ('t', 'T', 'S', 'Q', 'rw', 'tp', 'delta')
+
+def _recovery_function(name):
+    func = getattr(recovery, name.split('.', 1)[1])
+    return func, [param for param in inspect.signature(func).parameters
+                  if param in _PARAMS]
+
+def propagate(criteria, n, t=None, T=None, S=None, Q=None, rw=None, tp=None,
+              delta=None, thresholds=None, seed=None, chunk_size=100000,
+              stats=None):
+    """
+    Propagate the uncertainty of the parameters to radii of influence and
+    investigation by Monte Carlo sampling.
+
+    Parameters
+    ----------
+    criteria: list of str
+        Names of the criteria: functions of the drawdown module (e.g.
+        'rinfl_absdraw'), or of the recovery module prefixed with 'recovery.'
+        (e.g. 'recovery.rinv').
+    n: int
+        Number of samples.
+    t, T, S, Q, rw, tp, delta: float or callable, optional
+        Parameters of the criteria, either fixed values or distributions
+        (functions of the form sample(rng, size), see e.g. lognormal).
+    thresholds: dict, optional
+        Thresholds by criterion name, e.g. {'rinfl_absdraw': {'sc': 0.1}}
+        (default thresholds of the functions otherwise).
+    seed: int or numpy random generator, optional
+        Seed of the random number generator, or generator to draw from.
+    chunk_size: int, optional
+        Number of samples evaluated at once, which bounds the memory use.
+    stats: dict, optional
+        Keyword arguments of RunningStats (histogram range and resolution).
+
+    Returns
+    -------
+    Dictionary of RunningStats by criterion name, giving the count, mean,
+    std, min and max of the radii and their quantiles through
+    RunningStats.quantile.
+
+    Notes
+    -----
+    Units as you wish, but must be consistent for all the parameters.
+
+    Samples are drawn and evaluated chunk by chunk, so that the memory use
+    does not depend on n. The results are reproducible for a given seed and
+    chunk size. The drawdown criteria of a chunk are evaluated together with
+    criteria.evaluate, which shares the intermediate quantities between
+    them.
+
+    Examples
+    --------
+    >>> stats = propagate(['rinfl_absdraw', 'recovery.rinv'], 100000,
+    ...                   t=3600., T=lognormal(1e-3, 0.5),
+    ...                   S=lognormal(1e-4, 0.5), Q=0.01, tp=1800., seed=0)
+    >>> stats['rinfl_absdraw'].quantile([0.05, 0.5, 0.95])
+
+    """
+    if thresholds is None:
+        thresholds = {}
+    if stats is None:
+        stats = {}
+    if hasattr(seed, 'standard_normal'):
+        rng = seed
+    else:
+        rng = np.random.default_rng(seed)
+    params = collections.OrderedDict(zip(_PARAMS,
+                                         (t, T, S, Q, rw, tp, delta)))
+    drawdown_criteria = []
+    recovery_criteria = []
+    for name in criteria:
+        if name.startswith('recovery.'):
+            recovery_criteria.append((name, _recovery_function(name)))
+            needed = recovery_criteria[-1][1][1]
+        elif name in CRITERIA:
+            drawdown_criteria.append(name)
+            needed = ('t', 'T', 'S') + CRITERIA[name].params
+        else:
+            raise ValueError('Unknown criterion: %s' % name)
+        missing = [param for param in needed if params[param] is None]
+        if missing:
+            raise ValueError('Criterion %s requires the parameter(s) %s'
+                             % (name, ', '.join(missing)))
+    results = collections.OrderedDict((name, RunningStats(**stats))
+                                      for name in criteria)
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        samples = {}
+        for param, value in params.items():
+            if callable(value):
+                samples[param] = value(rng, size)
+            elif value is not None:
+                samples[param] = np.full(size, value, dtype=float)
+        if drawdown_criteria:
+            res = evaluate(samples['t'], samples['T'], samples['S'],
+                           samples.get('Q'), samples.get('rw'),
+                           samples.get('delta'), drawdown_criteria,
+                           thresholds)
+            for name in drawdown_criteria:
+                results[name].update(res[name])
+        for name, (func, needed) in recovery_criteria:
+            res = func(*[samples[param] for param in needed],
+                       **thresholds.get(name, {}))
+            results[name].update(res)
+    return results
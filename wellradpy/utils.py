@@ -5,10 +5,15 @@ Created on 2019/06/26
 @author: Etienne Bresciani
 """
 
+import functools
 import numpy as np # version 1.16.2
-import scipy.special as spe # version 1.2.1
-import scipy.optimize as opt # version 1.2.1
+from .solvers import halley
+from .cache import memoize
+from .diskcache import persistent
+from .profiling import instrumented
+from .precision import get_precision
 
+@instrumented
 def E1(u):
     """
     Exponential integral function.
@@ -24,34 +29,89 @@ def E1(u):
 
     Notes
     -----
-    This is simply a wrapper to improve code readability.
+    This is simply a wrapper to improve code readability. The dedicated
+    scipy.special.exp1 is used, which is faster than the generalized
+    expn(1, u) and agrees with it to within 2e-15 (down to the subnormal
+    range of E1, u > 700).
 
     """
-    return spe.expn(1, u)
+    import scipy.special as spe # version 1.2.1
+    return spe.exp1(u)
 
-def _func_root_E1(u, x):
-    return E1(u) - x
+def _E1inv_guess(x):
+    """
+    Starting guess for the inverse exponential integral function.
+
+    Parameters
+    ----------
+    x: ndarray
+        Positive real numbers.
+
+    Returns
+    -------
+    Approximate inverse exponential integral of x.
 
-def E1inv(x):
+    """
+    # E1inv_appr is good for intermediate x only; asymptotic expansions of E1
+    # for large and small u are used outside of that range
+    u0 = np.exp(-np.euler_gamma - x)
+    small_x = x < 1e-3
+    log_x = np.log(x[small_x])
+    u0[small_x] = -log_x - np.log(-log_x)
+    mid_x = (x >= 1e-3) & (x < 1)
+    u0[mid_x] = E1inv_appr(x[mid_x])
+    return u0
+
+def _func_root_E1(log_u, log_x):
+    u = np.exp(log_u)
+    E1_u = E1(u)
+    r = np.exp(-u) / E1_u
+    # Value and first two derivatives with respect to ln(u)
+    return np.log(E1_u) - log_x, -r, u*r - r**2
+
+@instrumented
+@memoize
+def E1inv(x, rtol=None, maxiter=50):
     """
     Inverse exponential integral function.
 
     Parameters
     ----------
-    x: float
-        Any positive real number.
+    x: float or ndarray
+        Any positive real number(s).
+    rtol: float, optional
+        Relative tolerance on the result (the one of the precision in effect
+        by default).
+    maxiter: int, optional
+        Maximum number of iterations.
 
     Returns
     -------
-    Inverse exponential integral of x.
+    Inverse exponential integral of x (NaN where x is not positive).
+
+    Notes
+    -----
+    All the elements of x are solved together using Halley's method on
+    ln(E1(u)) = ln(x) with ln(u) as the unknown, a formulation that is smooth
+    and concave over the whole range of u. The iterations start from
+    E1inv_appr, or from asymptotic expansions of E1 outside of its range of
+    validity. For x > 40, the small-u expansion E1(u) = -gamma - ln(u) + u
+    gives u = exp(-gamma - x) to machine precision, and no iteration is
+    needed.
 
     """
-    # Note: Another method (e.g. Newton) could be more efficient, but bisection
-    # is simple and robust, and we expect that efficiency will not be an issue
-    # in practice
-    sol = opt.root_scalar(_func_root_E1, args=(x), method='bisect',
-                          bracket=(1e-12, 1e2), rtol=1e-5)
-    return sol.root
+    if rtol is None:
+        rtol = get_precision().rtol
+    x = np.asarray(x, dtype=float)
+    res = np.full(x.shape, np.nan)
+    large = x > 40
+    res[large] = np.exp(-np.euler_gamma - x[large])
+    valid = (x > 0) & ~large
+    x_valid = x[valid]
+    log_u = halley(_func_root_E1, np.log(_E1inv_guess(x_valid)),
+                   args=(np.log(x_valid),), tol=rtol, maxiter=maxiter)
+    res[valid] = np.exp(log_u)
+    return res[()]
 
 def E1inv_appr(x):
     """
@@ -69,13 +129,197 @@ def E1inv_appr(x):
     """
     return 3.656*np.power(x, -0.1295) - 3.445
 
+@instrumented
 def whittaker(z):
     """
     Whittaker function for kapa=1/2 and mu=1/2.
 
     Parameters
     ----------
-    z: float
-        Any positive real number.
+    z: float or ndarray
+        Any positive real number(s).
+
+    Notes
+    -----
+    The closed form W(z) = y*(K0(y)+K1(y))/sqrt(pi), with y = z/2 and K0, K1
+    the modified Bessel functions of the second kind, is evaluated with
+    exponentially scaled Bessel functions (which are themselves computed from
+    Chebyshev expansions for small and large arguments). It agrees with the
+    definition W(z) = exp(-z/2)*z*U(1/2, 2, z), U being the confluent
+    hypergeometric function, to within 5e-10 for 1e-14 < z < 500.
+
+    """
+    import scipy.special as spe # version 1.2.1
+    y = 0.5 * np.asarray(z, dtype=float)
+    return y * np.exp(-y) * (spe.k0e(y) + spe.k1e(y)) / np.sqrt(np.pi)
+
+# The leaky well function W(u, beta) is written W(u, z) = exp(-u-z)*H(u, z)
+# with z = beta**2/(4*u). Where u >= z > _HANTUSH_TABLE_MIN (where its series
+# suffers from cancellation), H is tabulated on a grid of ln(z) and ln(1+p),
+# with p = (u-z)/sqrt(u), over which ln(sqrt(u)*H) is smooth and bounded.
+# Beyond u+z = _HANTUSH_TABLE_MAX, W underflows.
+_HANTUSH_TABLE_MIN = 1.
+_HANTUSH_TABLE_MAX = 745.
+_HANTUSH_TABLE_POINTS_PER_UNIT = 48
+
+def _hantush_H(u, z):
+    """
+    H(u, z) = int_0^inf(exp(-x*(u-z/(1+x)))/(1+x)dx) for u >= z, with a
+    129-point exp-sinh quadrature (accurate to about machine precision).
+    """
+    h = 1/16.
+    t = np.arange(-4.5, 3.5 + h/2, h)
+    x = np.exp(np.pi/2 * np.sinh(t))
+    weights = h * np.pi/2 * np.cosh(t) * x / (1+x)
+    shape = np.shape(u)
+    u = np.ravel(u)
+    z = np.ravel(z)
+    H = np.empty(u.size)
+    # Blocks of points, to limit the size of the temporary arrays
+    for start in range(0, u.size, 4096):
+        stop = start + 4096
+        H[start:stop] = np.dot(np.exp(-x*u[start:stop,None] +
+                                      z[start:stop,None]*(x/(1+x))), weights)
+    return H.reshape(shape)
+
+def _hantush_grid(density):
+    """
+    Grids of ln(z) and ln(1+p) covering the range of the table, with
+    _HANTUSH_TABLE_POINTS_PER_UNIT points per unit times the relative
+    density.
+    """
+    grids = []
+    for start, stop in ((np.log(_HANTUSH_TABLE_MIN),
+                         np.log(_HANTUSH_TABLE_MAX)),
+                        (0., np.log1p(np.sqrt(_HANTUSH_TABLE_MAX)))):
+        n = int(round((stop - start) * _HANTUSH_TABLE_POINTS_PER_UNIT *
+                      density))
+        grids.append(np.linspace(start, stop, n+1))
+    return grids
+
+def _hantush_u(log_z, log_p):
+    # u such that (u-z)/sqrt(u) = p
+    p = np.expm1(log_p)
+    return (0.5 * (p + np.sqrt(p**2 + 4*np.exp(log_z))))**2
+
+def _hantush_log_F(log_z, log_p):
+    u = _hantush_u(log_z, log_p)
+    return np.log(np.sqrt(u) * _hantush_H(u, np.exp(log_z)))
+
+@instrumented
+@persistent('_HANTUSH_TABLE_MIN', '_HANTUSH_TABLE_MAX',
+            '_HANTUSH_TABLE_POINTS_PER_UNIT')
+def _hantush_table(density=1.):
+    """
+    Tabulate ln(sqrt(u)*H(u, z)) on the grids of ln(z) and ln(1+p).
+    """
+    log_z, log_p = _hantush_grid(density)
+    return _hantush_log_F(*np.meshgrid(log_z, log_p, indexing='ij'))
+
+@functools.lru_cache(maxsize=None)
+def _hantush_interpolant(density=1.):
+    """
+    Bicubic spline interpolant of ln(sqrt(u)*H(u, z)) as a function of ln(z)
+    and ln(1+p).
+    """
+    from scipy.interpolate import RectBivariateSpline # version 1.2.1
+    return RectBivariateSpline(*_hantush_grid(density),
+                               _hantush_table(density), kx=3, ky=3, s=0)
+
+@functools.lru_cache(maxsize=None)
+@persistent('_HANTUSH_TABLE_MIN', '_HANTUSH_TABLE_MAX',
+            '_HANTUSH_TABLE_POINTS_PER_UNIT')
+def _hantush_error_table(density):
+    # Quarter points and midpoints of the cells of the grid
+    grids = []
+    for grid in _hantush_grid(density):
+        grids.append((grid[:-1,None] + np.diff(grid)[:,None] *
+                      [0.25, 0.5, 0.75]).ravel())
+    log_z, log_p = np.meshgrid(*grids, indexing='ij')
+    log_F = _hantush_interpolant(density).ev(log_z, log_p)
+    return np.max(np.abs(np.exp(log_F - _hantush_log_F(log_z, log_p)) - 1))
+
+def _hantush_error():
+    """
+    Measure the interpolation error of the table of the leaky well function
+    inside the cells of its grid, for the precision in effect.
+
+    Returns
+    -------
+    Maximum relative error of W(u, beta) where it is interpolated.
+
+    """
+    return _hantush_error_table(get_precision().table_density)
+
+def _hantush_series(u, z):
+    """
+    Convergent series W = sum((-z)**n/n!*E_{n+1}(u)), for z <= 1 (where the
+    cancellation between its terms costs less than one digit).
+    """
+    import scipy.special as spe # version 1.2.1
+    W = E1(u)
+    coef = np.ones(u.shape)
+    active = np.arange(u.size)
+    n = 0
+    while active.size > 0:
+        n += 1
+        coef[active] *= -z[active]/n
+        # The terms are smaller than coef*E1(u), and W >= exp(-z)*E1(u)
+        active = active[np.abs(coef[active]) > 1e-17]
+        W[active] += coef[active] * spe.expn(n+1, u[active])
+    return W
+
+@instrumented
+def hantush(u, beta):
+    """
+    Leaky well function of Hantush and Jacob.
+
+    Parameters
+    ----------
+    u: float or ndarray
+        Any nonnegative real number(s), u = r**2*S/(4*T*t).
+    beta: float or ndarray
+        Any nonnegative real number(s), beta = r/B with B the leakage factor.
+
+    Returns
+    -------
+    W(u, beta) = int_u^inf(exp(-y-beta**2/(4*y))/y*dy).
+
+    Notes
+    -----
+    With z = beta**2/(4*u), the symmetry W(u, beta) = 2*K0(beta) - W(z, beta)
+    reduces the evaluation to u >= z, with K0 the modified Bessel function of
+    the second kind (there is no cancellation, since W(u, beta) >= K0(beta)
+    for u <= z). Then, for z <= 1, the convergent series
+    sum((-z)**n/n!*E_{n+1}(u)) is summed, E_{n+1} being the generalized
+    exponential integrals, to about machine precision. For z > 1, where
+    u+z > 2 and the series suffers from cancellation, W is interpolated in a
+    2D table precomputed by quadrature (see _hantush_error for its accuracy,
+    about 1e-9 with the default precision), and it underflows for
+    u+z > 745. W(0, beta) = 2*K0(beta) is the steady state, and
+    W(u, 0) = E1(u) the Theis well function.
+
     """
-    return np.exp(-0.5*z) * z * spe.hyperu(0.5, 2, z)
+    import scipy.special as spe # version 1.2.1
+    u, beta = np.broadcast_arrays(np.asarray(u, dtype=float),
+                                  np.asarray(beta, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(beta == 0, 0., beta**2/(4*u))
+    swap = u < z
+    a = np.where(swap, z, u).ravel()
+    b = np.where(swap, u, z).ravel()
+    W = np.zeros(a.shape)
+    series = b <= _HANTUSH_TABLE_MIN
+    W[series] = _hantush_series(a[series], b[series])
+    table = np.flatnonzero(~series & (a + b < _HANTUSH_TABLE_MAX))
+    if table.size > 0:
+        a_table = a[table]
+        b_table = b[table]
+        log_F = _hantush_interpolant(get_precision().table_density).ev(
+            np.log(b_table), np.log1p((a_table - b_table)/np.sqrt(a_table)))
+        W[table] = np.exp(log_F - a_table - b_table - 0.5*np.log(a_table))
+    W = W.reshape(u.shape)
+    with np.errstate(invalid='ignore'):
+        W = np.where(swap, 2*spe.k0(beta) - W, W)
+    W[np.isnan(u) | np.isnan(beta)] = np.nan
+    return W[()]